@@ -0,0 +1,116 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Shared helpers for the benchmark scripts."""
+
+import dataclasses
+import enum
+import statistics
+import sys
+import time
+from typing import Callable
+
+
+def measure(func: Callable[[], object], *, repeat: int = 5, number: int = 1) -> list[float]:
+    """Call `func` `number` times per round and return the seconds per call of each round."""
+
+    assert callable(func), type(func)
+    assert isinstance(repeat, int) and repeat > 0, repeat
+    assert isinstance(number, int) and number > 0, number
+
+    result: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        result.append((time.perf_counter() - start) / number)
+
+    return result
+
+
+def print_results(rows: list[tuple[str, list[float]]]) -> None:
+    """Print the best and the median time of each benchmark row."""
+
+    assert isinstance(rows, list), type(rows)
+
+    width = max(len(name) for name, _ in rows)
+    print(f"{'benchmark':<{width}}  {'best':>12}  {'median':>12}")
+    for name, timings in rows:
+        best = min(timings)
+        median = statistics.median(timings)
+        print(f"{name:<{width}}  {_format(best):>12}  {_format(median):>12}")
+
+
+def get_deep_size(value: object) -> int:
+    """
+    Return the size in bytes of `value` and of all objects it refers to.
+
+    Lists, tuples, dicts and dataclasses (with or without `__slots__`) are
+    followed. Each object is counted once, so shared objects (for example
+    interned strings) are counted only once. Enum members are not counted.
+    """
+
+    seen: set[int] = set()
+    result = 0
+
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, enum.Enum):
+            continue
+        seen.add(id(item))
+        result += sys.getsizeof(item)
+
+        if isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif dataclasses.is_dataclass(item) and not isinstance(item, type):
+            if hasattr(item, "__dict__"):
+                pending.append(vars(item))
+            else:
+                pending.extend(getattr(item, field.name) for field in dataclasses.fields(item))
+
+    return result
+
+
+def _format_size(size: int) -> str:
+    if size >= 2**20:
+        return f"{size / 2**20:.3f} MiB"
+    if size >= 2**10:
+        return f"{size / 2**10:.3f} KiB"
+    return f"{size} B"
+
+
+def print_sizes(rows: list[tuple[str, int]]) -> None:
+    """Print the size of each row."""
+
+    assert isinstance(rows, list), type(rows)
+
+    width = max(len(name) for name, _ in rows)
+    print(f"{'benchmark':<{width}}  {'size':>12}")
+    for name, size in rows:
+        print(f"{name:<{width}}  {_format_size(size):>12}")
+
+
+def _format(seconds: float) -> str:
+    if seconds >= 1.0:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.3f} us"
@@ -0,0 +1,63 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Memory and attribute access time of `Word` and `CompactWord` items.
+
+Usage:
+    python -m benchmarks.bench_compact_word
+"""
+
+from src.biz.dfch.asdste100vocab.compact_word import CompactWord
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word import Word
+
+from .bench import get_deep_size, measure, print_results, print_sizes
+
+
+def access(words: list) -> int:
+    """Read some fields of each word."""
+
+    result = 0
+    for word in words:
+        result += len(word.name) + len(word.meanings) + len(word.alternatives)
+        if word.note is not None:
+            result += 1
+
+    return result
+
+
+if __name__ == "__main__":
+    words: list[Word] = list(Vocab(use_ste100_technical_word=True, use_cache=False))
+    compact_words = [CompactWord.from_word(word) for word in words]
+
+    print(f"items: {len(words)}")
+    print_sizes(
+        [
+            ("Word[one]", get_deep_size(Word(name="abandon"))),
+            ("CompactWord[one]", get_deep_size(CompactWord(name="abandon"))),
+            ("Word[all]", get_deep_size(words)),
+            ("CompactWord[all]", get_deep_size(compact_words)),
+        ]
+    )
+    print()
+    print_results(
+        [
+            ("Word[access]", measure(lambda: access(words), number=20)),
+            ("CompactWord[access]", measure(lambda: access(compact_words), number=20)),
+        ]
+    )
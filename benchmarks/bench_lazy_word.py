@@ -0,0 +1,58 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Load time and memory of eager and lazy vocabularies.
+
+Usage:
+    python -m benchmarks.bench_lazy_word
+"""
+
+import tracemalloc
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+CASES: dict[str, dict[str, bool]] = {
+    "eager": {"use_snapshot": False},
+    "lazy": {"lazy": True},
+}
+
+
+def allocated(options: dict[str, bool]) -> int:
+    """Return the bytes allocated by a loaded vocabulary."""
+
+    tracemalloc.start()
+    vocab = Vocab(use_ste100=True, use_ste100_technical_word=True, **options)
+    result, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del vocab
+
+    return result
+
+
+if __name__ == "__main__":
+    print_results(
+        [
+            (name, measure(lambda options=options: Vocab(use_ste100=True, use_ste100_technical_word=True, **options)))
+            for name, options in CASES.items()
+        ]
+    )
+    print()
+    for name, options in CASES.items():
+        print(f"{name:<8}  {allocated(options) / 2**20:8.2f} MiB")
@@ -0,0 +1,65 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Random access to a large JSONL file with `MappedVocabFile`.
+
+The JSONL file is the built-in base vocabulary, repeated COPIES times
+(default 50, about 60 MB).
+
+Usage:
+    python -m benchmarks.bench_mapped_vocab_file [COPIES]
+"""
+
+from pathlib import Path
+import random
+import sys
+import tempfile
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.mapped_vocab_file import MappedVocabFile
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+
+def run(fullname: Path) -> None:
+    """Run the benchmarks for `fullname`."""
+
+    with MappedVocabFile(fullname) as vocab_file:
+        index = vocab_file.save_index()
+        positions = [random.randrange(len(vocab_file)) for _ in range(1000)]
+
+    with MappedVocabFile(fullname, index=index) as vocab_file:
+        rows = [
+            ("read_jsonl_file", measure(lambda: Vocab.read_jsonl_file(fullname, lambda _: True), repeat=1)),
+            ("open (build offsets)", measure(lambda: MappedVocabFile(fullname).close(), repeat=3)),
+            ("open (persisted index)", measure(lambda: MappedVocabFile(fullname, index=index).close(), repeat=3)),
+            ("get by position", measure(lambda: [vocab_file[p] for p in positions], repeat=3)),
+            ("find by name", measure(lambda: vocab_file.find("abandon"), repeat=3, number=100)),
+        ]
+    rows[3] = (rows[3][0], [t / len(positions) for t in rows[3][1]])
+    print_results(rows)
+
+
+if __name__ == "__main__":
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    data = BuiltInVocab.STE100_BASE.value.read_bytes()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "large.jsonl"
+        path.write_bytes(data * copies)
+        run(path)
@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+
+"""
+Look up the approved alternatives of all rejected names of the built-in
+vocabularies with `Vocab.find` and `Word.alternatives`, and with the
+reverse lookup index (`Vocab.alternatives`).
+
+Usage:
+    python -m benchmarks.bench_vocab_alternatives
+"""
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_alternative_index import VocabAlternativeIndex
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+from .bench import measure, print_results
+
+
+def find_alternatives(vocab: Vocab, value: str) -> list[Word]:
+    result: dict[str, Word] = {}
+    for word in vocab.find(value):
+        if word.status == WordStatus.REJECTED:
+            for alternative in word.alternatives:
+                result.setdefault(alternative.name.lower(), alternative)
+
+    return list(result.values())
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    names = list(dict.fromkeys(word.name for word in vocab.where(status=WordStatus.REJECTED)))
+    vocab.find(names[0])
+    vocab.alternatives(names[0])
+
+    print(f"rejected names: {len(names)}, items: {len(vocab)}")
+    print_results(
+        [
+            ("find+alternatives", measure(lambda: [find_alternatives(vocab, name) for name in names], number=10)),
+            ("alternatives", measure(lambda: [vocab.alternatives(name) for name in names], number=10)),
+            ("VocabAlternativeIndex", measure(lambda: VocabAlternativeIndex(vocab))),
+        ]
+    )
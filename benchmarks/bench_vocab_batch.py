@@ -0,0 +1,62 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Look up the tokens of a document in the built-in vocabularies, one call per
+token and with the batch APIs (`find_many`, `match_many`, `similar_many`).
+
+The document has 2000 tokens from 400 distinct words; each token has one
+character replaced, so most tokens are not in the vocabulary.
+
+Usage:
+    python -m benchmarks.bench_vocab_batch
+"""
+
+import random
+import re
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+
+def make_tokens(vocab: Vocab, count: int, distinct: int, seed: int = 42) -> list[str]:
+    """Return `count` tokens from `distinct` misspelled names of `vocab`."""
+
+    rnd = random.Random(seed)
+    names = [word.name for word in rnd.sample(list(vocab), distinct)]
+    words = [name[:-1] + "x" for name in names]
+
+    return [rnd.choice(words) for _ in range(count)]
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    tokens = make_tokens(vocab, 2000, 400)
+    patterns = [re.escape(token) for token in tokens]
+
+    print(f"tokens: {len(tokens)}, distinct: {len(set(tokens))}, items: {len(vocab)}")
+    print_results(
+        [
+            ("find", measure(lambda: [vocab.find(value) for value in tokens])),
+            ("find_many", measure(lambda: vocab.find_many(tokens))),
+            ("match", measure(lambda: [vocab.match(value) for value in patterns], repeat=3)),
+            ("match_many", measure(lambda: vocab.match_many(patterns), repeat=3)),
+            ("similar", measure(lambda: [vocab.similar(value) for value in tokens], repeat=1)),
+            ("similar_many", measure(lambda: vocab.similar_many(tokens), repeat=1)),
+        ]
+    )
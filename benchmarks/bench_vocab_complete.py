@@ -0,0 +1,50 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Complete name prefixes in the built-in vocabularies.
+
+Usage:
+    python -m benchmarks.bench_vocab_complete
+"""
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_trie import VocabTrie
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    prefixes = sorted({word.name[:length] for word in vocab for length in (1, 2, 3)})
+
+    def prefix_and_sort() -> None:
+        for value in prefixes:
+            _ = sorted(vocab.prefix(value), key=VocabTrie.default_rank)[:10]
+
+    def complete() -> None:
+        for value in prefixes:
+            vocab.complete(value, 10)
+
+    print(f"prefixes: {len(prefixes)}, items: {len(vocab)}")
+    print_results(
+        [
+            ("build", measure(lambda: VocabTrie(vocab))),
+            ("prefix+sort", measure(prefix_and_sort)),
+            ("complete", measure(complete)),
+        ]
+    )
@@ -0,0 +1,69 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Edit distance queries in the built-in vocabularies, with the BK-tree and
+with a scan.
+
+The queries are names with one typo.
+
+Usage:
+    python -m benchmarks.bench_vocab_distance
+"""
+
+import random
+
+from src.biz.dfch.asdste100vocab.edit_distance import EditDistance
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_bk_tree import VocabBkTree
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    rnd = random.Random(42)
+    queries = []
+    for word in rnd.sample(list(vocab), 100):
+        idx = rnd.randrange(len(word.name))
+        queries.append(word.name[:idx] + rnd.choice("abcdefghijklmnopqrstuvwxyz") + word.name[idx + 1 :])
+
+    def scan(k: int, metric: EditDistance) -> None:
+        for value in queries:
+            distance = metric.get_matcher(value.lower())
+            _ = [word for word in vocab if distance(word.name.lower()) <= k]
+
+    def within_distance(k: int, metric: EditDistance) -> None:
+        for value in queries:
+            vocab.within_distance(value, k, metric=metric)
+
+    def nearest() -> None:
+        for value in queries:
+            vocab.nearest(value, 5)
+
+    print(f"queries: {len(queries)}, items: {len(vocab)}")
+    print_results(
+        [
+            ("build", measure(lambda: VocabBkTree(vocab))),
+            ("scan[k=1]", measure(lambda: scan(1, EditDistance.LEVENSHTEIN), repeat=1)),
+            ("within_distance[k=1]", measure(lambda: within_distance(1, EditDistance.LEVENSHTEIN))),
+            ("within_distance[k=2]", measure(lambda: within_distance(2, EditDistance.LEVENSHTEIN))),
+            ("scan[k=1, damerau]", measure(lambda: scan(1, EditDistance.DAMERAU), repeat=1)),
+            ("within_distance[k=1, damerau]", measure(lambda: within_distance(1, EditDistance.DAMERAU))),
+            ("nearest[n=5]", measure(nearest)),
+        ]
+    )
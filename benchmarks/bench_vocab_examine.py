@@ -0,0 +1,63 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Examine phrases in the built-in vocabularies with the fused single-pass
+implementation and with separate searches (`similar`, `match`, merge and
+sort).
+
+Usage:
+    python -m benchmarks.bench_vocab_examine
+"""
+
+import random
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word import Word
+
+from .bench import measure, print_results
+
+
+def examine_separately(vocab: Vocab, value: str) -> list[Word]:
+    """Return the result of `Vocab.examine` from separate searches."""
+
+    fuzzy = vocab.similar(value)
+    partial = vocab.match(value)
+
+    seen: set[int] = set()
+    merged: list[Word] = []
+    for word in fuzzy + partial:
+        if id(word) not in seen:
+            seen.add(id(word))
+            merged.append(word)
+
+    merged.sort(key=lambda word: word.name.lower())
+    return merged
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    rnd = random.Random(42)
+    phrases = [word.name[: rnd.randrange(2, 8)] for word in rnd.sample(list(vocab), 20)]
+
+    print(f"phrases: {len(phrases)}, items: {len(vocab)}")
+    print_results(
+        [
+            ("separate", measure(lambda: [examine_separately(vocab, value) for value in phrases])),
+            ("fused", measure(lambda: [vocab.examine(value) for value in phrases])),
+        ]
+    )
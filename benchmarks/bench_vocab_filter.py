@@ -0,0 +1,44 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Read the built-in technical words with a predicate and with a load filter.
+
+Usage:
+    python -m benchmarks.bench_vocab_filter
+"""
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_filter import VocabFilter
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    fullname = BuiltInVocab.STE100_TECHNICAL_WORDS.value
+    load_filter = VocabFilter(category=WordCategory.ICT_TERMS)
+
+    print(f"matches: {len(Vocab.read_jsonl_file(fullname, load_filter=load_filter))}")
+    print_results(
+        [
+            ("read_jsonl_file[all]", measure(lambda: Vocab.read_jsonl_file(fullname))),
+            ("read_jsonl_file[predicate]", measure(lambda: Vocab.read_jsonl_file(fullname, load_filter.matches))),
+            ("read_jsonl_file[load_filter]", measure(lambda: Vocab.read_jsonl_file(fullname, load_filter=load_filter))),
+        ]
+    )
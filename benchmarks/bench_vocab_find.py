@@ -0,0 +1,49 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Look up words by name in the built-in vocabularies.
+
+Usage:
+    python -m benchmarks.bench_vocab_find
+"""
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    names = [word.name.upper() for word in vocab][::10]
+
+    def scan() -> None:
+        for name in names:
+            value = name.lower()
+            _ = [item for item in vocab if value == item.name.lower()]
+
+    def find() -> None:
+        for name in names:
+            vocab.find(name)
+
+    print(f"lookups: {len(names)}, items: {len(vocab)}")
+    print_results(
+        [
+            ("scan", measure(scan, repeat=3)),
+            ("find", measure(find)),
+        ]
+    )
@@ -0,0 +1,68 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Cold-load time of the built-in vocabularies.
+
+Each round starts a new Python process, so that every load is a cold load
+(no module state, no warm caches).
+
+Usage:
+    python -m benchmarks.bench_vocab_load
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from .bench import print_results
+
+PROJECT_ROOT = Path(__file__).parents[1]
+
+SCRIPT = """
+import time
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+start = time.perf_counter()
+Vocab(use_ste100=True, use_ste100_technical_word=True, {options})
+print(time.perf_counter() - start)
+"""
+
+CASES: list[tuple[str, str]] = [
+    ("jsonl", "use_snapshot=False"),
+    ("snapshot", "use_snapshot=True"),
+]
+
+
+def cold_load(options: str, *, repeat: int = 5) -> list[float]:
+    """Return the load time of `repeat` new processes."""
+
+    result: list[float] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(options=options)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        result.append(float(output.stdout.strip().splitlines()[-1]))
+
+    return result
+
+
+if __name__ == "__main__":
+    print_results([(name, cold_load(options)) for name, options in CASES])
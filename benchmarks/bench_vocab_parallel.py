@@ -0,0 +1,54 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Sequential and parallel load of FILES vocabulary files (default 12).
+
+Each file is a copy of the built-in base vocabulary.
+
+Usage:
+    python -m benchmarks.bench_vocab_parallel [FILES]
+"""
+
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    workers = os.cpu_count() or 1
+    data = BuiltInVocab.STE100_BASE.value.read_bytes()
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(tmp) / f"department{idx}.jsonl" for idx in range(count)]
+        for file in files:
+            file.write_bytes(data)
+
+        print_results(
+            [
+                ("workers=1", measure(lambda: Vocab(files=files, use_ste100=False), repeat=3)),
+                (
+                    f"workers={workers}",
+                    measure(lambda: Vocab(files=files, use_ste100=False, workers=workers), repeat=3),
+                ),
+            ]
+        )
@@ -0,0 +1,77 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Run selections on the built-in vocabularies with chained predicates
+(`Vocab.filter`) and with planned queries (`Vocab.query`).
+
+Usage:
+    python -m benchmarks.bench_vocab_query
+"""
+
+import re
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    regex = re.compile("^hyd", re.IGNORECASE)
+    categories = {WordCategory.TOOLS_EQUIPMENT, WordCategory.SYSTEMS_COMPONENTS}
+    texts = {
+        "tn-hyd": "status:approved type:TN category:TN3,TN6 match:^hyd",
+        "ict": "status:approved category:ICT_TERMS",
+    }
+    for text in texts.values():
+        vocab.query(text)
+        print(vocab.explain(text).access)
+
+    print(f"items: {len(vocab)}")
+    print_results(
+        [
+            (
+                "filter[tn-hyd]",
+                measure(
+                    lambda: vocab.filter(
+                        lambda word: (
+                            word.status == WordStatus.APPROVED
+                            and word.type_ == WordType.TECHNICAL_NOUN
+                            and word.category in categories
+                            and regex.search(word.name) is not None
+                        )
+                    ),
+                    number=100,
+                ),
+            ),
+            ("query[tn-hyd]", measure(lambda: vocab.query(texts["tn-hyd"]), number=100)),
+            (
+                "filter[ict]",
+                measure(
+                    lambda: vocab.filter(
+                        lambda word: word.status == WordStatus.APPROVED and word.category == WordCategory.ICT_TERMS
+                    ),
+                    number=100,
+                ),
+            ),
+            ("query[ict]", measure(lambda: vocab.query(texts["ict"]), number=100)),
+        ]
+    )
@@ -0,0 +1,57 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Repeat the same `find`, `match`, `similar` and `examine` queries with and
+without the query cache (see `Vocab(query_cache_size=...)`).
+
+Usage:
+    python -m benchmarks.bench_vocab_query_cache
+"""
+
+import random
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+
+def run(vocab: Vocab, phrases: list[str]) -> None:
+    """Run each kind of query once for each phrase."""
+
+    for value in phrases:
+        vocab.find(value)
+        vocab.match(value)
+        vocab.similar(value)
+        vocab.examine(value)
+
+
+if __name__ == "__main__":
+    uncached = Vocab(use_ste100_technical_word=True)
+    cached = Vocab(use_ste100_technical_word=True, query_cache_size=256)
+    rnd = random.Random(42)
+    phrases = [word.name[: rnd.randrange(2, 8)] for word in rnd.sample(list(uncached), 20)]
+    run(cached, phrases)
+
+    print(f"phrases: {len(phrases)}, items: {len(uncached)}")
+    print_results(
+        [
+            ("uncached", measure(lambda: run(uncached, phrases))),
+            ("cached", measure(lambda: run(cached, phrases))),
+        ]
+    )
+    print(cached.query_cache_info())
@@ -0,0 +1,62 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+
+"""
+Find the words of the built-in vocabulary by the text of their meanings,
+examples and notes with a scan (`Vocab.filter`) and with the full-text
+index (`Vocab.search_text`), and build the full-text index or load it from
+a persisted index.
+
+Usage:
+    python -m benchmarks.bench_vocab_search_text
+"""
+
+from pathlib import Path
+import tempfile
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_text_index import VocabTextIndex
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    vocab = Vocab()
+    text = "to make something tight"
+    tokens = set(VocabTextIndex.tokenize("tighten tight"))
+    vocab.search_text(text)
+
+    def scan():
+        return vocab.filter(
+            lambda word: not tokens.isdisjoint(VocabTextIndex.tokenize(" ".join(VocabTextIndex.get_texts(word))))
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = vocab.build_text_index().save_index(Path(tmp) / "text.index")
+        words = list(vocab)
+
+        print(f"items: {len(vocab)}, terms: {vocab.build_text_index().term_count}, matches: {len(scan())}")
+        print_results(
+            [
+                ("filter[tokens]", measure(scan, number=10)),
+                ("search_text", measure(lambda: vocab.search_text(text), number=100)),
+                ("search_text[tokens]", measure(lambda: vocab.search_text("tighten tight"), number=100)),
+                ("VocabTextIndex[build]", measure(lambda: VocabTextIndex(words))),
+                ("VocabTextIndex[load]", measure(lambda: VocabTextIndex(words, index=index))),
+            ]
+        )
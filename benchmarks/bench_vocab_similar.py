@@ -0,0 +1,80 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Search similar words in a large synthetic vocabulary, with and without
+the trigram index.
+
+The synthetic vocabulary has `SIZE` names made of two random names of
+the built-in vocabularies. The queries are names with one typo.
+
+Usage:
+    python -m benchmarks.bench_vocab_similar [SIZE]
+"""
+
+import random
+import sys
+import time
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word import Word
+
+from .bench import measure, print_results
+
+
+def make_vocab(size: int, rnd: random.Random) -> Vocab:
+    """Return a vocabulary with `size` synthetic names."""
+
+    names = [word.name.lower() for word in Vocab(use_ste100_technical_word=True)]
+    result = Vocab(use_ste100=False)
+    result.extend([Word(name=f"{rnd.choice(names)} {rnd.choice(names)}") for _ in range(size)])
+
+    return result
+
+
+def make_typo(value: str, rnd: random.Random) -> str:
+    """Replace one character of `value`."""
+
+    idx = rnd.randrange(len(value))
+    return value[:idx] + rnd.choice("abcdefghijklmnopqrstuvwxyz") + value[idx + 1 :]
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rnd = random.Random(42)
+    vocab = make_vocab(size, rnd)
+    queries = [make_typo(vocab[rnd.randrange(len(vocab))].name, rnd) for _ in range(10)]
+
+    start = time.perf_counter()
+    vocab.similar(queries[0], use_index=True)
+    print(f"items: {len(vocab)}, index build: {time.perf_counter() - start:.3f} s")
+
+    same = sum(
+        {word.name for word in vocab.similar(value, use_index=True)}
+        == {word.name for word in vocab.similar(value, use_index=False)}
+        for value in queries[:3]
+    )
+    print(f"same names as without index: {same} of 3")
+
+    print_results(
+        [
+            ("similar[scan]", measure(lambda: vocab.similar(queries[0], use_index=False), repeat=1)),
+            ("similar[index]", measure(lambda: vocab.similar(queries[0], use_index=True), number=10)),
+            ("similar_scored[scan]", measure(lambda: vocab.similar_scored(queries[0], use_index=False), repeat=1)),
+            ("similar_scored[index]", measure(lambda: vocab.similar_scored(queries[0], use_index=True), number=10)),
+        ]
+    )
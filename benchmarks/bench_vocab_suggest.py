@@ -0,0 +1,75 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Suggest words for misspelled names in the built-in vocabularies with the
+symmetric delete index, the BK-tree and a scan (edit distance 2).
+
+The queries are names with one typo.
+
+Usage:
+    python -m benchmarks.bench_vocab_suggest
+"""
+
+from pathlib import Path
+import random
+import tempfile
+
+from src.biz.dfch.asdste100vocab.edit_distance import EditDistance
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_delete_index import VocabDeleteIndex
+
+from .bench import measure, print_results, print_sizes
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    rnd = random.Random(42)
+    queries = []
+    for word in rnd.sample(list(vocab), 100):
+        idx = rnd.randrange(len(word.name))
+        queries.append(word.name[:idx] + rnd.choice("abcdefghijklmnopqrstuvwxyz") + word.name[idx + 1 :])
+
+    def scan() -> None:
+        for value in queries:
+            distance = EditDistance.DAMERAU.get_matcher(value.lower())
+            _ = [word for word in vocab if distance(word.name.lower()) <= 2]
+
+    def within_distance() -> None:
+        for value in queries:
+            vocab.within_distance(value, 2, metric=EditDistance.DAMERAU)
+
+    def suggest() -> None:
+        for value in queries:
+            vocab.suggest(value, 2)
+
+    with tempfile.TemporaryDirectory() as path:
+        index = Path(path) / "vocab.index"
+        delete_index = vocab.build_delete_index()
+        delete_index.save_index(index)
+
+        print(f"queries: {len(queries)}, items: {len(vocab)}, variants: {delete_index.delete_count}")
+        print_sizes([("delete index", delete_index.get_memory_size()), ("index file", index.stat().st_size)])
+        print_results(
+            [
+                ("build", measure(lambda: VocabDeleteIndex(vocab))),
+                ("load", measure(lambda: VocabDeleteIndex(vocab, index=index))),
+                ("scan", measure(scan, repeat=1)),
+                ("within_distance", measure(within_distance)),
+                ("suggest", measure(suggest)),
+            ]
+        )
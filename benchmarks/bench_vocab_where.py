@@ -0,0 +1,57 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+List the words of one category of the built-in vocabularies with a
+predicate (`Vocab.filter`) and with the secondary index (`Vocab.where`).
+
+Usage:
+    python -m benchmarks.bench_vocab_where
+"""
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_field_index import VocabFieldIndex
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+from .bench import measure, print_results
+
+
+if __name__ == "__main__":
+    vocab = Vocab(use_ste100_technical_word=True)
+    category = WordCategory.ICT_TERMS
+    vocab.where(category=category)
+
+    print(f"matches: {len(vocab.where(category=category))}, items: {len(vocab)}")
+    print_results(
+        [
+            ("filter[category]", measure(lambda: vocab.filter(lambda word: word.category == category), number=100)),
+            ("where[category]", measure(lambda: vocab.where(category=category), number=100)),
+            (
+                "filter[category,status]",
+                measure(
+                    lambda: vocab.filter(lambda word: word.category == category and word.status == WordStatus.APPROVED),
+                    number=100,
+                ),
+            ),
+            (
+                "where[category,status]",
+                measure(lambda: vocab.where(category=category, status=WordStatus.APPROVED), number=100),
+            ),
+            ("VocabFieldIndex", measure(lambda: VocabFieldIndex(vocab))),
+        ]
+    )
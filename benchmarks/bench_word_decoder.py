@@ -0,0 +1,40 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Read the built-in base vocabulary with each decoder engine.
+
+Usage:
+    python -m benchmarks.bench_word_decoder
+"""
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.decoder_engine import DecoderEngine
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .bench import measure, print_results
+
+
+def read(engine: DecoderEngine) -> list[float]:
+    """Return the time to read the built-in base vocabulary with `engine`."""
+
+    fullname = BuiltInVocab.STE100_BASE.value
+    return measure(lambda: Vocab.read_jsonl_file(fullname, lambda _: True, engine=engine))
+
+
+if __name__ == "__main__":
+    print_results([(f"read_jsonl_file[{engine}]", read(engine)) for engine in DecoderEngine])
@@ -0,0 +1,51 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Memory and time to decode the built-in vocabularies with and without
+string interning.
+
+Usage:
+    python -m benchmarks.bench_word_intern
+"""
+
+import json
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_decoder import WordDecoder
+
+from .bench import get_deep_size, measure, print_results, print_sizes
+
+
+def read(intern: bool) -> list[Word]:
+    """Decode all entries of the built-in vocabularies."""
+
+    result: list[Word] = []
+    for builtin in (BuiltInVocab.STE100_BASE, BuiltInVocab.STE100_TECHNICAL_WORDS):
+        with open(builtin.value, "r", encoding="utf-8") as f:
+            result.extend(WordDecoder.decode(json.loads(line), intern=intern) for line in f if line.strip())
+
+    return result
+
+
+if __name__ == "__main__":
+    print_sizes([(f"decode[intern={intern}]", get_deep_size(read(intern))) for intern in (False, True)])
+    print()
+    print_results(
+        [(f"decode[intern={intern}]", measure(lambda intern=intern: read(intern))) for intern in (False, True)]
+    )
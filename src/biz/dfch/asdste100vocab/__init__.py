@@ -17,7 +17,32 @@
 
 """The main library init file."""
 
+from .compact_word import CompactWord
+from .compact_word_meaning import CompactWordMeaning
+from .compact_word_note import CompactWordNote
+from .decoder_engine import DecoderEngine
+from .edit_distance import EditDistance
+from .index_unpickler import IndexUnpickler
+from .lazy_word import LazyWord
+from .mapped_vocab_file import MappedVocabFile
+from .metaphone import Metaphone
 from .vocab import Vocab
+from .vocab_alternative_index import VocabAlternativeIndex
+from .vocab_bk_tree import VocabBkTree
+from .vocab_delete_index import VocabDeleteIndex
+from .vocab_field_index import VocabFieldIndex
+from .vocab_filter import VocabFilter
+from .vocab_index import VocabIndex
+from .vocab_line_error import VocabLineError
+from .vocab_ngram_index import VocabNgramIndex
+from .vocab_phonetic_index import VocabPhoneticIndex
+from .vocab_prefix_index import VocabPrefixIndex
+from .vocab_query import VocabQuery
+from .vocab_query_cache import VocabQueryCache
+from .vocab_query_cache_info import VocabQueryCacheInfo
+from .vocab_query_plan import VocabQueryPlan
+from .vocab_text_index import VocabTextIndex
+from .vocab_trie import VocabTrie
 from .word import Word
 from .word_category import WordCategory
 from .word_meaning import WordMeaning
@@ -27,7 +52,32 @@ from .word_status import WordStatus
 from .word_type import WordType
 
 __all__ = [
+    "CompactWord",
+    "CompactWordMeaning",
+    "CompactWordNote",
+    "DecoderEngine",
+    "EditDistance",
+    "IndexUnpickler",
+    "LazyWord",
+    "MappedVocabFile",
+    "Metaphone",
     "Vocab",
+    "VocabAlternativeIndex",
+    "VocabBkTree",
+    "VocabDeleteIndex",
+    "VocabFieldIndex",
+    "VocabFilter",
+    "VocabIndex",
+    "VocabLineError",
+    "VocabNgramIndex",
+    "VocabPhoneticIndex",
+    "VocabPrefixIndex",
+    "VocabQuery",
+    "VocabQueryCache",
+    "VocabQueryCacheInfo",
+    "VocabQueryPlan",
+    "VocabTextIndex",
+    "VocabTrie",
     "Word",
     "WordCategory",
     "WordMeaning",
@@ -49,6 +49,9 @@ from .commands import similar
 from .commands import examine
 from .commands import match
 from .commands import find
+from .commands import complete
+from .commands import query
+from .commands import search
 from .info import Info
 
 # ---------------------------------------------------------------------------
@@ -124,6 +127,9 @@ app.command(epilog=Info.epilog)(similar)
 app.command(epilog=Info.epilog)(examine)
 app.command(epilog=Info.epilog)(match)
 app.command(epilog=Info.epilog)(find)
+app.command(epilog=Info.epilog)(complete)
+app.command(epilog=Info.epilog)(query)
+app.command(epilog=Info.epilog)(search)
 
 
 if __name__ == "__main__":
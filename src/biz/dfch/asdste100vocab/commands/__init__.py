@@ -24,6 +24,9 @@ from .similar import similar
 from .examine import examine
 from .match import match
 from .find import find
+from .complete import complete
+from .query import query
+from .search import search
 
 __all__ = [
     "new",
@@ -33,4 +36,7 @@ __all__ = [
     "examine",
     "match",
     "find",
+    "complete",
+    "query",
+    "search",
 ]
@@ -168,6 +168,65 @@ PhraseArg = Annotated[
     ),
 ]
 
+OptionalPhraseArg = Annotated[
+    Optional[str],
+    typer.Argument(
+        help="The phrase or word to search for. Omit it with --batch.",
+    ),
+]
+
+BatchOpt = Annotated[
+    bool,
+    typer.Option(
+        "--batch",
+        help="Read the phrases from standard input, one per line, and search for each of them.",
+    ),
+]
+
+QueryArg = Annotated[
+    str,
+    typer.Argument(
+        help=(
+            "The query: terms like ``field:value`` that all must match; a comma separates alternative values."
+            " Fields: name, prefix, match, similar, cutoff, status, type, category, source."
+            " Example: ``status:approved type:TN category:TN3,TN6 match:^hyd``."
+        ),
+    ),
+]
+
+ExplainOpt = Annotated[
+    bool,
+    typer.Option(
+        "--explain",
+        help="Show the plan of the query (access path and filters) instead of the result.",
+    ),
+]
+
+TextArg = Annotated[
+    str,
+    typer.Argument(
+        help="The text to search for in the meanings, examples and notes of the words.",
+    ),
+]
+
+SearchLimitOpt = Annotated[
+    int,
+    typer.Option(
+        "--count",
+        "-n",
+        help="Maximum number of words to return.",
+    ),
+]
+
+SearchStatusOpt = Annotated[
+    Optional[WordStatus],
+    typer.Option(
+        "--status",
+        "-s",
+        help="Only return words with this approval status.",
+    ),
+]
+
 SimilarNOpt = Annotated[
     int,
     typer.Option(
@@ -177,6 +236,31 @@ SimilarNOpt = Annotated[
     ),
 ]
 
+SimilarScoresOpt = Annotated[
+    bool,
+    typer.Option(
+        "--scores",
+        help="Rank the matches by similarity and show their scores.",
+    ),
+]
+
+PhoneticOpt = Annotated[
+    bool,
+    typer.Option(
+        "--phonetic",
+        help="Also include words that sound like the phrase (Metaphone).",
+    ),
+]
+
+CompleteLimitOpt = Annotated[
+    int,
+    typer.Option(
+        "--count",
+        "-n",
+        help="Maximum number of completions to return.",
+    ),
+]
+
 SimilarCutoffOpt = Annotated[
     float,
     typer.Option(
@@ -0,0 +1,53 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Shared helpers for the ``--batch`` mode of CLI commands."""
+
+import sys
+from typing import TextIO
+
+
+def get_phrases(phrase: str | None, batch: bool, stream: TextIO | None = None) -> list[str]:
+    """Return the phrases of a command.
+
+    Parameters
+    ----------
+    phrase:
+        The phrase argument. It must be set, unless `batch` is `True`.
+    batch:
+        When `True`, the phrases are read from `stream`, one per line.
+        Empty lines are skipped.
+    stream:
+        The input of the batch mode (default ``sys.stdin``).
+
+    Returns
+    -------
+    list[str]
+        The phrases, in input order.
+    """
+
+    assert isinstance(batch, bool), type(batch)
+
+    if not batch:
+        assert isinstance(phrase, str) and phrase.strip(), phrase
+        return [phrase]
+
+    assert phrase is None, f"Do not specify a phrase with --batch: '{phrase}'."
+    if stream is None:
+        stream = sys.stdin
+
+    return [line.strip() for line in stream if line.strip()]
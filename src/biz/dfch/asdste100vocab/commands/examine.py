@@ -23,20 +23,24 @@ import typer
 from rich.console import Console
 
 from ..vocab import Vocab
-from ..word import Word
 from .args import (
-    PhraseArg,
+    BatchOpt,
+    OptionalPhraseArg,
+    PhoneticOpt,
     SimilarCutoffOpt,
     UseSte100Opt,
     UseSte100TechnicalWordOpt,
     VocabFiles,
 )
-from .render import print_word_table
+from .batch import get_phrases
+from .render import print_phrase_heading, print_word_table
 
 
 def examine(
-    phrase: PhraseArg,
+    phrase: OptionalPhraseArg = None,
+    batch: BatchOpt = False,
     cutoff: SimilarCutoffOpt = Vocab.DIFFLIB_CUTOFF_DEFAULT,
+    phonetic: PhoneticOpt = False,
     use_ste100: UseSte100Opt = True,
     use_ste100_technical_word: UseSte100TechnicalWordOpt = False,
     files: VocabFiles = None,
@@ -47,10 +51,12 @@ def examine(
     Searches the built-in STE100 vocabulary and any additional JSONL
     vocabulary files supplied via ``--vocabulary`` for words whose names
     are similar to or contain *phrase*, combining fuzzy matching
-    (``difflib``) and partial/substring matching.
+    (``difflib``) and partial/substring matching. With ``--phonetic``,
+    words that sound like *phrase* are included too. With ``--batch``, the
+    phrases are read from standard input, one per line.
     """
 
-    assert isinstance(phrase, str) and phrase.strip(), phrase
+    phrases = get_phrases(phrase, batch)
     assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
 
     extra_files: list[Path] = files if files is not None else []
@@ -61,17 +67,19 @@ def examine(
         files=extra_files,
     )
 
-    results: list[Word] = vocab.examine(phrase, cutoff=cutoff)
-
     console = Console()
 
-    if not results:
-        console.print(
-            typer.style(
-                f"No matching words found for '{phrase}'.",
-                fg=typer.colors.YELLOW,
+    for value, results in zip(phrases, vocab.examine_many(phrases, cutoff=cutoff, phonetic=phonetic)):
+        if batch:
+            print_phrase_heading(value)
+
+        if not results:
+            console.print(
+                typer.style(
+                    f"No matching words found for '{value}'.",
+                    fg=typer.colors.YELLOW,
+                )
             )
-        )
-        raise typer.Exit(code=0)
+            continue
 
-    print_word_table(results)
+        print_word_table(results)
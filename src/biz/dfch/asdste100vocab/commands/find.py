@@ -23,18 +23,20 @@ import typer
 from rich.console import Console
 
 from ..vocab import Vocab
-from ..word import Word
 from .args import (
-    PhraseArg,
+    BatchOpt,
+    OptionalPhraseArg,
     UseSte100Opt,
     UseSte100TechnicalWordOpt,
     VocabFiles,
 )
-from .render import print_word_table
+from .batch import get_phrases
+from .render import print_phrase_heading, print_word_table
 
 
 def find(
-    word: PhraseArg,
+    word: OptionalPhraseArg = None,
+    batch: BatchOpt = False,
     use_ste100: UseSte100Opt = True,
     use_ste100_technical_word: UseSte100TechnicalWordOpt = False,
     files: VocabFiles = None,
@@ -44,10 +46,11 @@ def find(
 
     Searches the built-in STE100 vocabulary and any additional JSONL
     vocabulary files supplied via ``--vocabulary`` for words whose names
-    exactly match *word* (case-insensitive).
+    exactly match *word* (case-insensitive). With ``--batch``, the words
+    are read from standard input, one per line.
     """
 
-    assert isinstance(word, str) and word.strip(), word
+    words = get_phrases(word, batch)
 
     extra_files: list[Path] = files if files is not None else []
 
@@ -57,17 +60,19 @@ def find(
         files=extra_files,
     )
 
-    results: list[Word] = vocab.find(word)
-
     console = Console()
 
-    if not results:
-        console.print(
-            typer.style(
-                f"No word found for '{word}'.",
-                fg=typer.colors.YELLOW,
+    for value, results in zip(words, vocab.find_many(words)):
+        if batch:
+            print_phrase_heading(value)
+
+        if not results:
+            console.print(
+                typer.style(
+                    f"No word found for '{value}'.",
+                    fg=typer.colors.YELLOW,
+                )
             )
-        )
-        raise typer.Exit(code=0)
+            continue
 
-    print_word_table(results)
+        print_word_table(results)
@@ -0,0 +1,87 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""``query`` find vocabulary entries with a query expression."""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+
+from ..vocab import Vocab
+from ..vocab_query import VocabQuery
+from .args import (
+    ExplainOpt,
+    QueryArg,
+    UseSte100Opt,
+    UseSte100TechnicalWordOpt,
+    VocabFiles,
+)
+from .render import print_word_table
+
+
+def query(
+    expression: QueryArg,
+    explain: ExplainOpt = False,
+    use_ste100: UseSte100Opt = True,
+    use_ste100_technical_word: UseSte100TechnicalWordOpt = False,
+    files: VocabFiles = None,
+) -> None:
+    """
+    Find vocabulary entries with a query expression.
+
+    Searches the built-in STE100 vocabulary and any additional JSONL
+    vocabulary files supplied via ``--vocabulary`` for words that match all
+    terms of *expression*, for example
+    ``"status:approved type:TN category:TN3,TN6 match:^hyd"``. With
+    ``--explain``, the plan of the query is shown instead of the result.
+    """
+
+    assert isinstance(expression, str), expression
+
+    console = Console()
+
+    try:
+        parsed = VocabQuery.parse(expression)
+    except ValueError as ex:
+        console.print(typer.style(str(ex), fg=typer.colors.RED))
+        raise typer.Exit(code=1) from ex
+
+    extra_files: list[Path] = files if files is not None else []
+
+    vocab = Vocab(
+        use_ste100=use_ste100,
+        use_ste100_technical_word=use_ste100_technical_word,
+        files=extra_files,
+    )
+
+    if explain:
+        typer.echo(vocab.explain(parsed).explain())
+        raise typer.Exit(code=0)
+
+    results = vocab.query(parsed)
+
+    if not results:
+        console.print(
+            typer.style(
+                f"No words found for '{parsed}'.",
+                fg=typer.colors.YELLOW,
+            )
+        )
+        raise typer.Exit(code=0)
+
+    print_word_table(results)
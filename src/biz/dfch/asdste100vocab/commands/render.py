@@ -20,6 +20,7 @@
 from rich.console import Console
 from rich.table import Table
 from rich import box
+from rich.markup import escape
 
 from ..word import Word
 from ..word_status import WordStatus
@@ -34,16 +35,21 @@ def _word_name_styled(word: Word) -> str:
     return word.name
 
 
-def print_word_table(results: list[Word]) -> None:
+def print_word_table(results: list[Word], scores: list[float] | None = None) -> None:
     """Render a list of `Word` objects as a Rich table and print it.
 
     Parameters
     ----------
     results:
         The list of `Word` objects to display.
+    scores:
+        The similarity score of each word. When set, a ``Score`` column
+        is shown.
     """
 
     assert isinstance(results, list), type(results)
+    if scores is not None:
+        assert isinstance(scores, list) and len(scores) == len(results), scores
 
     table = Table(
         box=box.ROUNDED,
@@ -55,15 +61,29 @@ def print_word_table(results: list[Word]) -> None:
     table.add_column("Type")
     table.add_column("Category")
     table.add_column("Source")
+    if scores is not None:
+        table.add_column("Score", justify="right")
 
-    for word in results:
-        table.add_row(
+    for idx, word in enumerate(results):
+        row = [
             _word_name_styled(word),
             word.status.value,
             word.type_.value,
             word.category.value,
             word.source or "",
-        )
+        ]
+        if scores is not None:
+            row.append(f"{scores[idx]:.3f}")
+        table.add_row(*row)
 
     console = Console()
     console.print(table)
+
+
+def print_phrase_heading(phrase: str) -> None:
+    """Print the phrase of a result table in the ``--batch`` mode."""
+
+    assert isinstance(phrase, str), type(phrase)
+
+    console = Console()
+    console.print(f"[bold]{escape(phrase)}[/bold]")
@@ -25,20 +25,25 @@ from rich.console import Console
 from ..vocab import Vocab
 from ..word import Word
 from .args import (
-    PhraseArg,
+    BatchOpt,
+    OptionalPhraseArg,
     SimilarNOpt,
     SimilarCutoffOpt,
+    SimilarScoresOpt,
     UseSte100Opt,
     UseSte100TechnicalWordOpt,
     VocabFiles,
 )
-from .render import print_word_table
+from .batch import get_phrases
+from .render import print_phrase_heading, print_word_table
 
 
 def similar(
-    phrase: PhraseArg,
+    phrase: OptionalPhraseArg = None,
+    batch: BatchOpt = False,
     n: SimilarNOpt = Vocab.DIFFLIB_N_DEFAULT,
     cutoff: SimilarCutoffOpt = Vocab.DIFFLIB_CUTOFF_DEFAULT,
+    scores: SimilarScoresOpt = False,
     use_ste100: UseSte100Opt = True,
     use_ste100_technical_word: UseSte100TechnicalWordOpt = False,
     files: VocabFiles = None,
@@ -48,10 +53,12 @@ def similar(
 
     Searches the built-in STE100 vocabulary and any additional JSONL
     vocabulary files supplied via ``--vocabulary`` for words whose names
-    are similar to *phrase*, using ``difflib`` fuzzy matching.
+    are similar to *phrase*, using ``difflib`` fuzzy matching. With
+    ``--scores``, the matches are ranked by their similarity score. With
+    ``--batch``, the phrases are read from standard input, one per line.
     """
 
-    assert isinstance(phrase, str) and phrase.strip(), phrase
+    phrases = get_phrases(phrase, batch)
     assert isinstance(n, int) and n > 0, n
     assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
 
@@ -63,17 +70,26 @@ def similar(
         files=extra_files,
     )
 
-    results: list[Word] = vocab.similar(phrase, n=n, cutoff=cutoff)
+    scored: dict[str, list[tuple[Word, float]]] = {}
+    if scores:
+        scored = {value: vocab.similar_scored(value, n=n, cutoff=cutoff) for value in dict.fromkeys(phrases)}
+        matches: list[list[Word]] = [[word for word, _ in scored[value]] for value in phrases]
+    else:
+        matches = vocab.similar_many(phrases, n=n, cutoff=cutoff)
 
     console = Console()
 
-    if not results:
-        console.print(
-            typer.style(
-                f"No similar words found for '{phrase}'.",
-                fg=typer.colors.YELLOW,
+    for value, results in zip(phrases, matches):
+        if batch:
+            print_phrase_heading(value)
+
+        if not results:
+            console.print(
+                typer.style(
+                    f"No similar words found for '{value}'.",
+                    fg=typer.colors.YELLOW,
+                )
             )
-        )
-        raise typer.Exit(code=0)
+            continue
 
-    print_word_table(results)
+        print_word_table(results, [score for _, score in scored[value]] if scores else None)
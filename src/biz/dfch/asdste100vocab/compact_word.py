@@ -0,0 +1,137 @@
+# Copyright (C) 2025-2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""CompactWord class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .compact_word_meaning import CompactWordMeaning
+from .compact_word_note import CompactWordNote
+from .word import Word
+from .word_category import WordCategory
+from .word_meaning import WordMeaning
+from .word_note import WordNote
+from .word_source import WordSource
+from .word_status import WordStatus
+from .word_type import WordType
+
+
+@dataclass(frozen=True, slots=True)
+class CompactWord:
+    """
+    A compact, immutable variant of `Word`.
+
+    The instances have `__slots__` instead of a `__dict__`, and the
+    sequence fields are tuples instead of lists. So a `CompactWord` needs
+    less memory than a `Word`, and it is hashable.
+
+    The fields (and their order) are the same as in `Word`. Use
+    :meth:`from_word` and :meth:`to_word` to convert between both classes.
+    """
+
+    name: str
+    status: WordStatus = WordStatus.UNKNOWN
+    type_: WordType = WordType.UNKNOWN
+    meanings: tuple[CompactWordMeaning, ...] = ()
+    spellings: tuple[str, ...] = ()
+    alternatives: tuple[CompactWord, ...] = ()
+    source: str = WordSource.UNKNOWN
+    category: WordCategory = WordCategory.DEFAULT
+    ste_example: tuple[str, ...] = ()
+    nonste_example: tuple[str, ...] = ()
+    note: CompactWordNote | None = None
+
+    @staticmethod
+    def from_word(word: Word) -> CompactWord:
+        """Make a `CompactWord` from a `Word` (including its meanings, alternatives and notes)."""
+
+        assert isinstance(word, Word), type(word)
+
+        return CompactWord(
+            name=word.name,
+            status=word.status,
+            type_=word.type_,
+            meanings=tuple(CompactWord._from_meaning(item) for item in word.meanings),
+            spellings=tuple(word.spellings),
+            alternatives=tuple(CompactWord.from_word(item) for item in word.alternatives),
+            source=word.source,
+            category=word.category,
+            ste_example=tuple(word.ste_example),
+            nonste_example=tuple(word.nonste_example),
+            note=CompactWord._from_note(word.note),
+        )
+
+    @staticmethod
+    def _from_meaning(meaning: WordMeaning) -> CompactWordMeaning:
+        return CompactWordMeaning(
+            value=meaning.value,
+            ste_example=tuple(meaning.ste_example),
+            nonste_example=tuple(meaning.nonste_example),
+            note=CompactWord._from_note(meaning.note),
+        )
+
+    @staticmethod
+    def _from_note(note: WordNote | None) -> CompactWordNote | None:
+        if note is None:
+            return None
+
+        return CompactWordNote(
+            value=note.value,
+            words=tuple(CompactWord.from_word(item) for item in note.words),
+            ste_example=note.ste_example,
+            nonste_example=note.nonste_example,
+        )
+
+    def to_word(self) -> Word:
+        """Make a `Word` with the same field values."""
+
+        return Word(
+            name=self.name,
+            status=self.status,
+            type_=self.type_,
+            meanings=[CompactWord._to_meaning(item) for item in self.meanings],
+            spellings=list(self.spellings),
+            alternatives=[item.to_word() for item in self.alternatives],
+            source=self.source,
+            category=self.category,
+            ste_example=list(self.ste_example),
+            nonste_example=list(self.nonste_example),
+            note=CompactWord._to_note(self.note),
+        )
+
+    @staticmethod
+    def _to_meaning(meaning: CompactWordMeaning) -> WordMeaning:
+        return WordMeaning(
+            value=meaning.value,
+            ste_example=list(meaning.ste_example),
+            nonste_example=list(meaning.nonste_example),
+            note=CompactWord._to_note(meaning.note),
+        )
+
+    @staticmethod
+    def _to_note(note: CompactWordNote | None) -> WordNote | None:
+        if note is None:
+            return None
+
+        return WordNote(
+            value=note.value,
+            words=[item.to_word() for item in note.words],
+            ste_example=note.ste_example,
+            nonste_example=note.nonste_example,
+        )
@@ -0,0 +1,36 @@
+# Copyright (C) 2025-2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""CompactWordMeaning class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .compact_word_note import CompactWordNote
+
+
+@dataclass(frozen=True, slots=True)
+class CompactWordMeaning:
+    """A `WordMeaning` with `__slots__` and tuples instead of lists (see `CompactWord`)."""
+
+    value: str
+    ste_example: tuple[str, ...] = ()
+    nonste_example: tuple[str, ...] = ()
+    note: CompactWordNote | None = None
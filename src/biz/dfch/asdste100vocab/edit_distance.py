@@ -0,0 +1,135 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""EditDistance enumeration."""
+
+from __future__ import annotations
+from enum import StrEnum
+from typing import Callable
+
+
+def _get_masks(value: str) -> dict[str, int]:
+    """Return a bit mask of the positions of each character in `value`."""
+
+    result: dict[str, int] = {}
+    for idx, char in enumerate(value):
+        result[char] = result.get(char, 0) | (1 << idx)
+
+    return result
+
+
+def _levenshtein(masks: dict[str, int], size: int, other: str) -> int:
+    """
+    Return the Levenshtein distance between a pattern (its character
+    `masks` and `size`) and `other` (bit-parallel algorithm of Myers and
+    Hyyrö).
+    """
+
+    if size == 0:
+        return len(other)
+
+    last = 1 << (size - 1)
+    vp = (1 << size) - 1
+    vn = 0
+    result = size
+    for char in other:
+        eq = masks.get(char, 0)
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        if hp & last:
+            result += 1
+        elif hn & last:
+            result -= 1
+        hp = (hp << 1) | 1
+        vp = (hn << 1) | ~(d0 | hp)
+        vn = hp & d0
+
+    return result
+
+
+def _damerau(masks: dict[str, int], size: int, other: str) -> int:
+    """
+    Return the optimal string alignment distance between a pattern (its
+    character `masks` and `size`) and `other` (bit-parallel algorithm of
+    Hyyrö).
+    """
+
+    if size == 0:
+        return len(other)
+
+    last = 1 << (size - 1)
+    vp = (1 << size) - 1
+    vn = 0
+    d0 = 0
+    eq_prev = 0
+    result = size
+    for char in other:
+        eq = masks.get(char, 0)
+        tr = (((~d0) & eq) << 1) & eq_prev
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn | tr
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        if hp & last:
+            result += 1
+        elif hn & last:
+            result -= 1
+        hp = (hp << 1) | 1
+        vp = (hn << 1) | ~(d0 | hp)
+        vn = hp & d0
+        eq_prev = eq
+
+    return result
+
+
+class EditDistance(StrEnum):
+    """
+    Defines the edit distance metrics.
+
+    `LEVENSHTEIN` counts insertions, deletions and substitutions of single
+    characters. `DAMERAU` also counts a transposition of two adjacent
+    characters as one edit. It is the optimal string alignment distance
+    (no substring is edited more than once), which is not a true metric:
+    it does not always satisfy the triangle inequality.
+    """
+
+    LEVENSHTEIN = "levenshtein"
+    DAMERAU = "damerau"
+
+    def get_matcher(self, value: str) -> Callable[[str], int]:
+        """
+        Return a function that returns the distance between `value` and
+        its argument (case-sensitive).
+
+        Use it to compare one value with many others; the preparation of
+        `value` is done once.
+        """
+
+        assert isinstance(value, str), type(value)
+
+        masks = _get_masks(value)
+        size = len(value)
+        func = _damerau if self is EditDistance.DAMERAU else _levenshtein
+
+        return lambda other: func(masks, size, other)
+
+    def get(self, value: str, other: str) -> int:
+        """Return the distance between `value` and `other` (case-sensitive)."""
+
+        assert isinstance(other, str), type(other)
+
+        return self.get_matcher(value)(other)
@@ -0,0 +1,34 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""IndexUnpickler class."""
+
+import pickle
+
+
+class IndexUnpickler(pickle.Unpickler):
+    """
+    Unpickler that does not resolve any class.
+
+    The persisted indexes (see :meth:`MappedVocabFile.save_index`,
+    :meth:`VocabDeleteIndex.save_index` and
+    :meth:`VocabTextIndex.save_index`) only hold builtins, so a file that
+    refers to a class is rejected with a :class:`pickle.UnpicklingError`.
+    """
+
+    def find_class(self, module: str, name: str) -> type:
+        raise pickle.UnpicklingError(f"Class not allowed in index: '{module}.{name}'.")
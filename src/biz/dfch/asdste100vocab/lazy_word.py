@@ -0,0 +1,121 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""LazyWord class."""
+
+from __future__ import annotations
+import dataclasses
+import json
+
+from .word import Word
+from .word_decoder import WordDecoder
+
+
+class _LazyField:
+    """
+    Non-data descriptor for a field of a `LazyWord`.
+
+    The first access decodes the `Word` from the raw JSONL line and stores
+    all lazy fields in the instance `__dict__`. Because the descriptor has
+    no `__set__`, later accesses read the instance `__dict__` directly.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: LazyWord | None, owner: type) -> object:
+        if instance is None:
+            return self
+
+        # pylint: disable=W0212
+        instance._materialize()
+        return instance.__dict__[self._name]
+
+
+class LazyWord(Word):
+    """
+    A `Word` that decodes its fields on first access.
+
+    Only `name`, `status`, `type_`, `source` and `category` are decoded when
+    the `LazyWord` is made. The other fields are decoded from the retained
+    raw JSONL line the first time one of them is read. After that, the raw
+    line is released.
+
+    A `LazyWord` is equal to a `Word` with the same field values.
+    """
+
+    LAZY_FIELDS: tuple[str, ...] = (
+        "meanings",
+        "spellings",
+        "alternatives",
+        "ste_example",
+        "nonste_example",
+        "note",
+    )
+
+    meanings = _LazyField("meanings")  # type: ignore
+    spellings = _LazyField("spellings")  # type: ignore
+    alternatives = _LazyField("alternatives")  # type: ignore
+    ste_example = _LazyField("ste_example")  # type: ignore
+    nonste_example = _LazyField("nonste_example")  # type: ignore
+    note = _LazyField("note")  # type: ignore
+
+    @staticmethod
+    def from_jsonl_text(value: str) -> LazyWord:
+        """
+        Make a `LazyWord` from a JSONL line.
+
+        Raises the same errors as :meth:`WordDecoder.decode` for invalid
+        `name`, `status`, `type_`, `source` or `category` values. Errors in
+        the other fields are raised on first access.
+        """
+
+        assert isinstance(value, str), type(value)
+
+        line = value.strip()
+        values = WordDecoder.decode_summary(json.loads(line))
+        values["_raw"] = line
+
+        result = object.__new__(LazyWord)
+        result.__dict__.update(values)
+
+        return result
+
+    @property
+    def is_materialized(self) -> bool:
+        """Return `True` if all fields are decoded."""
+
+        return "_raw" not in self.__dict__
+
+    def _materialize(self) -> None:
+        values = self.__dict__
+        raw = values.get("_raw")
+        if raw is None:
+            return
+
+        word = WordDecoder.decode(json.loads(raw))
+        for name in LazyWord.LAZY_FIELDS:
+            values[name] = word.__dict__[name]
+        del values["_raw"]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Word):
+            return NotImplemented
+
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in dataclasses.fields(Word))
+
+    __hash__ = Word.__hash__
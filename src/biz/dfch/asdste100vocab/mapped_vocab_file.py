@@ -0,0 +1,255 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""MappedVocabFile class."""
+
+from __future__ import annotations
+from array import array
+from itertools import accumulate
+import json
+import mmap
+import pickle
+from pathlib import Path
+from typing import Iterator
+
+from .index_unpickler import IndexUnpickler
+from .lazy_word import LazyWord
+from .word import Word
+from .word_decoder import WordDecoder
+
+
+class MappedVocabFile:
+    """
+    Random access to the `Word` entries of a JSONL file.
+
+    The file is memory-mapped. A line-offset index is built when the file is
+    opened (or loaded from a persisted index), so a single line can be
+    decoded by its position without reading the rest of the file. A name
+    index is built on the first lookup by name.
+
+    Positions are 0-based line numbers.
+
+    Use it as a context manager, or call :meth:`close`::
+
+        with MappedVocabFile(fullname) as vocab_file:
+            word = vocab_file[42]
+            words = vocab_file.find("abandon")
+    """
+
+    INDEX_SUFFIX: str = ".index"
+    INDEX_FORMAT_VERSION: int = 1
+
+    _fullname: Path
+    _lazy: bool
+    _mmap: mmap.mmap | None
+    _offsets: array
+    _names: dict[str, list[int]] | None
+
+    def __init__(
+        self,
+        fullname: Path,
+        *,
+        index: Path | None = None,
+        lazy: bool = False,
+    ) -> None:
+        """
+        Open a JSONL file.
+
+        Parameters
+        ----------
+        fullname:
+            The JSONL file.
+        index:
+            A persisted index (see :meth:`save_index`). It is used when it
+            exists and matches the size and modification time of the file.
+            Otherwise the line-offset index is built from the file.
+        lazy:
+            When `True`, decoded entries are `LazyWord` items.
+        """
+
+        assert isinstance(fullname, Path), type(fullname)
+        if not fullname.exists():
+            raise FileNotFoundError(fullname)
+        if index is not None:
+            assert isinstance(index, Path), type(index)
+        assert isinstance(lazy, bool), type(lazy)
+
+        self._fullname = fullname
+        self._lazy = lazy
+        self._names = None
+
+        with open(fullname, "rb") as f:
+            size = fullname.stat().st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+
+        if index is None or not self._load_index(index):
+            self._offsets = self._build_offsets()
+
+    def __enter__(self) -> MappedVocabFile:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map."""
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    @staticmethod
+    def get_index_path(fullname: Path) -> Path:
+        """Return the default index path that belongs to a JSONL file."""
+
+        assert isinstance(fullname, Path), type(fullname)
+
+        return fullname.with_suffix(MappedVocabFile.INDEX_SUFFIX)
+
+    def _get_header(self) -> dict[str, object]:
+        stat = self._fullname.stat()
+        return {
+            "format": MappedVocabFile.INDEX_FORMAT_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def _build_offsets(self) -> array:
+        """Return the start offset of each line, followed by the file size."""
+
+        with open(self._fullname, "rb") as f:
+            return array("Q", accumulate(map(len, f), initial=0))
+
+    def _build_names(self) -> dict[str, list[int]]:
+        result: dict[str, list[int]] = {}
+        for position in range(len(self)):
+            line = self._get_line(position)
+            if not line.strip():
+                continue
+            try:
+                name = json.loads(line)["name"]
+            except (ValueError, KeyError, TypeError) as ex:
+                print(f"[ERROR] {self._fullname}[#{position + 1}]: '{ex}'.")
+                continue
+            result.setdefault(str(name).lower(), []).append(position)
+
+        return result
+
+    def _load_index(self, index: Path) -> bool:
+        if not index.exists():
+            return False
+
+        try:
+            with open(index, "rb") as f:
+                header = IndexUnpickler(f).load()
+                if header != self._get_header():
+                    return False
+                offsets, names = IndexUnpickler(f).load()
+        except (pickle.UnpicklingError, EOFError, ValueError) as ex:
+            print(f"[WARN] {index}: '{ex}'.")
+            return False
+
+        self._offsets = array("Q")
+        self._offsets.frombytes(offsets)
+        self._names = names
+
+        return True
+
+    def save_index(self, index: Path | None = None, *, include_names: bool = True) -> Path:
+        """
+        Persist the line-offset index (and the name index) to a file.
+
+        Parameters
+        ----------
+        index:
+            The index file. When `None`, the index is stored next to the
+            JSONL file (see :meth:`get_index_path`).
+        include_names:
+            When `True` (default), the name index is built (if necessary)
+            and persisted too.
+
+        Returns
+        -------
+        Path
+            The path of the index file.
+        """
+
+        if index is None:
+            index = MappedVocabFile.get_index_path(self._fullname)
+        assert isinstance(index, Path), type(index)
+        assert isinstance(include_names, bool), type(include_names)
+
+        names = self._get_names() if include_names else self._names
+        with open(index, "wb") as f:
+            pickle.dump(self._get_header(), f, protocol=5)
+            pickle.dump((self._offsets.tobytes(), names), f, protocol=5)
+
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of lines in the file."""
+        return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[Word]:
+        """Return an iterator that decodes each non-empty line."""
+        for position in range(len(self)):
+            if self._get_line(position).strip():
+                yield self[position]
+
+    def _get_line(self, position: int) -> bytes:
+        assert self._mmap is not None or len(self) == 0, "File is closed."
+
+        return self._mmap[self._offsets[position] : self._offsets[position + 1]]  # type: ignore
+
+    def __getitem__(self, position: int) -> Word:
+        """Decode the `Word` on the line at `position`."""
+
+        assert isinstance(position, int), type(position)
+
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+
+        line = self._get_line(position)
+        if self._lazy:
+            return LazyWord.from_jsonl_text(line.decode("utf-8"))
+
+        return WordDecoder.decode(json.loads(line))
+
+    def _get_names(self) -> dict[str, list[int]]:
+        if self._names is None:
+            self._names = self._build_names()
+
+        return self._names
+
+    def positions(self, value: str) -> list[int]:
+        """Return the positions of the entries whose name matches `value` (case-insensitive)."""
+
+        assert isinstance(value, str), type(value)
+
+        return list(self._get_names().get(value.lower(), []))
+
+    def find(self, value: str) -> list[Word]:
+        """
+        Decode the entries whose name matches `value` (case-insensitive).
+
+        The first call builds the name index, unless it was loaded from a
+        persisted index.
+        """
+
+        return [self[position] for position in self.positions(value)]
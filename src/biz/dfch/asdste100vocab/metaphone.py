@@ -0,0 +1,156 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Metaphone class."""
+
+from __future__ import annotations
+
+
+class Metaphone:
+    """
+    Compute phonetic keys with the Metaphone algorithm (Lawrence Philips).
+
+    Names that sound alike have the same key, for example "phone" and
+    "fone" (``FN``). The words of a name are encoded separately; letters
+    other than ``A`` to ``Z`` separate words.
+
+    In addition to the original rules, an ``L`` is silent between ``A``,
+    ``O``, ``AU`` or ``OU`` and ``K`` or ``M`` ("walk", "caulk", "palm"),
+    between ``A`` and ``F`` ("half") and between ``OU`` and ``D``
+    ("could").
+    """
+
+    _VOWELS: frozenset[str] = frozenset("AEIOU")
+    _FRONT: frozenset[str] = frozenset("EIY")
+    _INITIAL: frozenset[str] = frozenset(("AE", "GN", "KN", "PN", "WR"))
+
+    @staticmethod
+    def encode(value: str) -> str:
+        """Return the key of a name (the keys of its words, separated by a space)."""
+
+        assert isinstance(value, str), type(value)
+
+        words = "".join(char if "A" <= char <= "Z" else " " for char in value.upper()).split()
+        return " ".join(key for key in map(Metaphone._encode_word, words) if key)
+
+    @staticmethod
+    def _is_silent_l(word: str, idx: int) -> bool:
+        following = word[idx + 1 : idx + 2]
+        before = word[max(0, idx - 2) : idx]
+        previous = before[-1:]
+        if following in ("K", "M"):
+            return previous in ("A", "O") or before in ("AU", "OU")
+        if following == "F":
+            return previous == "A"
+        if following == "D":
+            return before == "OU"
+
+        return False
+
+    @staticmethod
+    def _encode_word(value: str) -> str:
+        # pylint: disable=R0912,R0915
+        vowels = Metaphone._VOWELS
+        front = Metaphone._FRONT
+
+        # Drop duplicate adjacent letters, except C.
+        word = "".join(char for idx, char in enumerate(value) if idx == 0 or char != value[idx - 1] or char == "C")
+        if word[:2] in Metaphone._INITIAL:
+            word = word[1:]
+        elif word[:1] == "X":
+            word = "S" + word[1:]
+        elif word[:2] == "WH":
+            word = "W" + word[2:]
+
+        result: list[str] = []
+        size = len(word)
+        for idx, char in enumerate(word):
+            previous = word[idx - 1] if idx > 0 else ""
+            following = word[idx + 1 : idx + 2]
+            after = word[idx + 2 : idx + 3]
+
+            if char in vowels:
+                if idx == 0:
+                    result.append(char)
+            elif char == "B":
+                if not (previous == "M" and idx == size - 1):
+                    result.append("B")
+            elif char == "C":
+                if following == "H":
+                    result.append("K" if previous == "S" else "X")
+                elif following == "I" and after == "A":
+                    result.append("X")
+                elif following in front:
+                    if previous != "S":
+                        result.append("S")
+                else:
+                    result.append("K")
+            elif char == "D":
+                result.append("J" if following == "G" and after in front else "T")
+            elif char == "G":
+                if following == "H" and after and after not in vowels:
+                    pass
+                elif following == "N" and word[idx + 2 :] in ("", "ED"):
+                    pass
+                elif previous == "D" and following in front:
+                    pass
+                elif following in front and previous != "G":
+                    result.append("J")
+                else:
+                    result.append("K")
+            elif char == "H":
+                if previous and previous in "CGPST":
+                    pass
+                elif previous in vowels and following not in vowels:
+                    pass
+                else:
+                    result.append("H")
+            elif char == "K":
+                if previous != "C":
+                    result.append("K")
+            elif char == "L":
+                if not Metaphone._is_silent_l(word, idx):
+                    result.append("L")
+            elif char == "P":
+                result.append("F" if following == "H" else "P")
+            elif char == "Q":
+                result.append("K")
+            elif char == "S":
+                if following == "H" or (following == "I" and after in ("A", "O")):
+                    result.append("X")
+                else:
+                    result.append("S")
+            elif char == "T":
+                if following == "I" and after in ("A", "O"):
+                    result.append("X")
+                elif following == "H":
+                    result.append("0")
+                elif not (following == "C" and after == "H"):
+                    result.append("T")
+            elif char == "V":
+                result.append("F")
+            elif char in "WY":
+                if following in vowels:
+                    result.append(char)
+            elif char == "X":
+                result.append("KS")
+            elif char == "Z":
+                result.append("S")
+            else:
+                result.append(char)
+
+        return "".join(result)
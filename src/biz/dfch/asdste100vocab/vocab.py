@@ -18,48 +18,88 @@
 """Vocabulary class."""
 
 from __future__ import annotations
+from concurrent.futures import Future, ProcessPoolExecutor
 import dataclasses
 import difflib
 import enum
+import heapq
+import io
 import json
+from operator import attrgetter
 from pathlib import Path
 import re
 from typing import Callable
+from typing import Iterable
 from typing import Iterator
+from typing import Sequence
 
-from dacite import Config, from_dict
+from dacite import Config
 
+from .compact_word import CompactWord
+from .decoder_engine import DecoderEngine
+from .edit_distance import EditDistance
+from .lazy_word import LazyWord
 from .word import Word
 from .word_category import WordCategory
-from .word_meaning import WordMeaning
-from .word_note import WordNote
+from .word_decoder import WordDecoder
 from .word_status import WordStatus
 from .word_type import WordType
 from .builtin_vocab import BuiltInVocab
+from .vocab_alternative_index import VocabAlternativeIndex
+from .vocab_bk_tree import VocabBkTree
+from .vocab_delete_index import VocabDeleteIndex
+from .vocab_field_index import VocabFieldIndex
+from .vocab_filter import VocabFilter
+from .vocab_index import VocabIndex
+from .vocab_line_error import VocabLineError
+from .vocab_ngram_index import VocabNgramIndex
+from .vocab_phonetic_index import VocabPhoneticIndex
+from .vocab_prefix_index import VocabPrefixIndex
+from .vocab_query import VocabQuery
+from .vocab_query_plan import VocabQueryPlan
+from .vocab_query_cache import VocabQueryCache
+from .vocab_query_cache_info import VocabQueryCacheInfo
+from .vocab_trie import VocabTrie
+from .vocab_snapshot import VocabSnapshot
+from .vocab_text_index import VocabTextIndex
 
 
 class Vocab:
-    """Vocabulary class."""
+    """Vocabulary class.
+
+    The items are `Word` or `CompactWord` objects.
+    """
 
     DIFFLIB_N_DEFAULT: int = 5
     DIFFLIB_CUTOFF_DEFAULT: float = 0.6
-
-    _configuration: Config = Config(
-        strict=True,
-        type_hooks={
-            WordStatus: WordStatus,
-            WordType: WordType,
-            WordCategory: WordCategory,
-        },
-        forward_references={
-            Word.__name__: Word,
-            WordMeaning.__name__: WordMeaning,
-            WordNote.__name__: WordNote,
-        },
+    PARALLEL_CHUNK_SIZE: int = 4 * 2**20
+    CACHE_SIZE: int = 32
+
+    _configuration: Config = WordDecoder.DACITE_CONFIG
+    # The `VocabQuery` attribute, `Word` field and query field of the postings.
+    _QUERY_FIELDS: tuple[tuple[str, str, str], ...] = (
+        ("statuses", "status", "status"),
+        ("types", "type_", "type"),
+        ("categories", "category", "category"),
+        ("sources", "source", "source"),
     )
+    _cache: dict[tuple, tuple[Word, ...]] = {}
+    _word_types: tuple[type, ...] = (Word, CompactWord)
 
     _files: list[Path]
     _items: list[Word]
+    _index: VocabIndex | None
+    _prefix_index: VocabPrefixIndex | None
+    _trie: VocabTrie | None
+    _ngram_index: VocabNgramIndex | None
+    _bk_tree: VocabBkTree | None
+    _delete_index: VocabDeleteIndex | None
+    _phonetic_index: VocabPhoneticIndex | None
+    _field_index: VocabFieldIndex | None
+    _text_index: VocabTextIndex | None
+    _alternative_index: VocabAlternativeIndex | None
+    _query_cache: VocabQueryCache | None
+    _generation: int
     _predicate: Callable[[Word], bool]
 
     def __init__(
@@ -69,14 +109,71 @@ class Vocab:
         use_ste100: bool = True,
         use_ste100_technical_word: bool = False,
         predicate: Callable[[Word], bool] | None = None,
+        use_snapshot: bool = True,
+        engine: DecoderEngine = DecoderEngine.FAST,
+        lazy: bool = False,
+        workers: int = 1,
+        use_cache: bool = True,
+        load_filter: VocabFilter | None = None,
+        compact: bool = False,
+        query_cache_size: int = 0,
     ) -> None:
-        """Instantiates a vocabulary object."""
+        """Instantiates a vocabulary object.
+
+        When `use_snapshot` is `True` (default), a file is loaded from its
+        precompiled snapshot (see :class:`VocabSnapshot`) if the snapshot
+        exists and is not stale. Otherwise the JSONL file is read with the
+        decoder `engine`.
+
+        When `lazy` is `True`, the JSONL files are read as `LazyWord` items
+        and snapshots are not used. Only the name, status, type, source and
+        category are decoded when the vocabulary loads; the other fields
+        are decoded on first access.
+
+        When `workers` is greater than 1, the JSONL files are split into
+        chunks of about ``PARALLEL_CHUNK_SIZE`` bytes and the chunks are
+        decoded in a process pool with `workers` processes. The result is
+        the same as with a sequential load. `predicate` is called in this
+        process, so it does not have to be picklable.
+
+        When `use_cache` is `True` (default), the built-in vocabularies are
+        read once per process and kept in a cache (keyed by file identity,
+        decoder options and `predicate`). Later instances share the cached
+        `Word` items and only copy their own item list. The `Word` items are
+        frozen, but their list fields are not: do not modify them. Call
+        :meth:`clear_cache` to release the cache.
+
+        `load_filter` selects the entries to load (see :class:`VocabFilter`).
+        It is checked before an entry of a JSONL file is decoded, so a
+        filtered load only decodes the matching entries. `predicate` is
+        called after `load_filter`.
+
+        When `compact` is `True`, the items are `CompactWord` objects, which
+        need less memory than `Word` objects. `predicate` is called with the
+        `CompactWord` items. `compact` cannot be combined with `lazy`.
+
+        When `query_cache_size` is greater than 0, the results of
+        :meth:`find`, :meth:`match`, :meth:`similar` and :meth:`examine`
+        are kept in an LRU cache with that many entries (see
+        :class:`VocabQueryCache`). The cache is dropped when the items
+        change (see :attr:`generation`).
+        """
 
         if files is None:
             files = []
         assert isinstance(files, list), type(files)
         assert isinstance(use_ste100, bool), type(use_ste100)
         assert isinstance(use_ste100_technical_word, bool), type(use_ste100_technical_word)
+        assert isinstance(use_snapshot, bool), type(use_snapshot)
+        assert isinstance(engine, DecoderEngine), type(engine)
+        assert isinstance(lazy, bool), type(lazy)
+        assert isinstance(workers, int) and workers > 0, workers
+        assert isinstance(use_cache, bool), type(use_cache)
+        if load_filter is not None:
+            assert isinstance(load_filter, VocabFilter), type(load_filter)
+        assert isinstance(compact, bool), type(compact)
+        assert not (compact and lazy), "'compact' cannot be combined with 'lazy'."
+        assert isinstance(query_cache_size, int) and query_cache_size >= 0, query_cache_size
         if predicate is not None:
             assert callable(predicate), type(predicate)
             self._predicate = predicate
@@ -84,6 +181,18 @@ class Vocab:
             self._predicate = lambda _: True
 
         self._items = []
+        self._index = None
+        self._prefix_index = None
+        self._trie = None
+        self._ngram_index = None
+        self._bk_tree = None
+        self._delete_index = None
+        self._phonetic_index = None
+        self._field_index = None
+        self._text_index = None
+        self._alternative_index = None
+        self._query_cache = VocabQueryCache(query_cache_size) if query_cache_size > 0 else None
+        self._generation = 0
         self._files = []
 
         if use_ste100:
@@ -100,55 +209,434 @@ class Vocab:
             if not file.exists():
                 raise FileNotFoundError(file)
 
-            words = Vocab.read_jsonl_file(
-                file,
-                predicate=self._predicate,
+        builtin_count = len(self._files) - len(files)
+        if use_cache and builtin_count > 0:
+            self._items.extend(
+                Vocab._get_cached_words(
+                    self._files[:builtin_count],
+                    predicate=predicate,
+                    load_filter=load_filter,
+                    use_snapshot=use_snapshot,
+                    engine=engine,
+                    lazy=lazy,
+                    workers=workers,
+                    compact=compact,
+                )
             )
-            self._items.extend(words)
+            if not files:
+                # The cached words are already sorted.
+                return
+            load_files = files
+        else:
+            load_files = self._files
 
+        self._items.extend(
+            Vocab._load_files(
+                load_files,
+                predicate=self._predicate,
+                load_filter=load_filter,
+                use_snapshot=use_snapshot,
+                engine=engine,
+                lazy=lazy,
+                workers=workers,
+                compact=compact,
+            )
+        )
         self.sort(key=self._default_sort_key)
 
+    @staticmethod
+    def _load_files(
+        files: list[Path],
+        *,
+        predicate: Callable[[Word], bool],
+        load_filter: VocabFilter | None,
+        use_snapshot: bool,
+        engine: DecoderEngine,
+        lazy: bool,
+        workers: int,
+        compact: bool = False,
+    ) -> list[Word]:
+        """Read the `Word` items of `files` that match `load_filter` and `predicate` (in file order).
+
+        When `compact` is `True`, the items are converted to `CompactWord`
+        before `predicate` is called.
+        """
+
+        if compact:
+            words = Vocab._load_files(
+                files,
+                predicate=lambda _: True,
+                load_filter=load_filter,
+                use_snapshot=use_snapshot,
+                engine=engine,
+                lazy=lazy,
+                workers=workers,
+            )
+            return Vocab._select_words(map(CompactWord.from_word, words), predicate)  # type: ignore
+
+        if workers > 1:
+            words = Vocab._read_jsonl_files_parallel(
+                files,
+                workers=workers,
+                use_snapshot=use_snapshot and not lazy,
+                engine=engine,
+                lazy=lazy,
+                load_filter=load_filter,
+            )
+            return Vocab._select_words(words, predicate)
+
+        result: list[Word] = []
+        for file in files:
+            words = VocabSnapshot.read(file) if use_snapshot and not lazy else None
+            if words is None:
+                words = Vocab.read_jsonl_file(
+                    file,
+                    predicate=predicate,
+                    engine=engine,
+                    lazy=lazy,
+                    load_filter=load_filter,
+                )
+            else:
+                words = Vocab._select_words(words, predicate, load_filter, file)
+            result.extend(words)
+
+        return result
+
+    @staticmethod
+    def _select_words(
+        words: Iterable[Word],
+        predicate: Callable[[Word], bool],
+        load_filter: VocabFilter | None = None,
+        fullname: Path | None = None,
+    ) -> list[Word]:
+        """Return the `words` that match `load_filter` and `predicate`.
+
+        As with :meth:`read_jsonl_file`, a word for which `predicate` raises
+        an error is skipped, and the error is printed.
+        """
+
+        result: list[Word] = []
+        for word in words:
+            if load_filter is not None and not load_filter.matches(word):
+                continue
+            try:
+                if predicate(word):
+                    result.append(word)
+            except Exception as ex:  # pylint: disable=W0718
+                location = f"{fullname}['{word.name}']" if fullname is not None else f"'{word.name}'"
+                print(f"[ERROR] {location}: '{ex}'.")
+
+        return result
+
+    @staticmethod
+    def _get_cache_key(
+        files: list[Path], *, use_snapshot: bool, engine: DecoderEngine, lazy: bool, compact: bool
+    ) -> tuple:
+        """Return the identity (path, size and modification time) of `files` and the load options."""
+
+        identity = []
+        for file in files:
+            stat = file.stat()
+            identity.append((str(file.resolve()), stat.st_size, stat.st_mtime_ns))
+
+        return (tuple(identity), use_snapshot, engine, lazy, compact)
+
+    @staticmethod
+    def _get_cached_words(
+        files: list[Path],
+        *,
+        predicate: Callable[[Word], bool] | None,
+        load_filter: VocabFilter | None,
+        use_snapshot: bool,
+        engine: DecoderEngine,
+        lazy: bool,
+        workers: int,
+        compact: bool,
+    ) -> tuple[Word, ...]:
+        """Return the sorted `Word` items of the built-in `files` from the process-wide cache.
+
+        The files are read on the first call and when one of them changed.
+        A filtered load is cached on its own, unless the unfiltered words
+        are already cached.
+        """
+
+        key = Vocab._get_cache_key(files, use_snapshot=use_snapshot, engine=engine, lazy=lazy, compact=compact)
+        words = Vocab._cache.get((key, None, None))
+        if predicate is None and load_filter is None and words is not None:
+            return words
+
+        result = Vocab._cache.get((key, predicate, load_filter))
+        if result is not None:
+            return result
+
+        if words is not None:
+            result = tuple(Vocab._select_words(words, predicate or (lambda _: True), load_filter))
+        else:
+            items = Vocab._load_files(
+                files,
+                predicate=predicate if predicate is not None else lambda _: True,
+                load_filter=load_filter,
+                use_snapshot=use_snapshot,
+                engine=engine,
+                lazy=lazy,
+                workers=workers,
+                compact=compact,
+            )
+            items.sort(key=Vocab._default_sort_key)
+            result = tuple(items)
+
+        if predicate is not None or load_filter is not None:
+            if len(Vocab._cache) >= Vocab.CACHE_SIZE:
+                # Evict the oldest filtered entry; unfiltered entries are kept.
+                oldest = next((item for item in Vocab._cache if item[1:] != (None, None)), None)
+                if oldest is not None:
+                    del Vocab._cache[oldest]
+        Vocab._cache[(key, predicate, load_filter)] = result
+
+        return result
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Remove all entries from the process-wide cache of the built-in vocabularies."""
+
+        Vocab._cache.clear()
+
     @staticmethod
     def read_jsonl_text(
         value: str,
+        *,
+        engine: DecoderEngine = DecoderEngine.FAST,
+        lazy: bool = False,
     ) -> Word:
-        """Read `Word` entries from a JSONL file."""
+        """Read a `Word` entry from a JSONL line.
+
+        The default engine ``DecoderEngine.FAST`` builds the `Word` directly
+        (see :class:`WordDecoder`). ``DecoderEngine.DACITE`` uses
+        :func:`dacite.from_dict`. Both engines raise the same errors.
+
+        When `lazy` is `True`, the result is a `LazyWord`.
+        """
 
         assert isinstance(value, str), type(value)
+        assert isinstance(lazy, bool), type(lazy)
+
+        if lazy:
+            return LazyWord.from_jsonl_text(value)
 
         line = value.strip()
         item = json.loads(line)
-        result = from_dict(
-            data_class=Word,
-            data=item,
-            config=Vocab._configuration,
-        )
+        result = WordDecoder.decode(item, engine)
 
         return result
 
     @staticmethod
-    def read_jsonl_file(
+    def _decode_lines(
+        lines: Iterable[str],
+        *,
+        engine: DecoderEngine,
+        lazy: bool,
+        load_filter: VocabFilter | None = None,
+    ) -> Iterator[tuple[int, Word | Exception]]:
+        """Decode JSONL lines; yield the 1-based line number and the `Word` or the error.
+
+        Lines that do not match `load_filter` are skipped without decoding.
+        """
+
+        for idx, line in enumerate(lines, 1):
+            try:
+                if load_filter is None:
+                    yield idx, Vocab.read_jsonl_text(line, engine=engine, lazy=lazy)
+                    continue
+
+                if not load_filter.matches_line(line):
+                    continue
+                item = json.loads(line)
+                if not load_filter.matches_data(item):
+                    continue
+                yield idx, LazyWord.from_jsonl_text(line) if lazy else WordDecoder.decode(item, engine)
+            except Exception as ex:  # pylint: disable=W0718
+                yield idx, ex
+
+    @staticmethod
+    def iter_jsonl_file(
         fullname: Path,
         predicate: Callable[[Word], bool] | None = None,
-    ) -> list[Word]:
-        """Read `Word` entries from a JSONL file."""
+        *,
+        engine: DecoderEngine = DecoderEngine.FAST,
+        lazy: bool = False,
+        errors: bool = False,
+        load_filter: VocabFilter | None = None,
+    ) -> Iterator[Word | VocabLineError]:
+        """
+        Read `Word` entries from a JSONL file one at a time.
+
+        The file is read line by line, so memory use does not depend on the
+        size of the file.
+
+        Parameters
+        ----------
+        fullname:
+            The JSONL file.
+        predicate:
+            A function that takes a `Word` and returns `True` if it should
+            be yielded. When `None`, all entries are yielded.
+        engine:
+            The decoder engine (default ``DecoderEngine.FAST``).
+        lazy:
+            When `True`, the entries are `LazyWord` items.
+        errors:
+            When `True`, a `VocabLineError` is yielded for each line that
+            cannot be read. When `False` (default), the error is printed.
+        load_filter:
+            Only the entries that match the filter are decoded (see
+            :class:`VocabFilter`). Lines that do not match are skipped, and
+            errors in them are not reported.
+
+        Returns
+        -------
+        Iterator[Word | VocabLineError]
+            The `Word` entries (and errors) in file order.
+        """
 
         assert isinstance(fullname, Path), type(fullname)
         assert fullname.exists(), fullname
         if predicate is not None:
             assert callable(predicate), type(predicate)
+        assert isinstance(engine, DecoderEngine), type(engine)
+        assert isinstance(errors, bool), type(errors)
+        if load_filter is not None:
+            assert isinstance(load_filter, VocabFilter), type(load_filter)
+
+        with open(fullname, "r", encoding="utf-8") as f:
+            for idx, item in Vocab._decode_lines(f, engine=engine, lazy=lazy, load_filter=load_filter):
+                if isinstance(item, Word):
+                    try:
+                        if predicate is None or predicate(item):
+                            yield item
+                        continue
+                    except Exception as ex:  # pylint: disable=W0718
+                        item = ex
+
+                error = VocabLineError(fullname=fullname, line=idx, error=item)
+                if errors:
+                    yield error
+                else:
+                    print(f"[ERROR] {error}.")
+
+    @staticmethod
+    def read_jsonl_file(
+        fullname: Path,
+        predicate: Callable[[Word], bool] | None = None,
+        *,
+        engine: DecoderEngine = DecoderEngine.FAST,
+        lazy: bool = False,
+        load_filter: VocabFilter | None = None,
+    ) -> list[Word]:
+        """Read `Word` entries from a JSONL file.
+
+        Errors are printed. See :meth:`iter_jsonl_file`.
+        """
+
+        return list(
+            Vocab.iter_jsonl_file(fullname, predicate, engine=engine, lazy=lazy, load_filter=load_filter)  # type: ignore
+        )
+
+    @staticmethod
+    def _get_chunks(fullname: Path, chunk_size: int) -> list[tuple[int, int]]:
+        """Split a file into byte ranges of about `chunk_size` that end at a line end."""
+
+        result: list[tuple[int, int]] = []
+
+        size = fullname.stat().st_size
+        start = 0
+        with open(fullname, "rb") as f:
+            while start < size:
+                f.seek(min(start + chunk_size, size))
+                f.readline()
+                end = f.tell()
+                result.append((start, end))
+                start = end
+
+        return result
+
+    @staticmethod
+    def _read_jsonl_chunk(
+        fullname: Path,
+        start: int,
+        end: int,
+        engine: DecoderEngine,
+        lazy: bool,
+        load_filter: VocabFilter | None = None,
+    ) -> tuple[list[Word], int, list[tuple[int, str]]]:
+        """
+        Read the `Word` entries in a byte range of a JSONL file.
+
+        Runs in a worker process.
+
+        Returns
+        -------
+        tuple[list[Word], int, list[tuple[int, str]]]
+            The words, the number of lines, and the errors as tuples of
+            1-based line number in the chunk and error message.
+        """
+
+        with open(fullname, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+
+        words: list[Word] = []
+        errors: list[tuple[int, str]] = []
+
+        lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").readlines()
+        for idx, item in Vocab._decode_lines(lines, engine=engine, lazy=lazy, load_filter=load_filter):
+            if isinstance(item, Word):
+                words.append(item)
+            else:
+                errors.append((idx, str(item)))
+
+        return words, len(lines), errors
+
+    @staticmethod
+    def _read_jsonl_files_parallel(
+        files: list[Path],
+        *,
+        workers: int,
+        use_snapshot: bool,
+        engine: DecoderEngine,
+        lazy: bool,
+        load_filter: VocabFilter | None = None,
+    ) -> list[Word]:
+        """Read the `Word` entries of `files` in a process pool, in file order."""
 
         result: list[Word] = []
 
-        with open(fullname, "r", encoding="utf-8") as f:
-            for idx, line in enumerate(f, 1):
-                line = line.strip()
-                try:
-                    word = Vocab.read_jsonl_text(line)
-                    if predicate is not None and predicate(word):
-                        result.append(word)
-                except Exception as ex:  # pylint: disable=W0718
-                    print(f"[ERROR] {fullname}[#{idx}]: '{ex}'.")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Submit all chunks first, then collect the results in file order.
+            parts: list[tuple[Path, list[Word], list[Future]]] = []
+            for file in files:
+                words = VocabSnapshot.read(file) if use_snapshot else None
+                if words is not None:
+                    if load_filter is not None:
+                        words = [word for word in words if load_filter.matches(word)]
+                    parts.append((file, words, []))
+                    continue
+
+                futures = [
+                    executor.submit(Vocab._read_jsonl_chunk, file, start, end, engine, lazy, load_filter)
+                    for start, end in Vocab._get_chunks(file, Vocab.PARALLEL_CHUNK_SIZE)
+                ]
+                parts.append((file, [], futures))
+
+            for file, words, futures in parts:
+                result.extend(words)
+
+                offset = 0
+                for future in futures:
+                    words, count, errors = future.result()
+                    for idx, message in errors:
+                        print(f"[ERROR] {file}[#{offset + idx}]: '{message}'.")
+                    result.extend(words)
+                    offset += count
 
         return result
 
@@ -164,12 +652,174 @@ class Vocab:
         """Return a word by its index."""
         return self._items[index]
 
+    def _get_indexes(
+        self,
+    ) -> list[
+        VocabIndex
+        | VocabPrefixIndex
+        | VocabTrie
+        | VocabNgramIndex
+        | VocabBkTree
+        | VocabDeleteIndex
+        | VocabPhoneticIndex
+        | VocabFieldIndex
+        | VocabTextIndex
+        | VocabAlternativeIndex
+    ]:
+        """Return the indexes that are built."""
+
+        indexes = (
+            self._index,
+            self._prefix_index,
+            self._trie,
+            self._ngram_index,
+            self._bk_tree,
+            self._delete_index,
+            self._phonetic_index,
+            self._field_index,
+            self._text_index,
+            self._alternative_index,
+        )
+        return [index for index in indexes if index is not None]
+
+    def _added(self, word: Word) -> None:
+        """Update the indexes after `word` was appended."""
+
+        self._generation += 1
+        for index in self._get_indexes():
+            index.add(word)
+
+    def _inserted(self, word: Word, position: int) -> None:
+        """Update the indexes after `word` was put at `position` in the middle of the items."""
+
+        self._generation += 1
+        for index in self._get_indexes():
+            index.insert(word, self._items, position)
+
+    def _removed(self, word: Word, words: Sequence[Word], position: int) -> None:
+        """Update the indexes after `word` was removed from `position` of `words`.
+
+        The items of `words` before `position` must not have changed; they
+        tell which copy of `word` was removed when the same object is in the
+        vocabulary more than once.
+        """
+
+        self._generation += 1
+        for index in self._get_indexes():
+            index.remove(word, words, position)
+
+    def _invalidate(self, *, order_only: bool = False) -> None:
+        """Drop the indexes; they are built again when they are needed.
+
+        When `order_only` is `True`, only the indexes that depend on the
+        order of the items are dropped.
+        """
+
+        self._generation += 1
+        self._index = None
+        self._prefix_index = None
+        self._trie = None
+        self._bk_tree = None
+        self._field_index = None
+        self._alternative_index = None
+        if order_only:
+            return
+
+        self._ngram_index = None
+        self._delete_index = None
+        self._phonetic_index = None
+        self._text_index = None
+
+    @property
+    def generation(self) -> int:
+        """Return a counter that changes whenever the items change (added, removed, replaced or sorted)."""
+
+        return self._generation
+
+    def _query(self, key: tuple, compute: Callable[[], list[Word]]) -> list[Word]:
+        """Return the result of a query from the query cache, or compute it with `compute`."""
+
+        cache = self._query_cache
+        if cache is None:
+            return compute()
+
+        result = cache.get(key, self._generation)
+        if result is None:
+            result = tuple(compute())
+            cache.put(key, self._generation, result)
+
+        return list(result)
+
+    def query_cache_info(self) -> VocabQueryCacheInfo | None:
+        """
+        Return the hit and miss statistics of the query cache, or `None`
+        if the vocabulary has no query cache (see `query_cache_size`).
+        """
+
+        return self._query_cache.info() if self._query_cache is not None else None
+
+    def clear_query_cache(self) -> None:
+        """Remove all entries from the query cache and reset its statistics."""
+
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
+    def _get_index(self) -> VocabIndex:
+        if self._index is None:
+            self._index = VocabIndex(self._items)
+
+        return self._index
+
+    def _get_bk_tree(self) -> VocabBkTree:
+        if self._bk_tree is None:
+            self._bk_tree = VocabBkTree(self._items)
+
+        return self._bk_tree
+
+    def _get_alternative_index(self) -> VocabAlternativeIndex:
+        if self._alternative_index is None:
+            self._alternative_index = VocabAlternativeIndex(self._items)
+
+        return self._alternative_index
+
+    def _get_field_index(self) -> VocabFieldIndex:
+        if self._field_index is None:
+            self._field_index = VocabFieldIndex(self._items)
+
+        return self._field_index
+
+    def _get_prefix_index(self) -> VocabPrefixIndex:
+        if self._prefix_index is None:
+            self._prefix_index = VocabPrefixIndex(self._items)
+
+        return self._prefix_index
+
+    def _get_positions(self) -> dict[str, list[int]]:
+        """Return the positions of the items by name (case-sensitive), in vocabulary order."""
+
+        result: dict[str, list[int]] = {}
+        for position, item in enumerate(self._items):
+            bucket = result.get(item.name)
+            if bucket is None:
+                result[item.name] = [position]
+            else:
+                bucket.append(position)
+
+        return result
+
+    def _get_items(self, positions: Iterable[int]) -> list[Word]:
+        """Return the items at `positions` in vocabulary order."""
+
+        items = self._items
+        return [items[position] for position in sorted(positions)]
+
     def append(self, word: Word) -> None:
         """Add a single `Word` item to the vocabulary."""
 
-        assert isinstance(word, Word), type(word)
+        assert isinstance(word, Vocab._word_types), type(word)
 
         self._items.append(word)
+        self._added(word)
 
     def extend(self, words: list[Word]) -> None:
         """Add multiple `Word` items to the vocabulary."""
@@ -177,18 +827,22 @@ class Vocab:
         assert isinstance(words, list), type(words)
 
         self._items.extend(words)
+        for word in words:
+            self._added(word)
 
     def remove(self, word: Word) -> None:
         """Remove a `Word` item from the vocabulary by object."""
 
-        assert isinstance(word, Word), type(word)
+        assert isinstance(word, Vocab._word_types), type(word)
 
-        self._items.remove(word)
+        index = self._items.index(word)
+        self._removed(self._items.pop(index), self._items, index)
 
     def clear(self) -> Vocab:
         """Remove all `Word` items from the vocabulary."""
 
         self._items.clear()
+        self._invalidate()
         return self
 
     def replace(self, existing: Word, replacement: Word) -> None:
@@ -208,23 +862,32 @@ class Vocab:
             If *existing* is not found in the vocabulary.
         """
 
-        assert isinstance(existing, Word), type(existing)
-        assert isinstance(replacement, Word), type(replacement)
+        assert isinstance(existing, Vocab._word_types), type(existing)
+        assert isinstance(replacement, Vocab._word_types), type(replacement)
 
         index = self._items.index(existing)
+        self._removed(self._items[index], self._items, index)
         self._items[index] = replacement
+        self._inserted(replacement, index)
 
     def pop(self, index: int = -1) -> Word:
         """Remove and return a `Word` item from the vocabulary by its index."""
 
-        return self._items.pop(index)
+        position = index if index >= 0 else index + len(self._items)
+        result = self._items.pop(index)
+        self._removed(result, self._items, position)
+
+        return result
 
     def find(self, value: str) -> list[Word]:
         """
         Search for words in the vocabulary by name.
 
         The search is case-insensitive and returns all words whose name
-        exactly matches the specified string.
+        exactly matches the specified string. The first search builds a
+        name index (see :class:`VocabIndex`), so later searches do not scan
+        the vocabulary. The result is cached when the vocabulary has a
+        query cache.
 
         Parameters
         ----------
@@ -239,13 +902,118 @@ class Vocab:
 
         assert isinstance(value, str), type(value)
 
-        search_term = value.lower()
-        return [item for item in self._items if search_term == item.name.lower()]
+        if self._query_cache is None:
+            # The index lookup is cheap; do not make a closure for it.
+            return self._get_index().get(value)
+
+        return self._query(("find", value), lambda: self._get_index().get(value))
+
+    def find_many(self, values: Iterable[str]) -> list[list[Word]]:
+        """
+        Search for words by name for each of several strings (see
+        :meth:`find`).
+
+        Each distinct name (case-insensitive) is looked up once.
+
+        Parameters
+        ----------
+        values:
+            The strings to search for.
+
+        Returns
+        -------
+        list[list[Word]]
+            The matching `Word` objects of each string, in the order of
+            `values`.
+        """
+
+        values = list(values)
+        assert all(isinstance(value, str) for value in values), values
+
+        index = self._get_index()
+        keys = [VocabIndex.get_key(value) for value in values]
+        results = {key: index.get(key) for key in set(keys)}
+        return [list(results[key]) for key in keys]
+
+    def prefix(self, value: str, limit: int | None = None) -> list[Word]:
+        """
+        Search for words in the vocabulary whose name starts with a prefix.
+
+        The search is case-insensitive. The first search builds a sorted
+        prefix index (see :class:`VocabPrefixIndex`); later searches are a
+        binary search and do not scan the vocabulary.
+
+        Parameters
+        ----------
+        value:
+            The prefix. An empty prefix matches all words.
+        limit:
+            The maximum number of words to return. When `None` (default),
+            all matching words are returned.
+
+        Returns
+        -------
+        list[Word]
+            The matching `Word` objects, sorted alphabetically.
+        """
+
+        assert isinstance(value, str), type(value)
+        if limit is not None:
+            assert isinstance(limit, int) and limit >= 0, limit
+
+        return self._get_prefix_index().prefix(value, limit)
+
+    def complete(
+        self,
+        value: str,
+        limit: int = VocabTrie.SIZE_DEFAULT,
+        *,
+        rank: Callable[[Word], object] | None = None,
+    ) -> list[Word]:
+        """
+        Return the best completions of a prefix (autocomplete).
+
+        The first call builds a trie (see :class:`VocabTrie`). A call takes
+        time in proportion to the length of `value` and `limit`.
+
+        Parameters
+        ----------
+        value:
+            The prefix (case-insensitive). Names with several words (for
+            example "abort button") are completed like other names.
+        limit:
+            The maximum number of words to return (default
+            ``VocabTrie.SIZE_DEFAULT``).
+        rank:
+            The ranking key function; words with a smaller key rank higher.
+            When `None`, approved words rank before unknown and rejected
+            words, and then words are sorted by name (see
+            :meth:`VocabTrie.default_rank`). A different `rank` builds a new
+            trie.
+
+        Returns
+        -------
+        list[Word]
+            The matching `Word` objects in rank order.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(limit, int) and limit >= 0, limit
+        if rank is None:
+            rank = VocabTrie.default_rank
+        assert callable(rank), type(rank)
+
+        if self._trie is None or self._trie.rank != rank:
+            self._trie = VocabTrie(self._items, rank=rank)
+
+        return self._trie.complete(value, limit)
 
     def match(self, pattern: str) -> list[Word]:
         """
         Search for words in the vocabulary using a regular expression.
 
+        The result is cached when the vocabulary has a query cache.
+
         Parameters
         ----------
         pattern:
@@ -259,20 +1027,64 @@ class Vocab:
 
         assert isinstance(pattern, str), type(pattern)
 
+        return self._query(("match", pattern), lambda: self._match(pattern))
+
+    def _match(self, pattern: str) -> list[Word]:
         regex = re.compile(pattern, re.IGNORECASE)
         return [item for item in self._items if regex.search(item.name)]
 
+    def match_many(self, patterns: Iterable[str]) -> list[list[Word]]:
+        """
+        Search for words with each of several regular expressions (see
+        :meth:`match`).
+
+        Each distinct pattern is compiled once, and is only searched in
+        the distinct names of the vocabulary.
+
+        Parameters
+        ----------
+        patterns:
+            The regular expression patterns to match against word names.
+
+        Returns
+        -------
+        list[list[Word]]
+            The matching `Word` objects of each pattern in vocabulary
+            order, in the order of `patterns`.
+        """
+
+        patterns = list(patterns)
+        assert all(isinstance(pattern, str) for pattern in patterns), patterns
+
+        names = self._get_positions()
+        results: dict[str, list[Word]] = {}
+        for pattern in dict.fromkeys(patterns):
+            regex = re.compile(pattern, re.IGNORECASE)
+            found = [positions for name, positions in names.items() if regex.search(name)]
+            results[pattern] = self._get_items(position for positions in found for position in positions)
+
+        return [list(results[pattern]) for pattern in patterns]
+
     def similar(
         self,
         value: str,
         *,
         n: int = DIFFLIB_N_DEFAULT,
         cutoff: float = DIFFLIB_CUTOFF_DEFAULT,
+        use_index: bool = False,
     ) -> list[Word]:
         """
         Search for words in the vocabulary similar to a given string using
         :func:`difflib.get_close_matches`.
 
+        With the trigram index (see :class:`VocabNgramIndex`), only the
+        names that share enough trigrams with *value* are scored. This is
+        much faster for large vocabularies, but it is a heuristic: a name
+        that shares few trigrams can be missing from the result, even if
+        it reaches *cutoff*. So the index is only used when it is asked
+        for. The words are returned in vocabulary order. The result is
+        cached when the vocabulary has a query cache.
+
         Parameters
         ----------
         value:
@@ -282,6 +1094,9 @@ class Vocab:
         cutoff:
             Similarity threshold in the range ``[0, 1]``. Candidates scoring
             below this value are excluded (default ``DIFFLIB_CUTOFF_DEFAULT`).
+        use_index:
+            When `True`, use the trigram index (it is built on first use).
+            When `False` (default), score all names.
 
         Returns
         -------
@@ -292,20 +1107,495 @@ class Vocab:
         assert isinstance(value, str), type(value)
         assert isinstance(n, int) and n > 0, n
         assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
+        assert isinstance(use_index, bool), type(use_index)
+
+        return self._query(
+            ("similar", value, n, cutoff, use_index),
+            lambda: self._similar(value, n, cutoff, use_index),
+        )
+
+    def _similar(self, value: str, n: int, cutoff: float, use_index: bool) -> list[Word]:
+        if use_index:
+            if self._ngram_index is None:
+                self._ngram_index = VocabNgramIndex(self._items)
+            matches = self._ngram_index.similar(value, n, cutoff)
+        else:
+            names = [item.name for item in self._items]
+            matches = difflib.get_close_matches(value, names, n=n, cutoff=cutoff)
+
+        found = set(matches)
+        return [item for item in self._items if item.name in found]
+
+    def similar_many(
+        self,
+        values: Iterable[str],
+        *,
+        n: int = DIFFLIB_N_DEFAULT,
+        cutoff: float = DIFFLIB_CUTOFF_DEFAULT,
+        use_index: bool = False,
+    ) -> list[list[Word]]:
+        """
+        Search for words similar to each of several strings (see
+        :meth:`similar`).
+
+        Each distinct string is searched once. Without the trigram index,
+        the distinct names of the vocabulary are collected once for all
+        strings, and each name is scored once per string. The results are
+        the same as with :meth:`similar`.
+
+        Parameters
+        ----------
+        values:
+            The strings to search for.
+        n:
+            Maximum number of close matches per string (default
+            ``DIFFLIB_N_DEFAULT``).
+        cutoff:
+            Similarity threshold in the range ``[0, 1]`` (default
+            ``DIFFLIB_CUTOFF_DEFAULT``).
+        use_index:
+            Use the trigram index, see :meth:`similar`.
+
+        Returns
+        -------
+        list[list[Word]]
+            The matching `Word` objects of each string, in the order of
+            `values`.
+        """
+
+        values = list(values)
+        assert all(isinstance(value, str) for value in values), values
+        assert isinstance(n, int) and n > 0, n
+        assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
+        assert isinstance(use_index, bool), type(use_index)
+
+        results: dict[str, list[Word]] = {}
+        if use_index:
+            for value in dict.fromkeys(values):
+                results[value] = self.similar(value, n=n, cutoff=cutoff, use_index=True)
+            return [list(results[value]) for value in values]
+
+        names = self._get_positions()
+        for value in dict.fromkeys(values):
+            # Same selection as `difflib.get_close_matches` over the names
+            # of all items: a name counts once per item.
+            candidates: list[tuple[float, str]] = []
+            for name, score in Vocab._get_scores(value, names, cutoff):
+                candidates.extend([(score, name)] * len(names[name]))
+            found = {name for _, name in heapq.nlargest(n, candidates)}
+            results[value] = self._get_items(position for name in found for position in names[name])
+
+        return [list(results[value]) for value in values]
+
+    @staticmethod
+    def _get_ratio(matcher: difflib.SequenceMatcher, table: dict[int, None], name: str, cutoff: float) -> float | None:
+        """
+        Return the similarity of `name` to the search value of `matcher`
+        (its `seq2`), or `None` if it is below `cutoff`.
+
+        The result is the same as with :func:`difflib.get_close_matches`.
+        Before `quick_ratio` and the ratio are computed, two cheaper upper
+        bounds are checked: the lengths, and the number of characters of
+        `name` that occur in the search value (`table` deletes them).
+        """
+
+        size = len(matcher.b)
+        total = size + len(name)
+        if total:
+            if 2.0 * min(size, len(name)) / total < cutoff:
+                return None
+            common = len(name) - len(name.translate(table))
+            if 2.0 * min(size, common) / total < cutoff:
+                return None
+
+        matcher.set_seq1(name)
+        if matcher.quick_ratio() < cutoff:
+            return None
+
+        result = matcher.ratio()
+        return result if result >= cutoff else None
+
+    @staticmethod
+    def _get_scores(value: str, names: Iterable[str], cutoff: float) -> Iterator[tuple[str, float]]:
+        """Yield the names that reach `cutoff` with their similarity to `value` (like `get_close_matches`)."""
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(value)
+        table = dict.fromkeys(map(ord, value))
+        for name in names:
+            score = Vocab._get_ratio(matcher, table, name, cutoff)
+            if score is not None:
+                yield name, score
+
+    def similar_scored(
+        self,
+        value: str,
+        *,
+        n: int = DIFFLIB_N_DEFAULT,
+        cutoff: float = DIFFLIB_CUTOFF_DEFAULT,
+        use_index: bool = False,
+    ) -> list[tuple[Word, float]]:
+        """
+        Search for words in the vocabulary similar to a given string and
+        return them with their similarity score, best match first.
+
+        The score is the :meth:`difflib.SequenceMatcher.ratio` of the name
+        and *value*, as in :meth:`similar`. Each distinct name is scored
+        once; words with the same name have the same score and are returned
+        together, in vocabulary order. Only the best *n* names are kept (a
+        bounded heap), so *n* limits the number of names, not of words.
+        Names with the same score are in vocabulary order.
+
+        Parameters
+        ----------
+        value:
+            The search term.
+        n:
+            Maximum number of distinct names to return (default
+            ``DIFFLIB_N_DEFAULT``).
+        cutoff:
+            Similarity threshold in the range ``[0, 1]`` (default
+            ``DIFFLIB_CUTOFF_DEFAULT``).
+        use_index:
+            Use the trigram index, see :meth:`similar`.
+
+        Returns
+        -------
+        list[tuple[Word, float]]
+            The matching words and their scores, best score first.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(n, int) and n > 0, n
+        assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
+        assert isinstance(use_index, bool), type(use_index)
 
-        names = [item.name for item in self._items]
-        matches = difflib.get_close_matches(value, names, n=n, cutoff=cutoff)
-        return [item for item in self._items if item.name in matches]
+        if use_index:
+            if self._ngram_index is None:
+                self._ngram_index = VocabNgramIndex(self._items)
+            candidates: set[str] | None = set(self._ngram_index.get_candidates(value, cutoff))
+        else:
+            candidates = None
+
+        # Collect the names in vocabulary order, so that names with the
+        # same score are in vocabulary order with and without the index.
+        groups: dict[str, list[Word]] = {}
+        for item in self._items:
+            if candidates is not None and item.name not in candidates:
+                continue
+            group = groups.get(item.name)
+            if group is None:
+                groups[item.name] = [item]
+            else:
+                group.append(item)
+
+        scores = heapq.nlargest(n, Vocab._get_scores(value, groups, cutoff), key=lambda item: item[1])
+        return [(item, score) for name, score in scores for item in groups[name]]
+
+    def within_distance(
+        self,
+        value: str,
+        k: int,
+        *,
+        metric: EditDistance = EditDistance.LEVENSHTEIN,
+    ) -> list[tuple[Word, int]]:
+        """
+        Search for words whose name is within edit distance `k` of a given
+        string (case-insensitive).
+
+        The first call builds a BK-tree (see :class:`VocabBkTree`), so a
+        search only compares `value` with a part of the names.
+
+        Parameters
+        ----------
+        value:
+            The search term.
+        k:
+            The maximum edit distance.
+        metric:
+            The edit distance (default ``EditDistance.LEVENSHTEIN``).
+
+        Returns
+        -------
+        list[tuple[Word, int]]
+            The matching words and their distance, closest first. Names
+            with the same distance are sorted by name; words with the same
+            name are together, in vocabulary order.
+        """
 
-    def examine(self, value: str, *, cutoff: float = DIFFLIB_CUTOFF_DEFAULT) -> list[Word]:
+        return self._get_bk_tree().within_distance(value, k, metric)
+
+    def nearest(
+        self,
+        value: str,
+        n: int = DIFFLIB_N_DEFAULT,
+        *,
+        metric: EditDistance = EditDistance.LEVENSHTEIN,
+        max_distance: int | None = None,
+    ) -> list[tuple[Word, int]]:
+        """
+        Search for the words whose name has the smallest edit distance to
+        a given string (case-insensitive).
+
+        The first call builds a BK-tree (see :class:`VocabBkTree`).
+
+        Parameters
+        ----------
+        value:
+            The search term.
+        n:
+            The number of names to return (default ``DIFFLIB_N_DEFAULT``).
+            Words with the same name count once.
+        metric:
+            The edit distance (default ``EditDistance.LEVENSHTEIN``).
+        max_distance:
+            When set, names that are farther away are not returned.
+
+        Returns
+        -------
+        list[tuple[Word, int]]
+            The matching words and their distance, closest first.
+        """
+
+        return self._get_bk_tree().nearest(value, n, metric, max_distance)
+
+    def build_delete_index(
+        self,
+        *,
+        max_distance: int = VocabDeleteIndex.MAX_DISTANCE_DEFAULT,
+        prefix_length: int = VocabDeleteIndex.PREFIX_LENGTH_DEFAULT,
+        index: Path | None = None,
+    ) -> VocabDeleteIndex:
+        """
+        Build the deletion index that :meth:`suggest` uses, or load it from
+        a persisted index.
+
+        :meth:`suggest` builds the index with the default settings when it
+        is called first; call this method before to use other settings or a
+        persisted index. The parameters are the same as for
+        :class:`VocabDeleteIndex`.
+
+        Returns
+        -------
+        VocabDeleteIndex
+            The index; use :meth:`VocabDeleteIndex.save_index` to persist it.
+        """
+
+        self._delete_index = VocabDeleteIndex(
+            self._items,
+            max_distance=max_distance,
+            prefix_length=prefix_length,
+            index=index,
+        )
+
+        return self._delete_index
+
+    def suggest(
+        self,
+        value: str,
+        max_distance: int | None = None,
+        *,
+        metric: EditDistance = EditDistance.DAMERAU,
+    ) -> list[tuple[Word, int]]:
+        """
+        Suggest words for a misspelled name with a symmetric delete index
+        (see :class:`VocabDeleteIndex`).
+
+        A lookup probes the index with the variants of *value* that have
+        up to *max_distance* characters deleted, and computes the edit
+        distance only of the names it finds. The first call builds the
+        index (see :meth:`build_delete_index`).
+
+        Parameters
+        ----------
+        value:
+            The search term (case-insensitive).
+        max_distance:
+            The maximum edit distance; at most the `max_distance` of the
+            index. When `None`, the `max_distance` of the index is used.
+        metric:
+            The edit distance (default ``EditDistance.DAMERAU``).
+
+        Returns
+        -------
+        list[tuple[Word, int]]
+            The matching words and their distance, closest first. Names
+            with the same distance are sorted by name; words with the same
+            name are together, in vocabulary order.
+        """
+
+        if self._delete_index is None:
+            self.build_delete_index()
+        assert self._delete_index is not None
+
+        index = self._get_index()
+        return [
+            (word, distance)
+            for key, distance in self._delete_index.lookup(value, max_distance, metric)
+            for word in index.get(key)
+        ]
+
+    def sounds_like(self, value: str) -> list[Word]:
+        """
+        Search for words whose name sounds like a given string.
+
+        The names are compared by their Metaphone key (see
+        :class:`Metaphone`), so "cauk" finds "caulk". The first call builds
+        a phonetic index (see :class:`VocabPhoneticIndex`); a search is a
+        dictionary lookup.
+
+        Parameters
+        ----------
+        value:
+            The search term.
+
+        Returns
+        -------
+        list[Word]
+            The matching `Word` objects, sorted by name; words with the
+            same name are in vocabulary order.
+        """
+
+        assert isinstance(value, str), type(value)
+
+        if self._phonetic_index is None:
+            self._phonetic_index = VocabPhoneticIndex(self._items)
+
+        index = self._get_index()
+        return [word for name in self._phonetic_index.get(value) for word in index.get(name)]
+
+    def alternatives(self, value: str) -> list[Word]:
+        """
+        Return the approved alternatives of a rejected word.
+
+        The first call builds an index from each rejected name to its
+        alternatives, and from each alternative name to the rejected words
+        that list it (see :class:`VocabAlternativeIndex`). A search is a
+        dictionary lookup.
+
+        Parameters
+        ----------
+        value:
+            The name of the rejected word (case-insensitive).
+
+        Returns
+        -------
+        list[Word]
+            The alternatives (from `Word.alternatives`) of all rejected
+            words with this name, without duplicate names, in vocabulary
+            order. An empty list if there is no rejected word with
+            alternatives by this name.
+        """
+
+        assert isinstance(value, str), type(value)
+
+        return self._get_alternative_index().get_alternatives(value)
+
+    def rejected_for(self, value: str) -> list[Word]:
+        """
+        Return the rejected words that list a word as their alternative.
+
+        This is the reverse of :meth:`alternatives`, and uses the same
+        index.
+
+        Parameters
+        ----------
+        value:
+            The name of the approved word (case-insensitive).
+
+        Returns
+        -------
+        list[Word]
+            The rejected `Word` objects whose alternatives include this
+            name, in vocabulary order.
+        """
+
+        assert isinstance(value, str), type(value)
+
+        return self._get_alternative_index().get_rejected(value)
+
+    def build_text_index(self, *, index: Path | None = None) -> VocabTextIndex:
+        """
+        Build the full-text index that :meth:`search_text` uses, or load it
+        from a persisted index.
+
+        :meth:`search_text` builds the index when it is called first; call
+        this method before to use a persisted index (see
+        :class:`VocabTextIndex`).
+
+        Returns
+        -------
+        VocabTextIndex
+            The index; use :meth:`VocabTextIndex.save_index` to persist it.
+        """
+
+        self._text_index = VocabTextIndex(self._items, index=index)
+
+        return self._text_index
+
+    def search_text(
+        self,
+        value: str,
+        limit: int = VocabTextIndex.SIZE_DEFAULT,
+        *,
+        status: WordStatus | None = None,
+    ) -> list[tuple[Word, float]]:
+        """
+        Search the meanings, examples and notes of the words for a text.
+
+        The texts are ranked with BM25 (see :class:`VocabTextIndex`), so
+        words whose texts contain more of the rarer tokens of *value* rank
+        higher. The first call builds the index (see
+        :meth:`build_text_index`).
+
+        Parameters
+        ----------
+        value:
+            The search text, for example "make something tight". The search
+            is case-insensitive and matches whole tokens.
+        limit:
+            The maximum number of words to return (default
+            ``VocabTextIndex.SIZE_DEFAULT``).
+        status:
+            When set, only words with this status are returned.
+
+        Returns
+        -------
+        list[tuple[Word, float]]
+            The matching words and their scores, best score first.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(limit, int) and limit >= 0, limit
+        if status is not None:
+            assert isinstance(status, WordStatus), type(status)
+
+        if self._text_index is None:
+            self.build_text_index()
+        assert self._text_index is not None
+
+        accept = (lambda word: word.status == status) if status is not None else None
+        return self._text_index.search(value, limit, accept)
+
+    def examine(
+        self,
+        value: str,
+        *,
+        cutoff: float = DIFFLIB_CUTOFF_DEFAULT,
+        phonetic: bool = False,
+    ) -> list[Word]:
         """
         Search for words in the vocabulary using both fuzzy matching and
         partial/substring matching.
 
         Combines the results of :meth:`similar` (fuzzy, via
         :func:`difflib.get_close_matches`) and :meth:`match` (regex
-        substring search), deduplicates, and returns the merged list
-        sorted alphabetically.
+        substring search), and optionally :meth:`sounds_like` (phonetic),
+        deduplicates, and returns the merged list sorted alphabetically.
+
+        Both criteria are computed in a single pass over the items; each
+        distinct name is scored, searched and lowercased once. The result
+        is cached when the vocabulary has a query cache.
 
         Parameters
         ----------
@@ -314,29 +1604,98 @@ class Vocab:
         cutoff:
             Similarity threshold passed to :meth:`similar`, in the range
             ``[0, 1]`` (default ``DIFFLIB_CUTOFF_DEFAULT``).
+        phonetic:
+            When `True`, also include the words that sound like *value*
+            (default `False`).
 
         Returns
         -------
         list[Word]
             A deduplicated, alphabetically sorted list of matching `Word`
-            objects.
+            objects. Words with the same name (case-insensitive) are in the
+            order fuzzy, partial, phonetic matches, and then in vocabulary
+            order.
         """
 
         assert isinstance(value, str), type(value)
         assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
+        assert isinstance(phonetic, bool), type(phonetic)
+
+        return self._query(("examine", value, cutoff, phonetic), lambda: self._examine(value, cutoff, phonetic))
+
+    def _examine(self, value: str, cutoff: float, phonetic: bool) -> list[Word]:
+        regex = re.compile(value, re.IGNORECASE)
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(value)
+        table = dict.fromkeys(map(ord, value))
+
+        # The state of a name: its score (or `None` below the cutoff), and
+        # if it matches the regex.
+        states: dict[str, tuple[float | None, bool]] = {}
+        candidates: list[tuple[float, str]] = []
+        hits: list[tuple[int, Word, bool]] = []
+        for position, item in enumerate(self._items):
+            name = item.name
+            state = states.get(name)
+            if state is None:
+                score = Vocab._get_ratio(matcher, table, name, cutoff)
+                state = states[name] = (score, regex.search(name) is not None)
+
+            score, partial = state
+            if score is not None:
+                candidates.append((score, name))
+                hits.append((position, item, partial))
+            elif partial:
+                hits.append((position, item, partial))
+
+        # Same selection as `difflib.get_close_matches` over all names.
+        fuzzy = {name for _, name in heapq.nlargest(Vocab.DIFFLIB_N_DEFAULT, candidates)}
+
+        entries: list[tuple[str, int, int, Word]] = []
+        seen: set[int] = set()
+        for position, item, partial in hits:
+            if item.name in fuzzy:
+                entries.append((VocabIndex.get_key(item.name), 0, position, item))
+            elif partial:
+                entries.append((VocabIndex.get_key(item.name), 1, position, item))
+            else:
+                continue
+            seen.add(id(item))
+
+        if phonetic:
+            for position, item in enumerate(self.sounds_like(value)):
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    entries.append((VocabIndex.get_key(item.name), 2, position, item))
+
+        entries.sort(key=lambda entry: entry[:3])
+        return [entry[3] for entry in entries]
+
+    def examine_many(
+        self,
+        values: Iterable[str],
+        *,
+        cutoff: float = DIFFLIB_CUTOFF_DEFAULT,
+        phonetic: bool = False,
+    ) -> list[list[Word]]:
+        """
+        Examine each of several strings (see :meth:`examine`).
 
-        fuzzy = self.similar(value, cutoff=cutoff)
-        partial = self.match(value)
+        Each distinct string is examined once.
 
-        seen: set[int] = set()
-        merged: list[Word] = []
-        for word in fuzzy + partial:
-            if id(word) not in seen:
-                seen.add(id(word))
-                merged.append(word)
+        Returns
+        -------
+        list[list[Word]]
+            The matching `Word` objects of each string, in the order of
+            `values`.
+        """
 
-        merged.sort(key=self._default_sort_key)
-        return merged
+        values = list(values)
+        assert all(isinstance(value, str) for value in values), values
+
+        results = {value: self.examine(value, cutoff=cutoff, phonetic=phonetic) for value in dict.fromkeys(values)}
+        return [list(results[value]) for value in values]
 
     def filter(self, predicate: Callable[[Word], bool]) -> list[Word]:
         """
@@ -358,9 +1717,280 @@ class Vocab:
 
         return [item for item in self._items if predicate(item)]
 
+    def where(
+        self,
+        *,
+        status: WordStatus | None = None,
+        type_: WordType | None = None,
+        category: WordCategory | None = None,
+        source: str | None = None,
+    ) -> list[Word]:
+        """
+        Search for words by their status, type, category and source.
+
+        The first search builds a secondary index of these fields (see
+        :class:`VocabFieldIndex`). A search only checks the words that
+        have the least common of the requested values; it does not scan
+        the vocabulary.
+
+        Parameters
+        ----------
+        status:
+            When set, only words with this status match.
+        type_:
+            When set, only words with this type match.
+        category:
+            When set, only words in this category match.
+        source:
+            When set, only words from this source match.
+
+        Returns
+        -------
+        list[Word]
+            The `Word` objects that match all set conditions, in vocabulary
+            order. Without conditions, all words are returned.
+        """
+
+        if status is not None:
+            assert isinstance(status, WordStatus), type(status)
+        if type_ is not None:
+            assert isinstance(type_, WordType), type(type_)
+        if category is not None:
+            assert isinstance(category, WordCategory), type(category)
+        if source is not None:
+            assert isinstance(source, str), type(source)
+
+        conditions = {
+            field: value
+            for field, value in zip(VocabFieldIndex.FIELDS, (status, type_, category, source))
+            if value is not None
+        }
+        if not conditions:
+            return list(self._items)
+
+        return self._get_field_index().where(conditions)
+
+    def _plan_query(
+        self, query: VocabQuery
+    ) -> tuple[VocabQueryPlan, Callable[[], Iterable[Word]], list[Callable[[Word], bool]]]:
+        """
+        Return the plan of a query, the function that reads its candidates,
+        and the filters for the conditions that the access path does not
+        cover.
+        """
+
+        # The access paths: (description, estimate, read, covered condition).
+        paths: list[tuple[str, int, Callable[[], Iterable[Word]], str | None]] = []
+
+        if query.names:
+            index = self._get_index()
+            keys = list(dict.fromkeys(map(VocabIndex.get_key, query.names)))
+            paths.append(
+                (
+                    f"name index ({', '.join(keys)})",
+                    sum(len(index.get(key)) for key in keys),
+                    lambda: [word for key in keys for word in index.get(key)],
+                    "names",
+                )
+            )
+
+        # A prefix that starts with another prefix matches nothing more.
+        prefixes = list(dict.fromkeys(map(VocabIndex.get_key, query.prefixes)))
+        prefixes = [
+            prefix for prefix in prefixes if not any(prefix.startswith(other) for other in prefixes if other != prefix)
+        ]
+        if prefixes:
+            prefix_index = self._get_prefix_index()
+            paths.append(
+                (
+                    f"prefix index ({', '.join(prefixes)})",
+                    sum(prefix_index.count(prefix) for prefix in prefixes),
+                    lambda: [word for prefix in prefixes for word in self._get_prefix_index().prefix(prefix)],
+                    "prefixes",
+                )
+            )
+
+        pattern_prefix = query.get_pattern_prefix()
+        if pattern_prefix is not None:
+            prefix_index = self._get_prefix_index()
+            paths.append(
+                (
+                    f"prefix index ({pattern_prefix}) of match",
+                    prefix_index.count(pattern_prefix),
+                    lambda: self._get_prefix_index().prefix(pattern_prefix),
+                    None,
+                )
+            )
+
+        for key, field, label in Vocab._QUERY_FIELDS:
+            values = tuple(dict.fromkeys(getattr(query, key)))
+            if values:
+                field_index = self._get_field_index()
+                paths.append(
+                    (
+                        f"{label} postings ({', '.join(values)})",
+                        sum(field_index.count(field, value) for value in values),
+                        lambda field=field, values=values: [  # type: ignore
+                            word for value in values for word in field_index.get(field, value)
+                        ],
+                        key,
+                    )
+                )
+
+        paths.append(("scan", len(self._items), lambda: self._items, None))
+
+        access, estimate, read, covered = min(paths, key=lambda path: path[1])
+
+        filters: list[tuple[str, Callable[[Word], bool]]] = []
+        for key, field, label in Vocab._QUERY_FIELDS:
+            values = tuple(dict.fromkeys(getattr(query, key)))
+            if values and key != covered:
+                filters.append((f"{label} in ({', '.join(values)})", Vocab._get_field_filter(field, values)))
+        if query.names and covered != "names":
+            keys = set(map(VocabIndex.get_key, query.names))
+            filters.append((f"name in ({', '.join(sorted(keys))})", lambda word: VocabIndex.get_key(word.name) in keys))
+        if prefixes and covered != "prefixes":
+            starts = tuple(prefixes)
+            filters.append(
+                (
+                    f"name starts with ({', '.join(starts)})",
+                    lambda word: VocabIndex.get_key(word.name).startswith(starts),
+                )
+            )
+        if query.pattern is not None:
+            regex = re.compile(query.pattern, re.IGNORECASE)
+            filters.append((f"name matches {query.pattern}", lambda word: regex.search(word.name) is not None))
+        if query.similar is not None:
+            filters.append(
+                (
+                    f"name similar to {query.similar} (cutoff {query.cutoff})",
+                    Vocab._get_similar_filter(query.similar, query.cutoff),
+                )
+            )
+
+        plan = VocabQueryPlan(
+            query=query,
+            access=access,
+            estimate=estimate,
+            alternatives=tuple((path[0], path[1]) for path in paths),
+            filters=tuple(description for description, _ in filters),
+        )
+        return plan, read, [predicate for _, predicate in filters]
+
+    @staticmethod
+    def _get_field_filter(field: str, values: tuple) -> Callable[[Word], bool]:
+        """Return a filter that checks if the `field` of a word is one of `values`."""
+
+        accepted = set(values)
+        getter = attrgetter(field)
+        return lambda word: getter(word) in accepted
+
+    @staticmethod
+    def _get_similar_filter(value: str, cutoff: float) -> Callable[[Word], bool]:
+        """Return a filter that checks if the name of a word is similar to `value` (each name is scored once)."""
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(value)
+        table = dict.fromkeys(map(ord, value))
+        results: dict[str, bool] = {}
+
+        def _filter(word: Word) -> bool:
+            result = results.get(word.name)
+            if result is None:
+                result = results[word.name] = Vocab._get_ratio(matcher, table, word.name, cutoff) is not None
+            return result
+
+        return _filter
+
+    def explain(self, query: VocabQuery | str) -> VocabQueryPlan:
+        """
+        Return the plan of a query without running it.
+
+        Parameters
+        ----------
+        query:
+            The query, or its text (see :meth:`VocabQuery.parse`).
+
+        Returns
+        -------
+        VocabQueryPlan
+            The plan; ``str(plan)`` describes the access path, the access
+            paths that were considered, and the filters.
+        """
+
+        if isinstance(query, str):
+            query = VocabQuery.parse(query)
+        assert isinstance(query, VocabQuery), type(query)
+
+        return self._plan_query(query)[0]
+
+    def query(self, query: VocabQuery | str) -> list[Word]:
+        """
+        Search for words with a query (see :class:`VocabQuery`).
+
+        The query is planned first (see :meth:`explain`): the candidates
+        are read from the access path with the smallest estimated number
+        of items (the name index, the prefix index, the field postings
+        (see :meth:`where`), or a scan), and the other conditions are
+        checked for each candidate. A `similar` condition is always checked
+        as a filter, so no similar name is missed. The result is cached when the vocabulary has a query cache.
+
+        Parameters
+        ----------
+        query:
+            The query, or its text (see :meth:`VocabQuery.parse`), for
+            example ``"status:approved type:TN category:TN3,TN6 match:^hyd"``.
+
+        Returns
+        -------
+        list[Word]
+            The matching `Word` objects, sorted by name (case-insensitive);
+            words with the same name are in vocabulary order.
+
+        Raises
+        ------
+        ValueError
+            If the text is not a valid query.
+        """
+
+        if isinstance(query, str):
+            query = VocabQuery.parse(query)
+        assert isinstance(query, VocabQuery), type(query)
+
+        return self._query(("query", query), lambda: self._run_query(query))
+
+    def _run_query(self, query: VocabQuery) -> list[Word]:
+        _, read, predicates = self._plan_query(query)
+
+        # The access paths do not return an item twice.
+        groups: dict[str, list[Word]] = {}
+        for word in read():
+            if all(predicate(word) for predicate in predicates):
+                groups.setdefault(VocabIndex.get_key(word.name), []).append(word)
+
+        index = self._get_index()
+        result: list[Word] = []
+        for key in sorted(groups):
+            group = groups[key]
+            if len(group) > 1:
+                rank = {id(word): position for position, word in enumerate(index.get(key))}
+                group.sort(key=lambda word: rank[id(word)])
+            result.extend(group)
+
+        return result
+
     def __delitem__(self, index: int) -> None:
         """Remove a `Word` item from the vocabulary by its index."""
+
+        if not isinstance(index, slice):
+            self.pop(index)
+            return
+
+        words = list(self._items)
         del self._items[index]
+        # From the end, so the items before each position are still indexed.
+        for position in sorted(range(*index.indices(len(words))), reverse=True):
+            self._removed(words[position], words, position)
 
     @staticmethod
     def _default_sort_key(word):
@@ -382,11 +2012,13 @@ class Vocab:
         assert isinstance(reverse, bool)
 
         self._items.sort(key=key, reverse=reverse)
+        self._invalidate(order_only=True)
 
     @staticmethod
     def _word_to_dict(word: Word) -> dict[str, object]:
         """
-        Change a `Word` dataclass to a dict that you can convert to JSON.
+        Change a `Word` (or `CompactWord`) dataclass to a dict that you can
+        convert to JSON.
         """
 
         def _convert(obj: object) -> object:
@@ -394,7 +2026,7 @@ class Vocab:
                 return obj.value
             if isinstance(obj, dict):
                 return {k: _convert(v) for k, v in obj.items()}
-            if isinstance(obj, list):
+            if isinstance(obj, (list, tuple)):
                 return [_convert(i) for i in obj]
             return obj
 
@@ -0,0 +1,162 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabAlternativeIndex class."""
+
+from __future__ import annotations
+from typing import Iterable, Sequence
+
+from .vocab_index import VocabIndex
+from .word import Word
+from .word_status import WordStatus
+
+
+class VocabAlternativeIndex:
+    """
+    A case-insensitive index of rejected `Word` items and their approved
+    alternatives, in both directions.
+
+    Only rejected items with alternatives are indexed. Each rejected name
+    maps to the alternatives of all items with that name, without
+    duplicate alternative names; the first alternative with a name is
+    kept. Each alternative name maps to the rejected items that list it.
+    Both lists are in the order of the items in the vocabulary. Items are
+    removed by identity, not by equality.
+
+    The alternatives are the `Word` objects in `Word.alternatives`, not
+    the items of the vocabulary with the same name: some alternatives
+    (for example "NOT SYMMETRICAL") are not items of the vocabulary.
+    """
+
+    _rejected: dict[str, list[Word]]
+    _alternatives: dict[str, list[Word]]
+    _referrers: dict[str, list[Word]]
+
+    def __init__(self, words: Iterable[Word] = ()) -> None:
+        self._rejected = {}
+        self._alternatives = {}
+        self._referrers = {}
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def is_indexed(word: Word) -> bool:
+        """Return `True` if `word` is a rejected item with alternatives."""
+
+        return word.status == WordStatus.REJECTED and bool(word.alternatives)
+
+    @staticmethod
+    def _get_alternative_keys(word: Word) -> list[str]:
+        return list(dict.fromkeys(VocabIndex.get_key(alternative.name) for alternative in word.alternatives))
+
+    def __len__(self) -> int:
+        """Return the number of rejected names."""
+        return len(self._rejected)
+
+    def get_alternatives(self, value: str) -> list[Word]:
+        """Return the alternatives of the rejected items whose name matches `value`."""
+
+        assert isinstance(value, str), type(value)
+
+        return list(self._alternatives.get(VocabIndex.get_key(value), ()))
+
+    def get_rejected(self, value: str) -> list[Word]:
+        """Return the rejected items that list an alternative whose name matches `value`."""
+
+        assert isinstance(value, str), type(value)
+
+        return list(self._referrers.get(VocabIndex.get_key(value), ()))
+
+    def _update_alternatives(self, key: str) -> None:
+        words = self._rejected.get(key)
+        if not words:
+            self._alternatives.pop(key, None)
+            return
+
+        result: dict[str, Word] = {}
+        for word in words:
+            for alternative in word.alternatives:
+                result.setdefault(VocabIndex.get_key(alternative.name), alternative)
+        self._alternatives[key] = list(result.values())
+
+    def add(self, word: Word) -> None:
+        """Add an item after the other items with the same name."""
+
+        if not VocabAlternativeIndex.is_indexed(word):
+            return
+
+        key = VocabIndex.get_key(word.name)
+        self._rejected.setdefault(key, []).append(word)
+        self._update_alternatives(key)
+        for alternative_key in VocabAlternativeIndex._get_alternative_keys(word):
+            self._referrers.setdefault(alternative_key, []).append(word)
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """
+        Add an item that is somewhere in the middle of the vocabulary.
+
+        `words` are the items of the vocabulary (including `word`). They
+        are scanned once to rebuild the lists that `word` is added to.
+        """
+
+        _ = position
+        if not VocabAlternativeIndex.is_indexed(word):
+            return
+
+        key = VocabIndex.get_key(word.name)
+        alternative_keys = VocabAlternativeIndex._get_alternative_keys(word)
+
+        rejected: list[Word] = []
+        referrers: dict[str, list[Word]] = {alternative_key: [] for alternative_key in alternative_keys}
+        for item in words:
+            if not VocabAlternativeIndex.is_indexed(item):
+                continue
+            if VocabIndex.get_key(item.name) == key:
+                rejected.append(item)
+            for alternative_key in VocabAlternativeIndex._get_alternative_keys(item):
+                if alternative_key in referrers:
+                    referrers[alternative_key].append(item)
+
+        self._rejected[key] = rejected
+        self._update_alternatives(key)
+        self._referrers.update(referrers)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove an item (by identity; see :meth:`VocabIndex.find_item`)."""
+
+        if not VocabAlternativeIndex.is_indexed(word):
+            return
+
+        key = VocabIndex.get_key(word.name)
+        rejected = self._rejected.get(key, [])
+        del rejected[VocabIndex.find_item(rejected, word, words, position)]
+        if not rejected:
+            del self._rejected[key]
+        self._update_alternatives(key)
+
+        for alternative_key in VocabAlternativeIndex._get_alternative_keys(word):
+            referrers = self._referrers.get(alternative_key, [])
+            del referrers[VocabIndex.find_item(referrers, word, words, position)]
+            if not referrers:
+                del self._referrers[alternative_key]
+
+    def clear(self) -> None:
+        """Remove all items."""
+
+        self._rejected.clear()
+        self._alternatives.clear()
+        self._referrers.clear()
@@ -0,0 +1,233 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabBkTree class."""
+
+from __future__ import annotations
+import heapq
+import math
+from typing import Iterable, Sequence
+
+from .edit_distance import EditDistance
+from .vocab_index import VocabIndex
+from .word import Word
+
+
+class _BkNode:
+    """A node of a `VocabBkTree`."""
+
+    __slots__ = ("key", "words", "children")
+
+    def __init__(self, key: str, word: Word) -> None:
+        self.key = key
+        self.words: list[Word] = [word]  # The words with this key, in vocabulary order.
+        self.children: dict[int, _BkNode] = {}  # The subtrees by their distance to `key`.
+
+
+class VocabBkTree:
+    """
+    A BK-tree (Burkhard-Keller tree) of `Word` items by name, for edit
+    distance queries.
+
+    The tree is built over the lowercase names (see
+    :meth:`VocabIndex.get_key`) with the Levenshtein distance. By the
+    triangle inequality, a query only visits the subtrees whose distance
+    to a node can be within the search radius.
+
+    The `DAMERAU` distance (optimal string alignment) is at least half the
+    Levenshtein distance, so it is searched with twice the radius and the
+    candidates are then checked with the `DAMERAU` distance.
+
+    A removed name stays in the tree until the tree is rebuilt; it is
+    skipped by the queries and reused when the name is added again.
+    """
+
+    _root: _BkNode | None
+    _nodes: dict[str, _BkNode]
+    _count: int
+
+    def __init__(self, words: Iterable[Word] = ()) -> None:
+        self._root = None
+        self._nodes = {}
+        self._count = 0
+
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        """Return the number of words."""
+        return self._count
+
+    def add(self, word: Word) -> None:
+        """Add a word after the other words with the same name."""
+
+        key = VocabIndex.get_key(word.name)
+        self._count += 1
+
+        node = self._nodes.get(key)
+        if node is not None:
+            node.words.append(word)
+            return
+
+        new = self._nodes[key] = _BkNode(key, word)
+        if self._root is None:
+            self._root = new
+            return
+
+        distance = EditDistance.LEVENSHTEIN.get_matcher(key)
+        node = self._root
+        while True:
+            edge = distance(node.key)
+            child = node.children.get(edge)
+            if child is None:
+                node.children[edge] = new
+                return
+            node = child
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """
+        Add a word that is somewhere in the middle of the vocabulary.
+
+        `words` are the items of the vocabulary (including `word`). They
+        are only scanned when there are other words with the same name,
+        to put `word` at the correct position.
+        """
+
+        _ = position
+        node = self._nodes.get(VocabIndex.get_key(word.name))
+        if node is None or not node.words:
+            self.add(word)
+            return
+
+        members = {id(item) for item in node.words}
+        members.add(id(word))
+        node.words = [item for item in words if id(item) in members]
+        self._count += 1
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove a word (by identity; see :meth:`VocabIndex.find_item`)."""
+
+        node = self._nodes.get(VocabIndex.get_key(word.name))
+        if node is None:
+            raise ValueError(word)
+
+        del node.words[VocabIndex.find_item(node.words, word, words, position)]
+
+        self._count -= 1
+
+    def clear(self) -> None:
+        """Remove all words."""
+
+        self._root = None
+        self._nodes.clear()
+        self._count = 0
+
+    def _search(self, value: str, k: float, n: int | None, metric: EditDistance) -> list[tuple[int, str]]:
+        """
+        Return the distance and key of the names within distance `k` of
+        `value`, closest first (names with the same distance by key).
+
+        When `n` is set, only the `n` closest names are returned, and the
+        radius shrinks to the distance of the `n`-th closest name found so
+        far.
+        """
+
+        if self._root is None:
+            return []
+
+        key = VocabIndex.get_key(value)
+        levenshtein = EditDistance.LEVENSHTEIN.get_matcher(key)
+        damerau = EditDistance.DAMERAU.get_matcher(key) if metric is EditDistance.DAMERAU else None
+        factor = 1 if damerau is None else 2
+
+        found: list[tuple[int, str]] = []
+        best: list[int] = []  # The negated distances of the `n` closest names.
+        radius = k
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            edge = levenshtein(node.key)
+            if node.words and edge <= factor * radius:
+                result = edge if damerau is None else damerau(node.key)
+                if result <= radius:
+                    found.append((result, node.key))
+                    if n is not None:
+                        heapq.heappush(best, -result)
+                        if len(best) > n:
+                            heapq.heappop(best)
+                        if len(best) == n:
+                            radius = -best[0]
+
+            limit = factor * radius
+            for child_edge, child in node.children.items():
+                if edge - limit <= child_edge <= edge + limit:
+                    pending.append(child)
+
+        found = sorted(item for item in found if item[0] <= radius)
+        return found if n is None else found[:n]
+
+    def within_distance(
+        self,
+        value: str,
+        k: int,
+        metric: EditDistance = EditDistance.LEVENSHTEIN,
+    ) -> list[tuple[Word, int]]:
+        """
+        Return the words whose name is within distance `k` of `value`
+        (case-insensitive), with their distance, closest first.
+
+        Names with the same distance are sorted by name; words with the
+        same name are together, in vocabulary order.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(k, int) and k >= 0, k
+        assert isinstance(metric, EditDistance), type(metric)
+
+        return [
+            (word, distance)
+            for distance, key in self._search(value, k, None, metric)
+            for word in self._nodes[key].words
+        ]
+
+    def nearest(
+        self,
+        value: str,
+        n: int,
+        metric: EditDistance = EditDistance.LEVENSHTEIN,
+        max_distance: int | None = None,
+    ) -> list[tuple[Word, int]]:
+        """
+        Return the words of the `n` names closest to `value`
+        (case-insensitive), with their distance, closest first.
+
+        `n` counts names, not words: words with the same name are together,
+        in vocabulary order. Names with the same distance are sorted by
+        name. When `max_distance` is set, names that are farther away are
+        not returned.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(n, int) and n > 0, n
+        assert isinstance(metric, EditDistance), type(metric)
+        if max_distance is not None:
+            assert isinstance(max_distance, int) and max_distance >= 0, max_distance
+
+        k = math.inf if max_distance is None else max_distance
+        return [
+            (word, distance) for distance, key in self._search(value, k, n, metric) for word in self._nodes[key].words
+        ]
@@ -0,0 +1,313 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabDeleteIndex class."""
+
+from __future__ import annotations
+import hashlib
+import pickle
+import sys
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from .edit_distance import EditDistance
+from .index_unpickler import IndexUnpickler
+from .vocab_index import VocabIndex
+from .word import Word
+
+
+class VocabDeleteIndex:
+    """
+    A symmetric delete index (SymSpell) of the names of `Word` items.
+
+    Every lowercase name (see :meth:`VocabIndex.get_key`) is stored under
+    each variant of its first `prefix_length` characters with up to
+    `max_distance` characters deleted. Two names within edit distance `k`
+    share such a variant, so a lookup generates the variants of the search
+    value, probes the index with each of them, and only computes the edit
+    distance of the names it finds.
+
+    The index trades memory for lookup time; see :meth:`get_memory_size`.
+    It can be persisted with :meth:`save_index`, so it does not have to be
+    built again.
+
+    A removed name stays in the index; it is skipped by :meth:`lookup` and
+    reused when it is added again.
+    """
+
+    MAX_DISTANCE_DEFAULT: int = 2
+    PREFIX_LENGTH_DEFAULT: int = 7
+    INDEX_FORMAT_VERSION: int = 1
+
+    _max_distance: int
+    _prefix_length: int
+    _counts: dict[str, int]
+    _deletes: dict[str, list[str]]
+    _longest: int
+
+    def __init__(
+        self,
+        words: Iterable[Word] = (),
+        *,
+        max_distance: int = MAX_DISTANCE_DEFAULT,
+        prefix_length: int = PREFIX_LENGTH_DEFAULT,
+        index: Path | None = None,
+    ) -> None:
+        """
+        Build an index.
+
+        Parameters
+        ----------
+        words:
+            The words to add.
+        max_distance:
+            The largest edit distance that :meth:`lookup` supports. The
+            size of the index grows quickly with it.
+        prefix_length:
+            The number of characters of a name that are indexed. It must be
+            larger than `max_distance`. Shorter prefixes need less memory
+            but give more candidates to check.
+        index:
+            A persisted index (see :meth:`save_index`). It is used when it
+            exists and was made with the same settings and names. Otherwise
+            the index is built.
+        """
+
+        assert isinstance(max_distance, int) and max_distance >= 0, max_distance
+        assert isinstance(prefix_length, int) and prefix_length > max_distance, prefix_length
+        if index is not None:
+            assert isinstance(index, Path), type(index)
+
+        self._max_distance = max_distance
+        self._prefix_length = prefix_length
+        self._counts = {}
+        self._deletes = {}
+        self._longest = 0
+
+        for word in words:
+            key = VocabIndex.get_key(word.name)
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+        if index is not None and self._load_index(index):
+            return
+
+        for key in self._counts:
+            self._add_deletes(key)
+
+    @property
+    def max_distance(self) -> int:
+        """Return the largest supported edit distance."""
+        return self._max_distance
+
+    @property
+    def prefix_length(self) -> int:
+        """Return the number of indexed characters of a name."""
+        return self._prefix_length
+
+    @property
+    def delete_count(self) -> int:
+        """Return the number of variants in the index."""
+        return len(self._deletes)
+
+    def __len__(self) -> int:
+        """Return the number of distinct names."""
+        return sum(1 for count in self._counts.values() if count > 0)
+
+    def _get_variants(self, value: str, depth: int) -> list[str]:
+        """Return `value` and its variants with up to `depth` characters deleted."""
+
+        result = [value]
+        seen = {value}
+        level = [value]
+        for _ in range(depth):
+            following = []
+            for item in level:
+                for idx in range(len(item)):
+                    variant = item[:idx] + item[idx + 1 :]
+                    if variant not in seen:
+                        seen.add(variant)
+                        following.append(variant)
+            result.extend(following)
+            level = following
+
+        return result
+
+    def _add_deletes(self, key: str) -> None:
+        deletes = self._deletes
+        for variant in self._get_variants(key[: self._prefix_length], self._max_distance):
+            names = deletes.get(variant)
+            if names is None:
+                deletes[variant] = [key]
+            else:
+                names.append(key)
+
+        self._longest = max(self._longest, len(key))
+
+    def _is_indexed(self, key: str) -> bool:
+        return key in self._deletes.get(key[: self._prefix_length], ())
+
+    def add(self, word: Word) -> None:
+        """Add the name of a word."""
+
+        key = VocabIndex.get_key(word.name)
+        count = self._counts.get(key, 0)
+        if count == 0 and not self._is_indexed(key):
+            self._add_deletes(key)
+        self._counts[key] = count + 1
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """Add the name of a word; the position of the word does not matter."""
+
+        _ = words, position
+        self.add(word)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove the name of a word; the position does not matter."""
+
+        _ = words, position
+        key = VocabIndex.get_key(word.name)
+        count = self._counts.get(key, 0)
+        if count == 0:
+            raise ValueError(word)
+
+        self._counts[key] = count - 1
+
+    def clear(self) -> None:
+        """Remove all names."""
+
+        self._counts.clear()
+        self._deletes.clear()
+        self._longest = 0
+
+    def lookup(
+        self,
+        value: str,
+        max_distance: int | None = None,
+        metric: EditDistance = EditDistance.DAMERAU,
+    ) -> list[tuple[str, int]]:
+        """
+        Return the names within edit distance `max_distance` of `value`
+        (case-insensitive).
+
+        Parameters
+        ----------
+        value:
+            The search term.
+        max_distance:
+            The maximum edit distance; at most the `max_distance` of the
+            index. When `None`, the `max_distance` of the index is used.
+        metric:
+            The edit distance (default ``EditDistance.DAMERAU``).
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            The lowercase names and their distance, closest first; names
+            with the same distance are sorted.
+        """
+
+        assert isinstance(value, str), type(value)
+        if max_distance is None:
+            max_distance = self._max_distance
+        assert isinstance(max_distance, int) and 0 <= max_distance <= self._max_distance, max_distance
+        assert isinstance(metric, EditDistance), type(metric)
+
+        key = VocabIndex.get_key(value)
+        size = len(key)
+        if size - max_distance > self._longest:
+            return []
+
+        distance = metric.get_matcher(key)
+        counts = self._counts
+        deletes = self._deletes
+        checked: set[str] = set()
+        result: list[tuple[int, str]] = []
+        for variant in self._get_variants(key[: self._prefix_length], max_distance):
+            for name in deletes.get(variant, ()):
+                if name in checked:
+                    continue
+                checked.add(name)
+                if counts.get(name, 0) == 0 or abs(len(name) - size) > max_distance:
+                    continue
+                found = distance(name)
+                if found <= max_distance:
+                    result.append((found, name))
+
+        return [(name, found) for found, name in sorted(result)]
+
+    def get_memory_size(self) -> int:
+        """
+        Return the approximate memory size of the index in bytes.
+
+        This includes the dictionaries, the lists and the variant strings,
+        but not the names, which are shared with the words.
+        """
+
+        result = sys.getsizeof(self._counts) + sys.getsizeof(self._deletes)
+        for variant, names in self._deletes.items():
+            result += sys.getsizeof(variant) + sys.getsizeof(names)
+
+        return result
+
+    def _get_header(self) -> dict[str, object]:
+        keys = sorted(key for key, count in self._counts.items() if count > 0)
+        return {
+            "format": VocabDeleteIndex.INDEX_FORMAT_VERSION,
+            "max_distance": self._max_distance,
+            "prefix_length": self._prefix_length,
+            "sha256": hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest(),
+        }
+
+    def _load_index(self, index: Path) -> bool:
+        if not index.exists():
+            return False
+
+        try:
+            with open(index, "rb") as f:
+                header = IndexUnpickler(f).load()
+                if header != self._get_header():
+                    return False
+                deletes = IndexUnpickler(f).load()
+        except (pickle.UnpicklingError, EOFError, ValueError) as ex:
+            print(f"[WARN] {index}: '{ex}'.")
+            return False
+
+        self._deletes = deletes
+        self._longest = max(map(len, self._counts), default=0)
+
+        return True
+
+    def save_index(self, index: Path) -> Path:
+        """
+        Persist the index to a file.
+
+        The file is only used by an index with the same settings and names
+        (see the `index` parameter of :class:`VocabDeleteIndex`).
+
+        Returns
+        -------
+        Path
+            The path of the index file.
+        """
+
+        assert isinstance(index, Path), type(index)
+
+        with open(index, "wb") as f:
+            pickle.dump(self._get_header(), f, protocol=5)
+            pickle.dump(self._deletes, f, protocol=5)
+
+        return index
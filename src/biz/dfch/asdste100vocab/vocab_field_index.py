@@ -0,0 +1,191 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabFieldIndex class."""
+
+from __future__ import annotations
+from bisect import bisect_left, insort
+from operator import attrgetter
+from typing import Iterable, Sequence
+
+from .vocab_index import VocabIndex
+from .word import Word
+
+
+class VocabFieldIndex:
+    """
+    A secondary index of `Word` items by `status`, `type_`, `category` and
+    `source`.
+
+    For each field, each value maps to the items with that value (a
+    posting list), in the order of the items in the vocabulary. Items are
+    removed by identity, not by equality.
+
+    Each item has an order label, a number that grows with its position
+    in the vocabulary. The posting lists keep the labels of their items,
+    so an item is put into or removed from a posting list with a binary
+    search; the vocabulary is not scanned.
+    """
+
+    FIELDS: tuple[str, ...] = ("status", "type_", "category", "source")
+
+    _postings: dict[str, dict[object, list[Word]]]
+    _orders: dict[str, dict[object, list[float]]]
+    _labels: dict[int, list[float]]
+    _last: float
+
+    def __init__(self, words: Iterable[Word] = ()) -> None:
+        self._postings = {}
+        self._orders = {}
+        self._labels = {}
+        self.clear()
+        for word in words:
+            self.add(word)
+
+    def get(self, field: str, value: object) -> list[Word]:
+        """Return the items whose `field` equals `value`."""
+
+        assert field in self._postings, field
+
+        return list(self._postings[field].get(value, ()))
+
+    def count(self, field: str, value: object) -> int:
+        """Return the number of items whose `field` equals `value`."""
+
+        assert field in self._postings, field
+
+        return len(self._postings[field].get(value, ()))
+
+    def where(self, conditions: dict[str, object]) -> list[Word]:
+        """
+        Return the items that match all `conditions` (field name and
+        value), in vocabulary order.
+
+        Only the items of the shortest posting list are checked against
+        the other conditions.
+        """
+
+        assert conditions, conditions
+        assert all(field in self._postings for field in conditions), conditions
+
+        postings = [(field, self._postings[field].get(value, ())) for field, value in conditions.items()]
+        field, shortest = min(postings, key=lambda posting: len(posting[1]))
+        others = [other for other in conditions if other != field]
+        if not others:
+            return list(shortest)
+
+        # With one field, `attrgetter` returns the value; otherwise a tuple.
+        getter = attrgetter(*others)
+        expected = tuple(conditions[other] for other in others) if len(others) > 1 else conditions[others[0]]
+        return [item for item in shortest if getter(item) == expected]
+
+    def _put(self, word: Word, label: float) -> None:
+        for field, values in self._postings.items():
+            value = getattr(word, field)
+            posting = values.get(value)
+            if posting is None:
+                values[value] = [word]
+                self._orders[field][value] = [label]
+                continue
+
+            orders = self._orders[field][value]
+            idx = bisect_left(orders, label)
+            posting.insert(idx, word)
+            orders.insert(idx, label)
+
+        insort(self._labels.setdefault(id(word), []), label)
+
+    def _get_label(self, word: Word, words: Sequence[Word], position: int | None) -> float:
+        """Return the order label of the copy of `word` at `position` (see :meth:`VocabIndex.get_rank`)."""
+
+        labels = self._labels.get(id(word))
+        if not labels:
+            raise ValueError(word)
+        if len(labels) == 1:
+            return labels[0]
+
+        return labels[VocabIndex.get_rank(word, words, position)]
+
+    def add(self, word: Word) -> None:
+        """Add an item after the other items with the same values."""
+
+        self._last += 1.0
+        self._put(word, self._last)
+
+    def insert(self, word: Word, words: Sequence[Word], position: int | None = None) -> None:
+        """
+        Add an item that is somewhere in the middle of the vocabulary.
+
+        `words` are the items of the vocabulary (including `word` at
+        `position`). The order label of `word` is taken between the labels
+        of its neighbours in `words`. Only when no label fits between them,
+        the index is built again from `words`.
+        """
+
+        if position is None:
+            position = next(idx for idx, item in enumerate(words) if item is word)
+
+        # The copies of a neighbour before `position` are already indexed;
+        # `word` itself at `position` is not.
+        lower = self._get_label(words[position - 1], words, position - 1) if position > 0 else None
+        upper = self._get_label(words[position + 1], words, position) if position + 1 < len(words) else None
+
+        if upper is None:
+            self._last += 1.0
+            label = self._last
+        elif lower is None:
+            label = upper - 1.0
+        else:
+            label = (lower + upper) / 2.0
+            if not lower < label < upper:
+                self.clear()
+                for item in words:
+                    self.add(item)
+                return
+
+        self._put(word, label)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove an item (by identity; see :meth:`VocabIndex.find_item`)."""
+
+        label = self._get_label(word, words, position)
+        for field, values in self._postings.items():
+            value = getattr(word, field)
+            posting = values.get(value, [])
+            orders = self._orders[field].get(value, [])
+            idx = bisect_left(orders, label)
+            if idx == len(posting) or posting[idx] is not word:
+                raise ValueError(word)
+            del posting[idx]
+            del orders[idx]
+
+            if not posting:
+                del values[value]
+                del self._orders[field][value]
+
+        labels = self._labels[id(word)]
+        labels.remove(label)
+        if not labels:
+            del self._labels[id(word)]
+
+    def clear(self) -> None:
+        """Remove all items."""
+
+        self._postings = {field: {} for field in VocabFieldIndex.FIELDS}
+        self._orders = {field: {} for field in VocabFieldIndex.FIELDS}
+        self._labels = {}
+        self._last = 0.0
@@ -0,0 +1,152 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabFilter class."""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+from .compact_word import CompactWord
+from .word import Word
+from .word_category import WordCategory
+from .word_source import WordSource
+from .word_status import WordStatus
+from .word_type import WordType
+
+
+def _get_token(value: str) -> str | None:
+    """Return the JSON string token of `value`, or `None` if it may be written with escapes."""
+
+    if not value.isascii() or not value.isprintable() or '"' in value or "\\" in value:
+        return None
+
+    return f'"{value}"'
+
+
+@dataclass(frozen=True)
+class VocabFilter:
+    """
+    A declarative filter for loading `Word` entries.
+
+    Unlike a predicate, a `VocabFilter` is checked before an entry is
+    decoded: first against the raw JSONL line (a substring check), then
+    against the parsed JSON data. Only matching entries are decoded, so a
+    filtered load costs about in proportion to the number of matches.
+
+    All set conditions must match. `name_prefix` is case-insensitive. Only
+    the top-level fields of an entry are checked.
+    """
+
+    status: WordStatus | None = None
+    type_: WordType | None = None
+    category: WordCategory | None = None
+    source: str | None = None
+    name_prefix: str | None = None
+    _tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _prefix_token: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.status is not None:
+            assert isinstance(self.status, WordStatus), type(self.status)
+        if self.type_ is not None:
+            assert isinstance(self.type_, WordType), type(self.type_)
+        if self.category is not None:
+            assert isinstance(self.category, WordCategory), type(self.category)
+        if self.source is not None:
+            assert isinstance(self.source, str), type(self.source)
+        if self.name_prefix is not None:
+            assert isinstance(self.name_prefix, str), type(self.name_prefix)
+
+        # Substrings that every matching line contains. A value that equals
+        # the field default may be missing from the line, so it is skipped.
+        tokens: list[str] = []
+        for value, default in (
+            (self.status, WordStatus.UNKNOWN),
+            (self.type_, WordType.UNKNOWN),
+            (self.category, WordCategory.DEFAULT),
+            (self.source, WordSource.UNKNOWN),
+        ):
+            token = _get_token(value) if value is not None and value != default else None
+            if token is not None:
+                tokens.append(token)
+        object.__setattr__(self, "_tokens", tuple(tokens))
+
+        prefix = None
+        if self.name_prefix is not None:
+            token = _get_token(self.name_prefix.lower())
+            prefix = token[:-1] if token is not None else None
+        object.__setattr__(self, "_prefix_token", prefix)
+
+    def matches_line(self, line: str) -> bool:
+        """
+        Return `False` if the JSONL `line` cannot match.
+
+        This is a substring check. It can return `True` for a line that does
+        not match, but not `False` for a line that matches.
+        """
+
+        assert isinstance(line, str), type(line)
+
+        if not line.strip():
+            return False
+        if "\\u" in line:
+            # Escaped values do not contain the substrings.
+            return True
+
+        for token in self._tokens:
+            if token not in line:
+                return False
+        if self._prefix_token is not None and self._prefix_token not in line.lower():
+            return False
+
+        return True
+
+    def matches_data(self, data: object) -> bool:
+        """Return `True` if the JSON data (a dict) of an entry matches."""
+
+        if not isinstance(data, dict):
+            return False
+
+        return self._matches(
+            data.get("name"),
+            data.get("status", WordStatus.UNKNOWN),
+            data.get("type_", WordType.UNKNOWN),
+            data.get("category", WordCategory.DEFAULT),
+            data.get("source", WordSource.UNKNOWN),
+        )
+
+    def matches(self, word: Word | CompactWord) -> bool:
+        """Return `True` if `word` matches."""
+
+        assert isinstance(word, (Word, CompactWord)), type(word)
+
+        return self._matches(word.name, word.status, word.type_, word.category, word.source)
+
+    def _matches(self, name: object, status: object, type_: object, category: object, source: object) -> bool:
+        if self.status is not None and status != self.status:
+            return False
+        if self.type_ is not None and type_ != self.type_:
+            return False
+        if self.category is not None and category != self.category:
+            return False
+        if self.source is not None and source != self.source:
+            return False
+        if self.name_prefix is not None:
+            if not isinstance(name, str) or not name.lower().startswith(self.name_prefix.lower()):
+                return False
+
+        return True
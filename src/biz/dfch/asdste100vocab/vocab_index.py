@@ -0,0 +1,152 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabIndex class."""
+
+from __future__ import annotations
+from itertools import islice, repeat
+from operator import is_
+from typing import Iterable, Sequence
+
+from .word import Word
+
+
+class VocabIndex:
+    """
+    A case-insensitive index of `Word` items by name.
+
+    Each key (the lowercase name) maps to the items with that name, in the
+    order of the items in the vocabulary. Items are removed by identity,
+    not by equality.
+    """
+
+    _buckets: dict[str, list[Word]]
+
+    def __init__(self, words: Iterable[Word] = ()) -> None:
+        self._buckets = {}
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def get_key(value: str) -> str:
+        """Return the index key of a name."""
+
+        return value.lower()
+
+    @staticmethod
+    def find_item(
+        items: Sequence[Word],
+        word: Word,
+        words: Sequence[Word] = (),
+        position: int | None = None,
+        start: int = 0,
+        end: int | None = None,
+    ) -> int:
+        """
+        Return the index of the object `word` in `items[start:end]`, a list
+        in vocabulary order.
+
+        When the same object is in the list more than once, the copy that
+        was at `position` in `words` (the items of the vocabulary) is
+        returned: the copies are counted in `words` before `position`.
+        Without a position, the first copy is returned.
+
+        Raises
+        ------
+        ValueError
+            If `word` is not in the list.
+        """
+
+        end = len(items) if end is None else end
+        found = [idx for idx in range(start, end) if items[idx] is word]
+        if not found:
+            raise ValueError(word)
+        if len(found) == 1:
+            return found[0]
+
+        return found[VocabIndex.get_rank(word, words, position)]
+
+    @staticmethod
+    def get_rank(word: Word, words: Sequence[Word], position: int | None) -> int:
+        """
+        Return how often the object `word` is in `words` before `position`
+        (0 without a position).
+        """
+
+        if position is None:
+            return 0
+
+        return sum(map(is_, islice(words, position), repeat(word)))
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._buckets)
+
+    def __contains__(self, value: object) -> bool:
+        """Return `True` if there is an item whose name matches `value`."""
+        return isinstance(value, str) and VocabIndex.get_key(value) in self._buckets
+
+    def get(self, value: str) -> list[Word]:
+        """Return the items whose name matches `value` (case-insensitive)."""
+
+        assert isinstance(value, str), type(value)
+
+        return list(self._buckets.get(VocabIndex.get_key(value), ()))
+
+    def add(self, word: Word) -> None:
+        """Add an item after the other items with the same name."""
+
+        self._buckets.setdefault(VocabIndex.get_key(word.name), []).append(word)
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """
+        Add an item that is somewhere in the middle of the vocabulary.
+
+        `words` are the items of the vocabulary (including `word`). They
+        are only scanned when there are other items with the same name,
+        to put `word` at the correct position.
+        """
+
+        _ = position
+        key = VocabIndex.get_key(word.name)
+        bucket = self._buckets.get(key)
+        if not bucket:
+            self._buckets[key] = [word]
+            return
+
+        members = {id(item) for item in bucket}
+        members.add(id(word))
+        self._buckets[key] = [item for item in words if id(item) in members]
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """
+        Remove an item (by identity).
+
+        `position` is the index in `words` (the items of the vocabulary)
+        where the item was; see :meth:`find_item`.
+        """
+
+        key = VocabIndex.get_key(word.name)
+        bucket = self._buckets.get(key, [])
+        del bucket[VocabIndex.find_item(bucket, word, words, position)]
+
+        if not bucket:
+            del self._buckets[key]
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._buckets.clear()
@@ -0,0 +1,184 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabNgramIndex class."""
+
+from __future__ import annotations
+from array import array
+from collections import Counter
+import difflib
+import heapq
+import math
+from typing import Iterable, Sequence
+
+from .word import Word
+
+
+class VocabNgramIndex:
+    """
+    A character trigram index of the names of `Word` items.
+
+    The index maps each trigram of the lowercase, padded names to the names
+    that contain it. :meth:`similar` uses it to shortlist the names that
+    share enough trigrams with the search value, and runs
+    :func:`difflib.get_close_matches` on the shortlist only.
+
+    The shortlist is a heuristic: a name that shares fewer trigrams than
+    required can still reach the `cutoff` (this happens mostly with short
+    names), and it is then missing from the result. So `Vocab` only uses
+    the index when it is asked for (``use_index=True``), for large
+    vocabularies where scoring every name is too slow.
+    """
+
+    SIZE: int = 3
+    CANDIDATES_DEFAULT: int = 500
+
+    _ids: dict[str, int]
+    _names: list[str]
+    _counts: list[int]
+    _sizes: array
+    _postings: dict[str, array]
+
+    def __init__(self, words: Iterable[Word] = ()) -> None:
+        self._ids = {}
+        self._names = []
+        self._counts = []
+        self._sizes = array("H")
+        self._postings = {}
+
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def get_ngrams(value: str) -> set[str]:
+        """Return the trigrams of a name (lowercase, padded with spaces)."""
+
+        padded = f"  {value.lower()} "
+        return {padded[idx : idx + VocabNgramIndex.SIZE] for idx in range(len(padded) - VocabNgramIndex.SIZE + 1)}
+
+    def __len__(self) -> int:
+        """Return the number of distinct names."""
+        return sum(1 for count in self._counts if count > 0)
+
+    def add(self, word: Word) -> None:
+        """Add the name of an item."""
+
+        name = word.name
+        idx = self._ids.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._ids[name] = idx
+            self._names.append(name)
+            self._counts.append(0)
+            ngrams = VocabNgramIndex.get_ngrams(name)
+            self._sizes.append(min(len(ngrams), 0xFFFF))
+            for ngram in ngrams:
+                postings = self._postings.get(ngram)
+                if postings is None:
+                    postings = self._postings[ngram] = array("I")
+                postings.append(idx)
+
+        self._counts[idx] += 1
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """Add the name of an item; the position of the item does not matter."""
+
+        _ = words, position
+        self.add(word)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """
+        Remove the name of an item; the position does not matter.
+
+        A name stays in the postings when its last item is removed; it is
+        skipped by :meth:`similar` and reused when it is added again.
+        """
+
+        _ = words, position
+        idx = self._ids.get(word.name)
+        if idx is None or self._counts[idx] == 0:
+            raise ValueError(word)
+
+        self._counts[idx] -= 1
+
+    def clear(self) -> None:
+        """Remove all names."""
+
+        self._ids.clear()
+        self._names.clear()
+        self._counts.clear()
+        self._sizes = array("H")
+        self._postings.clear()
+
+    def get_candidates(self, value: str, cutoff: float, limit: int = CANDIDATES_DEFAULT) -> list[str]:
+        """
+        Return the names that share enough trigrams with `value`.
+
+        A name must share at least ``cutoff / 2`` of the trigrams of
+        `value`, and its length must allow a ratio of `cutoff` (see
+        :meth:`difflib.SequenceMatcher.real_quick_ratio`). Of these, the
+        `limit` names with the highest share of common trigrams (Dice
+        coefficient) are returned. A name is repeated once per item with
+        that name.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(cutoff, float) and 0.0 <= cutoff <= 1.0, cutoff
+        assert isinstance(limit, int) and limit > 0, limit
+
+        ngrams = VocabNgramIndex.get_ngrams(value)
+        required = max(1, math.ceil(len(ngrams) * cutoff / 2))
+
+        counter: Counter[int] = Counter()
+        for ngram in ngrams:
+            postings = self._postings.get(ngram)
+            if postings is not None:
+                counter.update(postings)
+
+        size = len(value)
+        names = self._names
+        counts = self._counts
+        shortlist = [
+            idx
+            for idx, shared in counter.items()
+            if shared >= required
+            and counts[idx] > 0
+            and 2 * min(size, len(names[idx])) >= cutoff * (size + len(names[idx]))
+        ]
+        if len(shortlist) > limit:
+            total = len(ngrams)
+            sizes = self._sizes
+            shortlist = heapq.nlargest(limit, shortlist, key=lambda idx: counter[idx] / (total + sizes[idx]))
+
+        return [names[idx] for idx in shortlist for _ in range(counts[idx])]
+
+    def similar(
+        self,
+        value: str,
+        n: int,
+        cutoff: float,
+        limit: int = CANDIDATES_DEFAULT,
+    ) -> list[str]:
+        """
+        Return the names most similar to `value`, like
+        :func:`difflib.get_close_matches` over the names of all items, but
+        only scoring the candidates from :meth:`get_candidates`.
+        """
+
+        assert isinstance(n, int) and n > 0, n
+
+        return difflib.get_close_matches(value, self.get_candidates(value, cutoff, limit), n=n, cutoff=cutoff)
@@ -0,0 +1,98 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabPhoneticIndex class."""
+
+from __future__ import annotations
+from typing import Iterable, Sequence
+
+from .metaphone import Metaphone
+from .vocab_index import VocabIndex
+from .word import Word
+
+
+class VocabPhoneticIndex:
+    """
+    A phonetic index of the names of `Word` items.
+
+    Each name is encoded once with :meth:`Metaphone.encode` when it is
+    added. The index maps each key to the lowercase names (see
+    :meth:`VocabIndex.get_key`) with that key, so a lookup is a single
+    dictionary access.
+    """
+
+    _keys: dict[str, dict[str, int]]
+
+    def __init__(self, words: Iterable[Word] = ()) -> None:
+        self._keys = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._keys)
+
+    def get(self, value: str) -> list[str]:
+        """Return the lowercase names that sound like `value`, sorted."""
+
+        assert isinstance(value, str), type(value)
+
+        key = Metaphone.encode(value)
+        if not key:
+            return []
+
+        return sorted(self._keys.get(key, ()))
+
+    def add(self, word: Word) -> None:
+        """Add the name of a word."""
+
+        key = Metaphone.encode(word.name)
+        if not key:
+            return
+
+        names = self._keys.setdefault(key, {})
+        name = VocabIndex.get_key(word.name)
+        names[name] = names.get(name, 0) + 1
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """Add the name of a word; the position of the word does not matter."""
+
+        _ = words, position
+        self.add(word)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove the name of a word; the position does not matter."""
+
+        _ = words, position
+        key = Metaphone.encode(word.name)
+        if not key:
+            return
+
+        name = VocabIndex.get_key(word.name)
+        names = self._keys.get(key)
+        if not names or name not in names:
+            raise ValueError(word)
+
+        names[name] -= 1
+        if names[name] == 0:
+            del names[name]
+            if not names:
+                del self._keys[key]
+
+    def clear(self) -> None:
+        """Remove all names."""
+        self._keys.clear()
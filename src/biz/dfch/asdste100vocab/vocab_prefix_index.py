@@ -0,0 +1,149 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabPrefixIndex class."""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Sequence
+
+from .vocab_index import VocabIndex
+from .word import Word
+
+
+class VocabPrefixIndex:
+    """
+    A case-insensitive prefix index of `Word` items.
+
+    The items are kept in two parallel lists sorted by their key (the
+    lowercase name, see :meth:`VocabIndex.get_key`): the keys and the
+    items. A prefix search is a binary search for the range of keys that
+    start with the prefix. Items with the same key are in the order of the
+    items in the vocabulary. Items are removed by identity, not by equality.
+    """
+
+    _keys: list[str]
+    _words: list[Word]
+
+    def __init__(self, words: Sequence[Word] = ()) -> None:
+        keys = [VocabIndex.get_key(word.name) for word in words]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+
+        self._keys = [keys[idx] for idx in order]
+        self._words = [words[idx] for idx in order]
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._words)
+
+    def _get_range(self, key: str) -> tuple[int, int]:
+        """Return the range of the keys that start with `key`."""
+
+        start = bisect_left(self._keys, key)
+        if not key:
+            return start, len(self._keys)
+
+        # All keys that start with `key` are smaller than `key` with its last
+        # character incremented.
+        last = ord(key[-1])
+        if last == 0x10FFFF:
+            end = start
+            while end < len(self._keys) and self._keys[end].startswith(key):
+                end += 1
+            return start, end
+
+        return start, bisect_left(self._keys, key[:-1] + chr(last + 1), lo=start)
+
+    def prefix(self, value: str, limit: int | None = None) -> list[Word]:
+        """
+        Return the items whose name starts with `value` (case-insensitive),
+        sorted by name.
+
+        Parameters
+        ----------
+        value:
+            The prefix. An empty prefix matches all items.
+        limit:
+            The maximum number of items to return. When `None`, all
+            matching items are returned.
+        """
+
+        assert isinstance(value, str), type(value)
+        if limit is not None:
+            assert isinstance(limit, int) and limit >= 0, limit
+
+        start, end = self._get_range(VocabIndex.get_key(value))
+        if limit is not None:
+            end = min(end, start + limit)
+
+        return self._words[start:end]
+
+    def count(self, value: str) -> int:
+        """Return the number of items whose name starts with `value` (case-insensitive)."""
+
+        assert isinstance(value, str), type(value)
+
+        start, end = self._get_range(VocabIndex.get_key(value))
+        return end - start
+
+    def add(self, word: Word) -> None:
+        """Add an item after the other items with the same name."""
+
+        key = VocabIndex.get_key(word.name)
+        idx = bisect_right(self._keys, key)
+        self._keys.insert(idx, key)
+        self._words.insert(idx, word)
+
+    def insert(self, word: Word, words: Sequence[Word], position: int | None = None) -> None:
+        """
+        Add an item that is somewhere in the middle of the vocabulary.
+
+        `words` are the items of the vocabulary (including `word`). They
+        are only scanned when there are other items with the same name,
+        to put `word` at the correct position.
+        """
+
+        _ = position
+        key = VocabIndex.get_key(word.name)
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, lo=start)
+        if start == end:
+            self._keys.insert(start, key)
+            self._words.insert(start, word)
+            return
+
+        members = {id(item) for item in self._words[start:end]}
+        members.add(id(word))
+        bucket = [item for item in words if id(item) in members]
+        self._words[start:end] = bucket
+        self._keys[start:end] = [key] * len(bucket)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove an item (by identity; see :meth:`VocabIndex.find_item`)."""
+
+        key = VocabIndex.get_key(word.name)
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, lo=start)
+        idx = VocabIndex.find_item(self._words, word, words, position, start, end)
+        del self._keys[idx]
+        del self._words[idx]
+
+    def clear(self) -> None:
+        """Remove all items."""
+
+        self._keys.clear()
+        self._words.clear()
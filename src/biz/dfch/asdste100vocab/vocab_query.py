@@ -0,0 +1,241 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabQuery class."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import StrEnum
+import re
+import shlex
+from typing import ClassVar
+
+from .word_category import WordCategory
+from .word_status import WordStatus
+from .word_type import WordType
+
+
+@dataclass(frozen=True)
+class VocabQuery:
+    """
+    A query for `Word` items (see :meth:`Vocab.query`).
+
+    All set conditions must match. A condition with several values
+    matches if one of its values matches. `names` and `prefixes` are
+    case-insensitive; `pattern` is a case-insensitive regular expression
+    search; `similar` matches names whose similarity ratio (see
+    :meth:`Vocab.similar`) is at least `cutoff`.
+
+    A query can also be parsed from text (see :meth:`parse`)::
+
+        status:approved type:TN category:TN3,TN6 match:^hyd
+    """
+
+    CUTOFF_DEFAULT: ClassVar[float] = 0.6
+    FIELDS: ClassVar[dict[str, str]] = {
+        "name": "names",
+        "prefix": "prefixes",
+        "match": "pattern",
+        "similar": "similar",
+        "cutoff": "cutoff",
+        "status": "statuses",
+        "type": "types",
+        "category": "categories",
+        "source": "sources",
+    }
+
+    names: tuple[str, ...] = ()
+    prefixes: tuple[str, ...] = ()
+    pattern: str | None = None
+    similar: str | None = None
+    cutoff: float = CUTOFF_DEFAULT
+    statuses: tuple[WordStatus, ...] = ()
+    types: tuple[WordType, ...] = ()
+    categories: tuple[WordCategory, ...] = ()
+    sources: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        for values, type_ in (
+            (self.names, str),
+            (self.prefixes, str),
+            (self.statuses, WordStatus),
+            (self.types, WordType),
+            (self.categories, WordCategory),
+            (self.sources, str),
+        ):
+            assert isinstance(values, tuple), type(values)
+            assert all(isinstance(value, type_) for value in values), values
+        if self.pattern is not None:
+            assert isinstance(self.pattern, str), type(self.pattern)
+        if self.similar is not None:
+            assert isinstance(self.similar, str), type(self.similar)
+        assert isinstance(self.cutoff, float) and 0.0 <= self.cutoff <= 1.0, self.cutoff
+
+    @staticmethod
+    def _parse_enum(cls: type[StrEnum], value: str) -> StrEnum:
+        """Return the member of `cls` with the value `value`, or else with that value or name in any case."""
+
+        for member in cls:
+            if member.value == value:
+                return member
+        for member in cls:
+            if value.lower() in (member.value.lower(), member.name.lower()):
+                return member
+
+        raise ValueError(f"Invalid {cls.__name__} value: '{value}'.")
+
+    @staticmethod
+    def parse(text: str) -> VocabQuery:
+        """
+        Parse a query from text.
+
+        The text is a list of terms separated by whitespace; all terms must
+        match. A term is ``field:value``. Values with whitespace are quoted
+        (``name:"abort button"``). For all fields except ``match``,
+        ``similar`` and ``cutoff``, a comma separates alternative values.
+
+        ``name``
+            The name (case-insensitive).
+        ``prefix``
+            The start of the name (case-insensitive).
+        ``match``
+            A regular expression that the name contains (case-insensitive).
+        ``similar``, ``cutoff``
+            A string that the name is similar to, and the similarity
+            threshold (default ``CUTOFF_DEFAULT``).
+        ``status``, ``type``, ``category``
+            The value or member name of :class:`WordStatus`,
+            :class:`WordType` or :class:`WordCategory`.
+        ``source``
+            The source.
+
+        Raises
+        ------
+        ValueError
+            If the text is not a valid query.
+        """
+
+        assert isinstance(text, str), type(text)
+
+        # Only quoted values need the (slower) lexer.
+        if '"' in text or "'" in text:
+            lexer = shlex.shlex(text, posix=True)
+            lexer.whitespace_split = True
+            lexer.commenters = ""
+            lexer.escape = ""
+            terms = list(lexer)
+        else:
+            terms = text.split()
+
+        values: dict[str, object] = {}
+        for term in terms:
+            field, separator, value = term.partition(":")
+            field = field.lower()
+            if not separator or field not in VocabQuery.FIELDS:
+                raise ValueError(f"Invalid term: '{term}'. Use one of: {', '.join(VocabQuery.FIELDS)}.")
+            key = VocabQuery.FIELDS[field]
+            if key in values:
+                raise ValueError(f"Duplicate field: '{field}'.")
+            if not value:
+                raise ValueError(f"Missing value: '{term}'.")
+
+            if key == "pattern":
+                try:
+                    re.compile(value)
+                except re.error as ex:
+                    raise ValueError(f"Invalid pattern: '{value}': {ex}.") from ex
+                values[key] = value
+            elif key == "similar":
+                values[key] = value
+            elif key == "cutoff":
+                cutoff = float(value)
+                if not 0.0 <= cutoff <= 1.0:
+                    raise ValueError(f"Invalid cutoff: '{value}'.")
+                values[key] = cutoff
+            else:
+                items = [item for item in value.split(",") if item]
+                if key == "statuses":
+                    values[key] = tuple(VocabQuery._parse_enum(WordStatus, item) for item in items)
+                elif key == "types":
+                    values[key] = tuple(VocabQuery._parse_enum(WordType, item) for item in items)
+                elif key == "categories":
+                    values[key] = tuple(VocabQuery._parse_enum(WordCategory, item) for item in items)
+                else:
+                    values[key] = tuple(items)
+
+        return VocabQuery(**values)  # type: ignore
+
+    def __str__(self) -> str:
+        """Return the query as text (see :meth:`parse`)."""
+
+        terms: list[str] = []
+        for field, key in VocabQuery.FIELDS.items():
+            value = getattr(self, key)
+            if key == "cutoff":
+                if self.similar is None or value == VocabQuery.CUTOFF_DEFAULT:
+                    continue
+                text = str(value)
+            elif isinstance(value, tuple):
+                if not value:
+                    continue
+                text = ",".join(value)
+            elif value is None:
+                continue
+            else:
+                text = value
+
+            term = f"{field}:{text}"
+            terms.append(shlex.quote(term) if any(c.isspace() or c in "'\"" for c in term) else term)
+
+        return " ".join(terms)
+
+    def get_pattern_prefix(self) -> str | None:
+        """
+        Return the lowercase text that all names matching `pattern` start
+        with, or `None` if there is no such text.
+
+        Only a pattern that starts with ``^`` followed by ASCII letters,
+        digits, spaces or hyphens, and that does not contain ``|``, has a
+        prefix. A letter followed by a quantifier is not part of it.
+        """
+
+        if self.pattern is None or "|" in self.pattern:
+            return None
+
+        match = re.match(r"\^([A-Za-z0-9 \-]+)", self.pattern)
+        if match is None:
+            return None
+
+        prefix = match.group(1)
+        if self.pattern[match.end() : match.end() + 1] in ("*", "?", "{", "+"):
+            prefix = prefix[:-1]
+
+        return prefix.lower() or None
+
+    def is_empty(self) -> bool:
+        """Return `True` if the query has no conditions."""
+
+        return not (
+            self.names
+            or self.prefixes
+            or self.pattern is not None
+            or self.similar is not None
+            or self.statuses
+            or self.types
+            or self.categories
+            or self.sources
+        )
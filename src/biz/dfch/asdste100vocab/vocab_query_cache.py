@@ -0,0 +1,108 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabQueryCache class."""
+
+from __future__ import annotations
+from collections import OrderedDict
+
+from .vocab_query_cache_info import VocabQueryCacheInfo
+from .word import Word
+
+
+class VocabQueryCache:
+    """
+    A bounded LRU cache of query results.
+
+    Each entry maps a key (the method name and its arguments) to the
+    result of the query. The entries belong to a generation of the
+    vocabulary. When an entry is read or written with another generation,
+    all entries are dropped first, so a result is never returned after
+    the vocabulary changed.
+    """
+
+    SIZE_DEFAULT: int = 256
+
+    _entries: OrderedDict[tuple, tuple[Word, ...]]
+    _maxsize: int
+    _generation: int
+    _hits: int
+    _misses: int
+
+    def __init__(self, maxsize: int = SIZE_DEFAULT) -> None:
+        """
+        Parameters
+        ----------
+        maxsize:
+            The maximum number of entries. When the cache is full, the
+            least recently used entry is dropped.
+        """
+
+        assert isinstance(maxsize, int) and maxsize > 0, maxsize
+
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def _check(self, generation: int) -> None:
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def get(self, key: tuple, generation: int) -> tuple[Word, ...] | None:
+        """Return the result of a query, or `None` if it is not cached."""
+
+        self._check(generation)
+
+        result = self._entries.get(key)
+        if result is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return result
+
+    def put(self, key: tuple, generation: int, value: tuple[Word, ...]) -> None:
+        """Store the result of a query."""
+
+        assert isinstance(value, tuple), type(value)
+
+        self._check(generation)
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def info(self) -> VocabQueryCacheInfo:
+        """Return the hit and miss statistics."""
+
+        return VocabQueryCacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabQueryPlan class."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+
+from .vocab_query import VocabQuery
+
+
+@dataclass(frozen=True)
+class VocabQueryPlan:
+    """
+    The plan of a query (see :meth:`Vocab.explain`).
+
+    A plan reads the candidates from one access path (an index, or a scan
+    of all items) and checks the conditions that the access path does not
+    cover with filters. Of the access paths that can answer the query, the
+    one with the smallest estimated number of candidates is used.
+    """
+
+    query: VocabQuery
+    access: str
+    estimate: int
+    alternatives: tuple[tuple[str, int], ...]
+    filters: tuple[str, ...]
+
+    def explain(self) -> str:
+        """Return the plan as text."""
+
+        lines = [
+            f"Query: {self.query}",
+            f"Access: {self.access} ({self.estimate} items)",
+            "Considered:",
+        ]
+        lines.extend(f"  {access}: {estimate} items" for access, estimate in self.alternatives)
+        lines.append("Filters:" if self.filters else "Filters: none")
+        lines.extend(f"  {description}" for description in self.filters)
+        lines.append("Order: name (case-insensitive), then vocabulary order")
+
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.explain()
@@ -0,0 +1,216 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabSnapshot class.
+
+A snapshot is a precompiled binary copy of a JSONL vocabulary file. It is
+stored next to the JSONL file (same name, suffix ``.pickle``) and contains
+a header with the SHA-256 digest of the JSONL file it was made from. When
+the digest does not match, the snapshot is stale and is not used.
+
+Regenerate the snapshots of the built-in vocabularies after you change
+their JSONL files::
+
+    python -m tests.asdste100vocab.test_vocab_snapshot
+"""
+
+from __future__ import annotations
+import dataclasses
+import hashlib
+import io
+import pickle
+from pathlib import Path
+from typing import Callable
+
+from .builtin_vocab import BuiltInVocab
+from .word import Word
+from .word_category import WordCategory
+from .word_meaning import WordMeaning
+from .word_note import WordNote
+from .word_status import WordStatus
+from .word_type import WordType
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves the vocabulary classes.
+
+    Classes are resolved by name and not by module, so that a snapshot
+    made with the installed package can be loaded from a source checkout
+    (and the other way around).
+    """
+
+    _classes: dict[str, type] = {
+        cls.__name__: cls
+        for cls in (
+            Word,
+            WordMeaning,
+            WordNote,
+            WordStatus,
+            WordType,
+            WordCategory,
+        )
+    }
+
+    def find_class(self, module: str, name: str) -> type:
+        if name in self._classes and module.endswith(".asdste100vocab." + _module_name(name)):
+            return self._classes[name]
+
+        raise pickle.UnpicklingError(f"Class not allowed in snapshot: '{module}.{name}'.")
+
+
+def _module_name(class_name: str) -> str:
+    """Return the module name of a vocabulary class (`WordNote` -> `word_note`)."""
+
+    return "".join(f"_{c.lower()}" if c.isupper() else c for c in class_name).lstrip("_")
+
+
+class VocabSnapshot:
+    """Read and write precompiled snapshots of JSONL vocabulary files."""
+
+    SUFFIX: str = ".pickle"
+    FORMAT_VERSION: int = 1
+    PROTOCOL: int = 5
+
+    @staticmethod
+    def get_path(fullname: Path) -> Path:
+        """Return the snapshot path that belongs to a JSONL file."""
+
+        assert isinstance(fullname, Path), type(fullname)
+
+        return fullname.with_suffix(VocabSnapshot.SUFFIX)
+
+    @staticmethod
+    def get_digest(fullname: Path) -> str:
+        """Return the SHA-256 hex digest of a file."""
+
+        assert isinstance(fullname, Path), type(fullname)
+
+        return hashlib.sha256(fullname.read_bytes()).hexdigest()
+
+    @staticmethod
+    def get_schema() -> tuple[tuple[str, ...], ...]:
+        """Return the field names of the vocabulary classes.
+
+        A snapshot made with a different schema is stale.
+        """
+
+        return tuple(tuple(f.name for f in dataclasses.fields(cls)) for cls in (Word, WordMeaning, WordNote))
+
+    @staticmethod
+    def _get_header(fullname: Path) -> dict[str, object]:
+        return {
+            "format": VocabSnapshot.FORMAT_VERSION,
+            "schema": VocabSnapshot.get_schema(),
+            "sha256": VocabSnapshot.get_digest(fullname),
+        }
+
+    @staticmethod
+    def write(fullname: Path, words: list[Word], snapshot: Path | None = None) -> Path:
+        """
+        Write a snapshot of `words` for the JSONL file `fullname`.
+
+        Parameters
+        ----------
+        fullname:
+            The JSONL file the words were read from.
+        words:
+            The words to store in the snapshot.
+        snapshot:
+            The snapshot file. When `None`, the snapshot is stored next to
+            `fullname` (see :meth:`get_path`).
+
+        Returns
+        -------
+        Path
+            The path of the snapshot file.
+        """
+
+        assert isinstance(fullname, Path), type(fullname)
+        assert fullname.exists(), fullname
+        assert isinstance(words, list), type(words)
+        if snapshot is None:
+            snapshot = VocabSnapshot.get_path(fullname)
+        assert isinstance(snapshot, Path), type(snapshot)
+
+        buffer = io.BytesIO()
+        pickle.dump(VocabSnapshot._get_header(fullname), buffer, protocol=VocabSnapshot.PROTOCOL)
+        pickle.dump(words, buffer, protocol=VocabSnapshot.PROTOCOL)
+        snapshot.write_bytes(buffer.getvalue())
+
+        return snapshot
+
+    @staticmethod
+    def read(fullname: Path, snapshot: Path | None = None) -> list[Word] | None:
+        """
+        Read the snapshot of the JSONL file `fullname`.
+
+        Returns
+        -------
+        list[Word] | None
+            The words from the snapshot, or `None` if the snapshot does not
+            exist, cannot be read, or is stale.
+        """
+
+        assert isinstance(fullname, Path), type(fullname)
+        if snapshot is None:
+            snapshot = VocabSnapshot.get_path(fullname)
+        assert isinstance(snapshot, Path), type(snapshot)
+
+        if not snapshot.exists():
+            return None
+
+        try:
+            with open(snapshot, "rb") as f:
+                # Header and words are two separate pickles; each one needs
+                # its own unpickler (memo).
+                header = _SnapshotUnpickler(f).load()
+                if header != VocabSnapshot._get_header(fullname):
+                    return None
+                result = _SnapshotUnpickler(f).load()
+        except (pickle.UnpicklingError, EOFError, AttributeError, ValueError) as ex:
+            print(f"[WARN] {snapshot}: '{ex}'.")
+            return None
+
+        if not isinstance(result, list):
+            return None
+
+        return result
+
+    @staticmethod
+    def build(reader: Callable[[Path], list[Word]]) -> list[Path]:
+        """
+        Make the snapshots of all built-in vocabularies.
+
+        Parameters
+        ----------
+        reader:
+            A function that reads all `Word` items from a JSONL file.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the snapshot files.
+        """
+
+        assert callable(reader), type(reader)
+
+        result: list[Path] = []
+        for builtin in (BuiltInVocab.STE100_BASE, BuiltInVocab.STE100_TECHNICAL_WORDS):
+            fullname = builtin.value
+            result.append(VocabSnapshot.write(fullname, reader(fullname)))
+
+        return result
@@ -0,0 +1,314 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabTextIndex class."""
+
+from __future__ import annotations
+import hashlib
+import heapq
+import math
+import pickle
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+from .index_unpickler import IndexUnpickler
+from .word import Word
+
+
+class VocabTextIndex:
+    """
+    An inverted index of the texts of `Word` items, ranked with BM25.
+
+    The texts of a word (see :meth:`get_texts`) are one document. They are
+    split into lowercase tokens (see :meth:`tokenize`); the index maps each
+    token to the documents that contain it and how often. A search scores
+    only the documents that contain a token of the search text, with the
+    Okapi BM25 formula (parameters `K1` and `B`).
+
+    The index can be persisted with :meth:`save_index`, so it does not have
+    to be built again. Items are removed by identity, not by equality.
+    """
+
+    K1: float = 1.2
+    B: float = 0.75
+    SIZE_DEFAULT: int = 10
+    INDEX_FORMAT_VERSION: int = 1
+
+    _pattern: re.Pattern = re.compile(r"\w+")
+
+    _postings: dict[str, dict[int, int]]
+    _lengths: dict[int, int]
+    _words: dict[int, Word]
+    _docs: dict[int, list[int]]
+    _next: int
+    _total: int
+
+    def __init__(self, words: Sequence[Word] = (), *, index: Path | None = None) -> None:
+        """
+        Build an index.
+
+        Parameters
+        ----------
+        words:
+            The words to add.
+        index:
+            A persisted index (see :meth:`save_index`). It is used when it
+            exists and was made from words with the same texts, in the same
+            order. Otherwise the index is built.
+        """
+
+        if index is not None:
+            assert isinstance(index, Path), type(index)
+
+        self._postings = {}
+        self._lengths = {}
+        self._words = {}
+        self._docs = {}
+        self._next = 0
+        self._total = 0
+
+        if index is not None and self._load_index(index, words):
+            return
+
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def get_texts(word: Word) -> list[str]:
+        """
+        Return the texts of a word: the values, examples and notes of its
+        meanings, its own examples, and the value of its note.
+        """
+
+        result: list[str] = []
+        for meaning in word.meanings:
+            result.append(meaning.value)
+            result.extend(meaning.ste_example)
+            result.extend(meaning.nonste_example)
+            if meaning.note is not None and meaning.note.value:
+                result.append(meaning.note.value)
+        result.extend(word.ste_example)
+        result.extend(word.nonste_example)
+        if word.note is not None and word.note.value:
+            result.append(word.note.value)
+
+        return result
+
+    @staticmethod
+    def tokenize(value: str) -> list[str]:
+        """Return the lowercase word tokens (letters, digits and underscores) of a text."""
+
+        assert isinstance(value, str), type(value)
+
+        return VocabTextIndex._pattern.findall(value.lower())
+
+    def __len__(self) -> int:
+        """Return the number of documents (words)."""
+        return len(self._lengths)
+
+    @property
+    def term_count(self) -> int:
+        """Return the number of distinct tokens."""
+        return len(self._postings)
+
+    def _add_tokens(self, doc: int, tokens: list[str]) -> None:
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        postings = self._postings
+        for token, count in counts.items():
+            docs = postings.get(token)
+            if docs is None:
+                postings[token] = {doc: count}
+            else:
+                docs[doc] = count
+
+    def add(self, word: Word) -> None:
+        """Add the texts of a word."""
+
+        doc = self._next
+        self._next += 1
+
+        tokens = [token for text in VocabTextIndex.get_texts(word) for token in VocabTextIndex.tokenize(text)]
+        self._add_tokens(doc, tokens)
+        self._lengths[doc] = len(tokens)
+        self._total += len(tokens)
+        self._words[doc] = word
+        self._docs.setdefault(id(word), []).append(doc)
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """Add the texts of a word; the position of the word does not matter."""
+
+        _ = words, position
+        self.add(word)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove the texts of a word (by identity); the position does not matter."""
+
+        _ = words, position
+        docs = self._docs.get(id(word))
+        if not docs:
+            raise ValueError(word)
+
+        doc = docs.pop()
+        if not docs:
+            del self._docs[id(word)]
+
+        for text in VocabTextIndex.get_texts(word):
+            for token in VocabTextIndex.tokenize(text):
+                postings = self._postings.get(token)
+                if postings is not None and postings.pop(doc, None) is not None and not postings:
+                    del self._postings[token]
+
+        self._total -= self._lengths.pop(doc)
+        del self._words[doc]
+
+    def clear(self) -> None:
+        """Remove all documents."""
+
+        self._postings.clear()
+        self._lengths.clear()
+        self._words.clear()
+        self._docs.clear()
+        self._next = 0
+        self._total = 0
+
+    def search(
+        self,
+        value: str,
+        limit: int = SIZE_DEFAULT,
+        accept: Callable[[Word], bool] | None = None,
+    ) -> list[tuple[Word, float]]:
+        """
+        Return the words whose texts best match `value`, with their BM25
+        score.
+
+        Parameters
+        ----------
+        value:
+            The search text. Each distinct token counts once.
+        limit:
+            The maximum number of words to return.
+        accept:
+            When set, only words for which it returns `True` are ranked.
+
+        Returns
+        -------
+        list[tuple[Word, float]]
+            The words and their scores, best score first. Words with the
+            same score are in the order they were added.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(limit, int) and limit >= 0, limit
+        if accept is not None:
+            assert callable(accept), type(accept)
+
+        count = len(self._lengths)
+        if count == 0 or limit == 0:
+            return []
+
+        k1 = VocabTextIndex.K1
+        b = VocabTextIndex.B
+        average = self._total / count or 1.0
+        lengths = self._lengths
+        scores: dict[int, float] = {}
+        for token in dict.fromkeys(VocabTextIndex.tokenize(value)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, frequency in postings.items():
+                norm = k1 * (1.0 - b + b * lengths[doc] / average)
+                scores[doc] = scores.get(doc, 0.0) + idf * frequency * (k1 + 1.0) / (frequency + norm)
+
+        words = self._words
+        if accept is not None:
+            scores = {doc: score for doc, score in scores.items() if accept(words[doc])}
+
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(words[doc], score) for doc, score in best]
+
+    @staticmethod
+    def _get_header(words: Iterable[Word]) -> dict[str, object]:
+        digest = hashlib.sha256()
+        for word in words:
+            digest.update("\x1e".join(VocabTextIndex.get_texts(word)).encode("utf-8"))
+            digest.update(b"\x1d")
+
+        return {
+            "format": VocabTextIndex.INDEX_FORMAT_VERSION,
+            "sha256": digest.hexdigest(),
+        }
+
+    def _load_index(self, index: Path, words: Sequence[Word]) -> bool:
+        if not index.exists():
+            return False
+
+        try:
+            with open(index, "rb") as f:
+                header = IndexUnpickler(f).load()
+                if header != VocabTextIndex._get_header(words):
+                    return False
+                postings, lengths = IndexUnpickler(f).load()
+        except (pickle.UnpicklingError, EOFError, ValueError) as ex:
+            print(f"[WARN] {index}: '{ex}'.")
+            return False
+
+        if not isinstance(lengths, list) or len(lengths) != len(words):
+            return False
+
+        self._postings = postings
+        self._lengths = dict(enumerate(lengths))
+        self._words = dict(enumerate(words))
+        for doc, word in enumerate(words):
+            self._docs.setdefault(id(word), []).append(doc)
+        self._next = len(words)
+        self._total = sum(lengths)
+
+        return True
+
+    def save_index(self, index: Path) -> Path:
+        """
+        Persist the index to a file.
+
+        The file is only used by an index of words with the same texts, in
+        the same order (see the `index` parameter of the constructor).
+
+        Returns
+        -------
+        Path
+            The path of the index file.
+        """
+
+        assert isinstance(index, Path), type(index)
+
+        # Number the documents from 0 in the order of their words.
+        docs = sorted(self._words)
+        numbers = {doc: number for number, doc in enumerate(docs)}
+        postings = {
+            token: {numbers[doc]: count for doc, count in entries.items()} for token, entries in self._postings.items()
+        }
+        lengths = [self._lengths[doc] for doc in docs]
+
+        with open(index, "wb") as f:
+            pickle.dump(VocabTextIndex._get_header(self._words[doc] for doc in docs), f, protocol=5)
+            pickle.dump((postings, lengths), f, protocol=5)
+
+        return index
@@ -0,0 +1,239 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""VocabTrie class."""
+
+from __future__ import annotations
+from bisect import insort
+import heapq
+from itertools import count
+from typing import Callable, Iterable, Iterator, Sequence
+
+from .vocab_index import VocabIndex
+from .word import Word
+from .word_status import WordStatus
+
+# An entry is the rank of a word, a sequence number (ties are in the order
+# the words were added) and the word itself. Words are never compared.
+_Entry = tuple[object, int, Word]
+
+
+class _TrieNode:
+    """A node of a `VocabTrie`."""
+
+    __slots__ = ("children", "entries", "top")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.entries: list[_Entry] = []  # The words whose key ends at this node.
+        self.top: list[_Entry] = []  # The best entries of this node and its descendants.
+
+
+class VocabTrie:
+    """
+    A case-insensitive autocomplete index of `Word` items.
+
+    The trie is built over the lowercase names (see
+    :meth:`VocabIndex.get_key`); multi-word names such as "abort button"
+    are completed like any other name. Each node keeps its `size` best
+    completions, so :meth:`complete` takes time in proportion to the
+    length of the prefix and the number of results.
+
+    The ranking is a key function: words with a smaller key rank higher.
+    The default (:meth:`default_rank`) ranks approved words before unknown
+    and rejected words, and then sorts by name. Words with the same rank
+    are in the order they were added.
+    """
+
+    SIZE_DEFAULT: int = 10
+
+    _statuses: dict[WordStatus, int] = {
+        WordStatus.APPROVED: 0,
+        WordStatus.UNKNOWN: 1,
+        WordStatus.REJECTED: 2,
+    }
+
+    _root: _TrieNode
+    _rank: Callable[[Word], object]
+    _size: int
+    _sequence: Iterator[int]
+    _count: int
+
+    def __init__(
+        self,
+        words: Iterable[Word] = (),
+        *,
+        rank: Callable[[Word], object] | None = None,
+        size: int = SIZE_DEFAULT,
+    ) -> None:
+        """
+        Build a trie.
+
+        Parameters
+        ----------
+        words:
+            The words to add.
+        rank:
+            The ranking key function. When `None`, :meth:`default_rank` is
+            used.
+        size:
+            The number of completions that each node keeps. Requests for
+            more completions traverse the subtree of the prefix.
+        """
+
+        if rank is None:
+            rank = VocabTrie.default_rank
+        assert callable(rank), type(rank)
+        assert isinstance(size, int) and size > 0, size
+
+        self._root = _TrieNode()
+        self._rank = rank
+        self._size = size
+        self._sequence = count()
+        self._count = 0
+
+        for word in words:
+            self.add(word)
+
+    @staticmethod
+    def default_rank(word: Word) -> tuple[int, str]:
+        """Rank approved before unknown before rejected words, then by name."""
+
+        return VocabTrie._statuses.get(word.status, 1), VocabIndex.get_key(word.name)
+
+    @property
+    def rank(self) -> Callable[[Word], object]:
+        """Return the ranking key function."""
+        return self._rank
+
+    def __len__(self) -> int:
+        """Return the number of words."""
+        return self._count
+
+    def _get_node(self, key: str) -> _TrieNode | None:
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return None
+            node = child
+
+        return node
+
+    def complete(self, value: str, limit: int = SIZE_DEFAULT) -> list[Word]:
+        """
+        Return the best `limit` words whose name starts with `value`
+        (case-insensitive), in rank order.
+        """
+
+        assert isinstance(value, str), type(value)
+        assert isinstance(limit, int) and limit >= 0, limit
+
+        node = self._get_node(VocabIndex.get_key(value))
+        if node is None:
+            return []
+
+        if limit <= self._size:
+            return [entry[2] for entry in node.top[:limit]]
+
+        return [entry[2] for entry in heapq.nsmallest(limit, VocabTrie._iter_entries(node))]
+
+    @staticmethod
+    def _iter_entries(node: _TrieNode) -> Iterator[_Entry]:
+        pending = [node]
+        while pending:
+            item = pending.pop()
+            yield from item.entries
+            pending.extend(item.children.values())
+
+    def add(self, word: Word) -> None:
+        """Add a word."""
+
+        entry: _Entry = (self._rank(word), next(self._sequence), word)
+
+        node = self._root
+        path = [node]
+        for char in VocabIndex.get_key(word.name):
+            node = node.children.setdefault(char, _TrieNode())
+            path.append(node)
+        node.entries.append(entry)
+
+        for item in path:
+            top = item.top
+            if len(top) < self._size or entry < top[-1]:
+                # The sequence number makes the entry unique and larger than
+                # all existing entries with the same rank.
+                insort(top, entry)
+                del top[self._size :]
+
+        self._count += 1
+
+    def insert(self, word: Word, words: Iterable[Word], position: int | None = None) -> None:
+        """
+        Add a word that is somewhere in the middle of the vocabulary.
+
+        The position does not change the ranking, so this is the same as
+        :meth:`add`. `words` is not used.
+        """
+
+        _ = words, position
+        self.add(word)
+
+    def remove(self, word: Word, words: Sequence[Word] = (), position: int | None = None) -> None:
+        """Remove a word (by identity); the position does not matter."""
+
+        _ = words, position
+        key = VocabIndex.get_key(word.name)
+        node = self._root
+        path = [node]
+        for char in key:
+            node = node.children.get(char)  # type: ignore
+            if node is None:
+                raise ValueError(word)
+            path.append(node)
+
+        for idx, entry in enumerate(node.entries):
+            if entry[2] is word:
+                del node.entries[idx]
+                break
+        else:
+            raise ValueError(word)
+
+        # Recompute the best entries bottom-up; a node's best entries are
+        # among its own entries and the best entries of its children.
+        for item in reversed(path):
+            if entry not in item.top:
+                break
+            candidates = list(item.entries)
+            for child in item.children.values():
+                candidates.extend(child.top)
+            item.top = heapq.nsmallest(self._size, candidates)
+
+        # Drop empty nodes.
+        for depth in range(len(key), 0, -1):
+            item = path[depth]
+            if item.entries or item.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+        self._count -= 1
+
+    def clear(self) -> None:
+        """Remove all words."""
+
+        self._root = _TrieNode()
+        self._count = 0
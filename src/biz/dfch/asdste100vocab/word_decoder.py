@@ -0,0 +1,266 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""WordDecoder class."""
+
+from __future__ import annotations
+import dataclasses
+import sys
+
+from dacite import Config, from_dict
+
+from .decoder_engine import DecoderEngine
+from .word import Word
+from .word_category import WordCategory
+from .word_meaning import WordMeaning
+from .word_note import WordNote
+from .word_source import WordSource
+from .word_status import WordStatus
+from .word_type import WordType
+
+
+class _InvalidDataError(Exception):
+    """The data does not pass the checks of the fast decoder."""
+
+
+class WordDecoder:
+    """
+    Decode `Word` items from JSON data.
+
+    The fast engine builds the frozen dataclasses directly and resolves
+    enums with lookup tables. When the data does not pass its checks, the
+    data is decoded with the strict `dacite` configuration instead. So both
+    engines raise the same errors for invalid data.
+
+    The fast engine interns the strings that repeat across entries (names,
+    spellings, sources, meaning values and note values) with
+    :func:`sys.intern`, so equal values share one object.
+    """
+
+    DACITE_CONFIG: Config = Config(
+        strict=True,
+        type_hooks={
+            WordStatus: WordStatus,
+            WordType: WordType,
+            WordCategory: WordCategory,
+        },
+        forward_references={
+            Word.__name__: Word,
+            WordMeaning.__name__: WordMeaning,
+            WordNote.__name__: WordNote,
+        },
+    )
+
+    _statuses: dict[str, WordStatus] = {item.value: item for item in WordStatus}
+    _types: dict[str, WordType] = {item.value: item for item in WordType}
+    _categories: dict[str, WordCategory] = {item.value: item for item in WordCategory}
+
+    _word_keys: frozenset[str] = frozenset(f.name for f in dataclasses.fields(Word))
+    _meaning_keys: frozenset[str] = frozenset(f.name for f in dataclasses.fields(WordMeaning))
+    _note_keys: frozenset[str] = frozenset(f.name for f in dataclasses.fields(WordNote))
+
+    @staticmethod
+    def decode(data: object, engine: DecoderEngine = DecoderEngine.FAST, *, intern: bool = True) -> Word:
+        """
+        Decode a `Word` from JSON data.
+
+        Parameters
+        ----------
+        data:
+            The JSON data (a dict) of one `Word`.
+        engine:
+            The decoder engine (default ``DecoderEngine.FAST``).
+        intern:
+            When `True` (default), the fast engine interns repeated strings.
+            The `dacite` engine does not intern strings.
+
+        Returns
+        -------
+        Word
+            The decoded `Word`.
+
+        Raises
+        ------
+        dacite.DaciteError, ValueError
+            If the data is not a valid `Word`.
+        """
+
+        assert isinstance(engine, DecoderEngine), type(engine)
+        assert isinstance(intern, bool), type(intern)
+
+        if engine == DecoderEngine.FAST:
+            try:
+                return WordDecoder._decode_word(data, intern)
+            except _InvalidDataError:
+                pass
+
+        return from_dict(data_class=Word, data=data, config=WordDecoder.DACITE_CONFIG)  # type: ignore
+
+    @staticmethod
+    def decode_summary(data: object) -> dict[str, object]:
+        """
+        Decode only `name`, `status`, `type_`, `source` and `category` of a
+        `Word` from JSON data.
+
+        The other fields are not checked. If the decoded fields are not
+        valid, the complete data is decoded to raise the same error as
+        :meth:`decode`.
+
+        Returns
+        -------
+        dict[str, object]
+            The decoded field values by field name.
+        """
+
+        try:
+            data = WordDecoder._check_keys(data, WordDecoder._word_keys)
+            if "name" not in data:
+                raise _InvalidDataError("name")
+
+            return {
+                "name": WordDecoder._get_str(data, "name", None, intern=True),
+                "status": WordDecoder._get_enum(WordDecoder._statuses, data, "status", WordStatus.UNKNOWN),
+                "type_": WordDecoder._get_enum(WordDecoder._types, data, "type_", WordType.UNKNOWN),
+                "source": WordDecoder._get_str(data, "source", WordSource.UNKNOWN, intern=True),
+                "category": WordDecoder._get_enum(WordDecoder._categories, data, "category", WordCategory.DEFAULT),
+            }
+        except _InvalidDataError:
+            word = from_dict(data_class=Word, data=data, config=WordDecoder.DACITE_CONFIG)  # type: ignore
+            return {key: getattr(word, key) for key in ("name", "status", "type_", "source", "category")}
+
+    @staticmethod
+    def _new(cls: type, values: dict[str, object]) -> object:
+        """Make a frozen dataclass instance without calling `__init__`."""
+
+        result = object.__new__(cls)
+        result.__dict__.update(values)
+
+        return result
+
+    @staticmethod
+    def _get_enum(table: dict, data: dict, key: str, default: object) -> object:
+        if key not in data:
+            return default
+
+        value = data[key]
+        if type(value) is not str or value not in table:  # pylint: disable=C0123
+            raise _InvalidDataError(key)
+
+        return table[value]
+
+    @staticmethod
+    def _get_str(data: dict, key: str, default: object, optional: bool = False, intern: bool = False) -> object:
+        if key not in data:
+            return default
+
+        value = data[key]
+        if type(value) is not str:  # pylint: disable=C0123
+            if optional and value is None:
+                return value
+            raise _InvalidDataError(key)
+
+        return sys.intern(value) if intern else value
+
+    @staticmethod
+    def _get_str_list(data: dict, key: str, intern: bool = False) -> list[str]:
+        if key not in data:
+            return []
+
+        value = data[key]
+        if type(value) is not list:  # pylint: disable=C0123
+            raise _InvalidDataError(key)
+        for item in value:
+            if type(item) is not str:  # pylint: disable=C0123
+                raise _InvalidDataError(key)
+
+        return [sys.intern(item) for item in value] if intern else list(value)
+
+    @staticmethod
+    def _get_list(data: dict, key: str, decode, intern: bool) -> list:
+        if key not in data:
+            return []
+
+        value = data[key]
+        if type(value) is not list:  # pylint: disable=C0123
+            raise _InvalidDataError(key)
+
+        return [decode(item, intern) for item in value]
+
+    @staticmethod
+    def _get_note(data: dict, intern: bool) -> WordNote | None:
+        value = data.get("note")
+        if value is None:
+            return None
+
+        return WordDecoder._decode_note(value, intern)
+
+    @staticmethod
+    def _check_keys(data: object, keys: frozenset[str]) -> dict:
+        if type(data) is not dict or not keys.issuperset(data):  # pylint: disable=C0123
+            raise _InvalidDataError(data)
+
+        return data
+
+    @staticmethod
+    def _decode_word(data: object, intern: bool = True) -> Word:
+        data = WordDecoder._check_keys(data, WordDecoder._word_keys)
+        if "name" not in data:
+            raise _InvalidDataError("name")
+
+        values = {
+            "name": WordDecoder._get_str(data, "name", None, intern=intern),
+            "status": WordDecoder._get_enum(WordDecoder._statuses, data, "status", WordStatus.UNKNOWN),
+            "type_": WordDecoder._get_enum(WordDecoder._types, data, "type_", WordType.UNKNOWN),
+            "meanings": WordDecoder._get_list(data, "meanings", WordDecoder._decode_meaning, intern),
+            "spellings": WordDecoder._get_str_list(data, "spellings", intern),
+            "alternatives": WordDecoder._get_list(data, "alternatives", WordDecoder._decode_word, intern),
+            "source": WordDecoder._get_str(data, "source", WordSource.UNKNOWN, intern=intern),
+            "category": WordDecoder._get_enum(WordDecoder._categories, data, "category", WordCategory.DEFAULT),
+            "ste_example": WordDecoder._get_str_list(data, "ste_example"),
+            "nonste_example": WordDecoder._get_str_list(data, "nonste_example"),
+            "note": WordDecoder._get_note(data, intern),
+        }
+
+        return WordDecoder._new(Word, values)  # type: ignore
+
+    @staticmethod
+    def _decode_meaning(data: object, intern: bool = True) -> WordMeaning:
+        data = WordDecoder._check_keys(data, WordDecoder._meaning_keys)
+        if "value" not in data:
+            raise _InvalidDataError("value")
+
+        values = {
+            "value": WordDecoder._get_str(data, "value", None, intern=intern),
+            "ste_example": WordDecoder._get_str_list(data, "ste_example"),
+            "nonste_example": WordDecoder._get_str_list(data, "nonste_example"),
+            "note": WordDecoder._get_note(data, intern),
+        }
+
+        return WordDecoder._new(WordMeaning, values)  # type: ignore
+
+    @staticmethod
+    def _decode_note(data: object, intern: bool = True) -> WordNote:
+        data = WordDecoder._check_keys(data, WordDecoder._note_keys)
+
+        values = {
+            "value": WordDecoder._get_str(data, "value", None, optional=True, intern=intern),
+            "words": WordDecoder._get_list(data, "words", WordDecoder._decode_word, intern),
+            "ste_example": WordDecoder._get_str(data, "ste_example", None, optional=True),
+            "nonste_example": WordDecoder._get_str(data, "nonste_example", None, optional=True),
+        }
+
+        return WordDecoder._new(WordNote, values)  # type: ignore
@@ -0,0 +1,135 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import dataclasses
+import json
+import unittest
+
+from src.biz.dfch.asdste100vocab.compact_word import CompactWord
+from src.biz.dfch.asdste100vocab.compact_word_meaning import CompactWordMeaning
+from src.biz.dfch.asdste100vocab.compact_word_note import CompactWordNote
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_filter import VocabFilter
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_meaning import WordMeaning
+from src.biz.dfch.asdste100vocab.word_note import WordNote
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+
+class TestCompactWord(unittest.TestCase):
+    def setUp(self):
+        Vocab.clear_cache()
+
+    def tearDown(self):
+        Vocab.clear_cache()
+
+    def test_fields_equal_word_fields(self):
+        for compact, cls in ((CompactWord, Word), (CompactWordMeaning, WordMeaning), (CompactWordNote, WordNote)):
+            with self.subTest(cls=cls):
+                expected = [f.name for f in dataclasses.fields(cls)]
+
+                result = [f.name for f in dataclasses.fields(compact)]
+
+                self.assertEqual(expected, result)
+
+    def test_has_slots_and_is_frozen(self):
+        sut = CompactWord(name="abandon")
+
+        self.assertFalse(hasattr(sut, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            sut.name = "other"  # type: ignore
+
+    def test_is_hashable(self):
+        word = Word(
+            name="abaft",
+            alternatives=[Word(name="aft of")],
+            meanings=[WordMeaning(value="behind", note=WordNote(value="note", words=[Word(name="aft")]))],
+        )
+
+        sut = CompactWord.from_word(word)
+
+        self.assertEqual(hash(CompactWord.from_word(word)), hash(sut))
+        self.assertIsInstance(sut.alternatives, tuple)
+        self.assertIsInstance(sut.meanings[0], CompactWordMeaning)
+        self.assertIsInstance(sut.meanings[0].note, CompactWordNote)
+        self.assertIsInstance(sut.meanings[0].note.words[0], CompactWord)  # type: ignore
+
+    def test_from_word_and_to_word_of_all_builtin_words(self):
+        words = list(Vocab(use_ste100_technical_word=True))
+
+        result = [CompactWord.from_word(word).to_word() for word in words]
+
+        self.assertEqual(words, result)
+
+    def test_vocab_compact(self):
+        expected = Vocab(use_ste100_technical_word=True)
+
+        sut = Vocab(use_ste100_technical_word=True, compact=True)
+
+        self.assertEqual(len(expected), len(sut))
+        self.assertTrue(all(isinstance(word, CompactWord) for word in sut))
+        self.assertEqual(expected.as_dict(), sut.as_dict())
+        self.assertEqual(expected.write_jsonl_text(), sut.write_jsonl_text())
+
+    def test_vocab_compact_without_cache_and_snapshot(self):
+        expected = Vocab(compact=True)
+
+        sut = Vocab(compact=True, use_cache=False, use_snapshot=False)
+
+        self.assertEqual(list(expected), list(sut))
+
+    def test_vocab_compact_predicate_receives_compact_word(self):
+        received = []
+
+        def predicate(word) -> bool:
+            received.append(type(word))
+            return word.status == WordStatus.APPROVED
+
+        sut = Vocab(compact=True, predicate=predicate, load_filter=VocabFilter(name_prefix="ab"))
+
+        self.assertGreater(len(sut), 0)
+        self.assertEqual({CompactWord}, set(received))
+
+    def test_vocab_compact_mutators(self):
+        sut = Vocab(use_ste100=False, compact=True)
+        word = CompactWord(name="abaft")
+
+        sut.append(word)
+        sut.replace(word, CompactWord(name="aft"))
+        sut.append(Word(name="test"))
+
+        self.assertEqual(["aft", "test"], [item.name for item in sut])
+        self.assertEqual("aft", sut.find("AFT")[0].name)
+        sut.remove(CompactWord(name="aft"))
+        self.assertEqual(1, len(sut))
+
+    def test_vocab_compact_cannot_be_lazy(self):
+        with self.assertRaises(AssertionError):
+            Vocab(compact=True, lazy=True)
+
+    def test_as_dict_converts_tuples_to_lists(self):
+        sut = Vocab(use_ste100=False)
+        sut.append(CompactWord(name="test", spellings=("tests",)))
+
+        result = sut.as_dict()
+
+        self.assertEqual(["tests"], result[0]["spellings"])
+        self.assertEqual(["tests"], json.loads(sut.write_jsonl_text()[0])["spellings"])
@@ -0,0 +1,88 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.edit_distance import EditDistance
+
+
+def _distance(value: str, other: str, transpositions: bool) -> int:
+    """Reference implementation (dynamic programming)."""
+
+    rows = [[0] * (len(other) + 1) for _ in range(len(value) + 1)]
+    for i in range(len(value) + 1):
+        rows[i][0] = i
+    for j in range(len(other) + 1):
+        rows[0][j] = j
+
+    for i in range(1, len(value) + 1):
+        for j in range(1, len(other) + 1):
+            cost = int(value[i - 1] != other[j - 1])
+            rows[i][j] = min(rows[i - 1][j] + 1, rows[i][j - 1] + 1, rows[i - 1][j - 1] + cost)
+            if transpositions and i > 1 and j > 1 and value[i - 1] == other[j - 2] and value[i - 2] == other[j - 1]:
+                rows[i][j] = min(rows[i][j], rows[i - 2][j - 2] + 1)
+
+    return rows[-1][-1]
+
+
+class TestEditDistance(unittest.TestCase):
+    def test_levenshtein(self):
+        sut = EditDistance.LEVENSHTEIN
+
+        self.assertEqual(0, sut.get("", ""))
+        self.assertEqual(3, sut.get("abc", ""))
+        self.assertEqual(3, sut.get("", "abc"))
+        self.assertEqual(3, sut.get("kitten", "sitting"))
+        self.assertEqual(2, sut.get("ab", "ba"))
+        self.assertEqual(1, sut.get("Test", "test"))
+
+    def test_damerau(self):
+        sut = EditDistance.DAMERAU
+
+        self.assertEqual(0, sut.get("", ""))
+        self.assertEqual(3, sut.get("kitten", "sitting"))
+        self.assertEqual(1, sut.get("ab", "ba"))
+        self.assertEqual(1, sut.get("instlal", "install"))
+        # Optimal string alignment: no substring is edited twice.
+        self.assertEqual(3, sut.get("ca", "abc"))
+
+    def test_long_values(self):
+        value = "a" * 100 + "b" * 100
+
+        self.assertEqual(100, EditDistance.LEVENSHTEIN.get(value, "b" * 100))
+        self.assertEqual(2, EditDistance.LEVENSHTEIN.get(value, "a" * 99 + "ba" + "b" * 99))
+        self.assertEqual(1, EditDistance.DAMERAU.get(value, "a" * 99 + "ba" + "b" * 99))
+
+    def test_equals_reference(self):
+        rnd = random.Random(42)
+
+        for _ in range(2000):
+            value = "".join(rnd.choice("abc") for _ in range(rnd.randrange(10)))
+            other = "".join(rnd.choice("abc") for _ in range(rnd.randrange(10)))
+
+            self.assertEqual(_distance(value, other, False), EditDistance.LEVENSHTEIN.get(value, other))
+            self.assertEqual(_distance(value, other, True), EditDistance.DAMERAU.get(value, other))
+
+    def test_get_matcher(self):
+        sut = EditDistance.LEVENSHTEIN.get_matcher("install")
+
+        self.assertEqual([0, 1, 5], [sut(value) for value in ("install", "instal", "in")])
@@ -0,0 +1,43 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import io
+from pathlib import Path
+import pickle
+import unittest
+
+from src.biz.dfch.asdste100vocab.index_unpickler import IndexUnpickler
+
+
+class TestIndexUnpickler(unittest.TestCase):
+    def test_load_builtins(self):
+        expected = ({"key": [1, 2]}, b"\x00\x01", (3.5, None, True))
+        data = pickle.dumps(expected, protocol=5)
+
+        result = IndexUnpickler(io.BytesIO(data)).load()
+
+        self.assertEqual(expected, result)
+
+    def test_load_class_throws(self):
+        data = pickle.dumps({"key": Path("foreign")}, protocol=5)
+
+        with self.assertRaises(pickle.UnpicklingError):
+            IndexUnpickler(io.BytesIO(data)).load()
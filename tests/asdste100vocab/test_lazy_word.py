@@ -0,0 +1,110 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import dataclasses
+import unittest
+
+from dacite import UnexpectedDataError
+
+from src.biz.dfch.asdste100vocab.lazy_word import LazyWord
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+
+class TestLazyWord(unittest.TestCase):
+    # pylint: disable=C0301
+    JSONL = r"""{"name": "abandon", "status": "rejected", "type_": "v", "meanings": [], "spellings": [], "alternatives": [{"name": "GO", "status": "approved", "type_": "v", "meanings": [], "spellings": [], "alternatives": [], "source": "STE100:9", "category": "0", "ste_example": ["IF THERE IS A FIRE, IMMEDIATELY GO TO A SAFE AREA."], "nonste_example": ["If there is a fire, immediately abandon the area."], "note": null}], "source": "STE100:9", "category": "0", "ste_example": [], "nonste_example": [], "note": null}"""
+
+    def test_summary_fields_are_decoded(self):
+        sut = LazyWord.from_jsonl_text(self.JSONL)
+
+        self.assertEqual("abandon", sut.name)
+        self.assertIs(WordStatus.REJECTED, sut.status)
+        self.assertIs(WordType.VERB, sut.type_)
+        self.assertEqual("STE100:9", sut.source)
+        self.assertFalse(sut.is_materialized)
+
+    def test_first_access_materializes(self):
+        sut = LazyWord.from_jsonl_text(self.JSONL)
+
+        result = sut.alternatives
+
+        self.assertTrue(sut.is_materialized)
+        self.assertEqual(1, len(result))
+        self.assertEqual("GO", result[0].name)
+        self.assertIs(result, sut.alternatives)
+
+    def test_is_instance_of_word(self):
+        sut = LazyWord.from_jsonl_text(self.JSONL)
+
+        self.assertIsInstance(sut, Word)
+        self.assertTrue(dataclasses.is_dataclass(sut))
+
+    def test_equals_word(self):
+        expected = Vocab.read_jsonl_text(self.JSONL)
+
+        sut = LazyWord.from_jsonl_text(self.JSONL)
+
+        self.assertEqual(expected, sut)
+        self.assertEqual(sut, expected)
+        self.assertNotEqual(dataclasses.replace(expected, name="other"), sut)
+
+    def test_as_dict_equals_word(self):
+        expected = dataclasses.asdict(Vocab.read_jsonl_text(self.JSONL))
+
+        result = dataclasses.asdict(LazyWord.from_jsonl_text(self.JSONL))
+
+        self.assertEqual(expected, result)
+
+    def test_is_frozen(self):
+        sut = LazyWord.from_jsonl_text(self.JSONL)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            sut.name = "other"  # type: ignore
+
+    def test_replace_returns_lazy_word(self):
+        sut = LazyWord.from_jsonl_text(self.JSONL)
+
+        result = dataclasses.replace(sut, name="other")
+
+        self.assertEqual("other", result.name)
+        self.assertEqual("GO", result.alternatives[0].name)
+
+    def test_invalid_summary_raises(self):
+        with self.assertRaises(UnexpectedDataError):
+            LazyWord.from_jsonl_text('{"name": "x", "foo": 1}')
+
+    def test_vocab_lazy_equals_vocab(self):
+        expected = Vocab(use_ste100=True, use_ste100_technical_word=True)
+
+        sut = Vocab(use_ste100=True, use_ste100_technical_word=True, lazy=True)
+
+        self.assertEqual(len(expected), len(sut))
+        self.assertTrue(all(isinstance(word, LazyWord) for word in sut))
+        self.assertEqual([word.name for word in expected], [word.name for word in sut])
+        self.assertEqual(expected.find("except"), sut.find("except"))
+        self.assertEqual(list(expected), list(sut))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,6 +26,81 @@ import src.biz.dfch.asdste100vocab as vocab
 
 class TestMain(unittest.TestCase):
     def test_import(self):
+        self.assertEqual("CompactWord", vocab.CompactWord.__name__)
+        self.assertEqual("CompactWord", vocab.CompactWord.__qualname__)
+
+        self.assertEqual("CompactWordMeaning", vocab.CompactWordMeaning.__name__)
+        self.assertEqual("CompactWordMeaning", vocab.CompactWordMeaning.__qualname__)
+
+        self.assertEqual("CompactWordNote", vocab.CompactWordNote.__name__)
+        self.assertEqual("CompactWordNote", vocab.CompactWordNote.__qualname__)
+
+        self.assertEqual("DecoderEngine", vocab.DecoderEngine.__name__)
+        self.assertEqual("DecoderEngine", vocab.DecoderEngine.__qualname__)
+
+        self.assertEqual("EditDistance", vocab.EditDistance.__name__)
+        self.assertEqual("EditDistance", vocab.EditDistance.__qualname__)
+
+        self.assertEqual("IndexUnpickler", vocab.IndexUnpickler.__name__)
+        self.assertEqual("IndexUnpickler", vocab.IndexUnpickler.__qualname__)
+
+        self.assertEqual("LazyWord", vocab.LazyWord.__name__)
+        self.assertEqual("LazyWord", vocab.LazyWord.__qualname__)
+
+        self.assertEqual("MappedVocabFile", vocab.MappedVocabFile.__name__)
+        self.assertEqual("MappedVocabFile", vocab.MappedVocabFile.__qualname__)
+
+        self.assertEqual("Metaphone", vocab.Metaphone.__name__)
+        self.assertEqual("Metaphone", vocab.Metaphone.__qualname__)
+
+        self.assertEqual("VocabAlternativeIndex", vocab.VocabAlternativeIndex.__name__)
+        self.assertEqual("VocabAlternativeIndex", vocab.VocabAlternativeIndex.__qualname__)
+
+        self.assertEqual("VocabBkTree", vocab.VocabBkTree.__name__)
+        self.assertEqual("VocabBkTree", vocab.VocabBkTree.__qualname__)
+
+        self.assertEqual("VocabDeleteIndex", vocab.VocabDeleteIndex.__name__)
+        self.assertEqual("VocabDeleteIndex", vocab.VocabDeleteIndex.__qualname__)
+
+        self.assertEqual("VocabFieldIndex", vocab.VocabFieldIndex.__name__)
+        self.assertEqual("VocabFieldIndex", vocab.VocabFieldIndex.__qualname__)
+
+        self.assertEqual("VocabFilter", vocab.VocabFilter.__name__)
+        self.assertEqual("VocabFilter", vocab.VocabFilter.__qualname__)
+
+        self.assertEqual("VocabIndex", vocab.VocabIndex.__name__)
+        self.assertEqual("VocabIndex", vocab.VocabIndex.__qualname__)
+
+        self.assertEqual("VocabLineError", vocab.VocabLineError.__name__)
+        self.assertEqual("VocabLineError", vocab.VocabLineError.__qualname__)
+
+        self.assertEqual("VocabNgramIndex", vocab.VocabNgramIndex.__name__)
+        self.assertEqual("VocabNgramIndex", vocab.VocabNgramIndex.__qualname__)
+
+        self.assertEqual("VocabPhoneticIndex", vocab.VocabPhoneticIndex.__name__)
+        self.assertEqual("VocabPhoneticIndex", vocab.VocabPhoneticIndex.__qualname__)
+
+        self.assertEqual("VocabPrefixIndex", vocab.VocabPrefixIndex.__name__)
+        self.assertEqual("VocabPrefixIndex", vocab.VocabPrefixIndex.__qualname__)
+
+        self.assertEqual("VocabQuery", vocab.VocabQuery.__name__)
+        self.assertEqual("VocabQuery", vocab.VocabQuery.__qualname__)
+
+        self.assertEqual("VocabQueryCache", vocab.VocabQueryCache.__name__)
+        self.assertEqual("VocabQueryCache", vocab.VocabQueryCache.__qualname__)
+
+        self.assertEqual("VocabQueryCacheInfo", vocab.VocabQueryCacheInfo.__name__)
+        self.assertEqual("VocabQueryCacheInfo", vocab.VocabQueryCacheInfo.__qualname__)
+
+        self.assertEqual("VocabQueryPlan", vocab.VocabQueryPlan.__name__)
+        self.assertEqual("VocabQueryPlan", vocab.VocabQueryPlan.__qualname__)
+
+        self.assertEqual("VocabTextIndex", vocab.VocabTextIndex.__name__)
+        self.assertEqual("VocabTextIndex", vocab.VocabTextIndex.__qualname__)
+
+        self.assertEqual("VocabTrie", vocab.VocabTrie.__name__)
+        self.assertEqual("VocabTrie", vocab.VocabTrie.__qualname__)
+
         self.assertEqual("Word", vocab.Word.__name__)
         self.assertEqual("Word", vocab.Word.__qualname__)
 
@@ -0,0 +1,121 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.lazy_word import LazyWord
+from src.biz.dfch.asdste100vocab.mapped_vocab_file import MappedVocabFile
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+from .vocab_file import VocabFile
+
+
+class TestMappedVocabFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_path = Path(tempfile.mkdtemp())
+        self.fullname = self.tmp_path / VocabFile.SAME_WORD_TWICE
+        shutil.copyfile(Path(__file__).parent / VocabFile.SAME_WORD_TWICE, self.fullname)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_get_by_position(self):
+        expected = Vocab.read_jsonl_file(BuiltInVocab.STE100_BASE.value, lambda _: True)
+
+        with MappedVocabFile(BuiltInVocab.STE100_BASE.value) as sut:
+            self.assertEqual(len(expected), len(sut))
+            self.assertEqual(expected[0], sut[0])
+            self.assertEqual(expected[1000], sut[1000])
+            self.assertEqual(expected[-1], sut[-1])
+
+    def test_get_out_of_range_throws(self):
+        with MappedVocabFile(self.fullname) as sut:
+            with self.assertRaises(IndexError):
+                _ = sut[2]
+
+    def test_iterate(self):
+        expected = Vocab.read_jsonl_file(self.fullname, lambda _: True)
+
+        with MappedVocabFile(self.fullname) as sut:
+            result = list(sut)
+
+        self.assertEqual(expected, result)
+
+    def test_find_returns_all_homonyms(self):
+        with MappedVocabFile(self.fullname) as sut:
+            result = sut.find("Test")
+
+        self.assertEqual(["TEST", "test"], [word.name for word in result])
+
+    def test_find_not_found_returns_empty_list(self):
+        with MappedVocabFile(self.fullname) as sut:
+            result = sut.find("zzzz")
+
+        self.assertEqual([], result)
+
+    def test_lazy(self):
+        with MappedVocabFile(self.fullname, lazy=True) as sut:
+            result = sut[0]
+
+            self.assertIsInstance(result, LazyWord)
+            self.assertEqual("TEST", result.name)
+
+    def test_save_and_load_index(self):
+        with MappedVocabFile(self.fullname) as sut:
+            index = sut.save_index()
+
+        self.assertEqual(MappedVocabFile.get_index_path(self.fullname), index)
+
+        with MappedVocabFile(self.fullname, index=index) as sut:
+            # pylint: disable=W0212
+            self.assertIsNotNone(sut._names)
+            self.assertEqual([0, 1], sut.positions("test"))
+            self.assertEqual("test", sut[1].name)
+
+    def test_stale_index_is_rebuilt(self):
+        with MappedVocabFile(self.fullname) as sut:
+            index = sut.save_index()
+        with open(self.fullname, "a", encoding="utf-8") as f:
+            f.write((Path(__file__).parent / VocabFile.ONE_ITEM).read_text(encoding="utf-8"))
+
+        with MappedVocabFile(self.fullname, index=index) as sut:
+            self.assertEqual(3, len(sut))
+            self.assertEqual([2], sut.positions("a"))
+
+    def test_empty_file(self):
+        fullname = self.tmp_path / "empty.jsonl"
+        fullname.touch()
+
+        with MappedVocabFile(fullname) as sut:
+            self.assertEqual(0, len(sut))
+            self.assertEqual([], sut.find("a"))
+
+    def test_non_existent_file_throws(self):
+        with self.assertRaises(FileNotFoundError):
+            MappedVocabFile(self.tmp_path / VocabFile.NON_EXISTENT_FILE)
+
+
+if __name__ == "__main__":
+    unittest.main()
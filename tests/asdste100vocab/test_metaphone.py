@@ -0,0 +1,62 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import unittest
+
+from src.biz.dfch.asdste100vocab.metaphone import Metaphone
+
+
+class TestMetaphone(unittest.TestCase):
+    def test_encode(self):
+        expected = {
+            "knight": "NT",
+            "phone": "FN",
+            "school": "SKL",
+            "wright": "RT",
+            "xylophone": "SLFN",
+            "science": "SNS",
+            "judge": "JJ",
+            "signed": "SNT",
+            "chemical": "XMKL",
+            "nation": "NXN",
+            "thumb": "0M",
+            "bulk": "BLK",
+        }
+
+        for value, key in expected.items():
+            with self.subTest(value=value):
+                self.assertEqual(key, Metaphone.encode(value))
+
+    def test_encode_sound_alike(self):
+        for value, other in (("cauk", "caulk"), ("fone", "phone"), ("wok", "walk"), ("haf", "half"), ("kud", "could")):
+            with self.subTest(value=value):
+                self.assertEqual(Metaphone.encode(other), Metaphone.encode(value))
+
+    def test_encode_is_case_insensitive(self):
+        self.assertEqual(Metaphone.encode("caulk"), Metaphone.encode("CAULK"))
+
+    def test_encode_words(self):
+        self.assertEqual("ABRT BTN", Metaphone.encode("abort button"))
+        self.assertEqual("S R", Metaphone.encode("x-ray"))
+
+    def test_encode_without_letters(self):
+        self.assertEqual("", Metaphone.encode(""))
+        self.assertEqual("", Metaphone.encode(" 12 "))
@@ -0,0 +1,199 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_alternative_index import VocabAlternativeIndex
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+
+def _alternatives(vocab: Vocab, value: str) -> list[Word]:
+    result: dict[str, Word] = {}
+    for word in vocab:
+        if word.status == WordStatus.REJECTED and word.name.lower() == value.lower():
+            for alternative in word.alternatives:
+                result.setdefault(alternative.name.lower(), alternative)
+
+    return list(result.values())
+
+
+def _rejected_for(vocab: Vocab, value: str) -> list[Word]:
+    return vocab.filter(
+        lambda word: (
+            word.status == WordStatus.REJECTED
+            and any(alternative.name.lower() == value.lower() for alternative in word.alternatives)
+        )
+    )
+
+
+class TestVocabAlternativeIndex(unittest.TestCase):
+    def setUp(self):
+        self.go = Word(name="GO", status=WordStatus.APPROVED)
+        self.stop = Word(name="STOP", status=WordStatus.APPROVED)
+        self.first = Word(name="abandon", status=WordStatus.REJECTED, type_=WordType.VERB, alternatives=[self.go])
+        self.second = Word(
+            name="Abandon",
+            status=WordStatus.REJECTED,
+            type_=WordType.NOUN,
+            alternatives=[Word(name="go", status=WordStatus.APPROVED), self.stop],
+        )
+        self.third = Word(name="leave", status=WordStatus.REJECTED, alternatives=[self.go, self.go])
+        self.approved = Word(name="go", status=WordStatus.APPROVED, alternatives=[self.stop])
+        self.sut = VocabAlternativeIndex([self.first, self.approved, self.second, self.third])
+
+    def test_get_alternatives(self):
+        self.assertEqual([self.go, self.stop], self.sut.get_alternatives("ABANDON"))
+        self.assertEqual([self.go], self.sut.get_alternatives("leave"))
+        self.assertEqual([], self.sut.get_alternatives("go"))
+        self.assertEqual(2, len(self.sut))
+
+    def test_get_rejected(self):
+        self.assertEqual([self.first, self.second, self.third], self.sut.get_rejected("Go"))
+        self.assertEqual([self.second], self.sut.get_rejected("stop"))
+        self.assertEqual([], self.sut.get_rejected("abandon"))
+
+    def test_remove(self):
+        self.sut.remove(self.first)
+        self.sut.remove(self.approved)
+
+        self.assertIs(self.second.alternatives[0], self.sut.get_alternatives("abandon")[0])
+        self.assertEqual([self.second, self.third], self.sut.get_rejected("go"))
+        with self.assertRaises(ValueError):
+            self.sut.remove(self.first)
+
+    def test_remove_last_drops_keys(self):
+        self.sut.remove(self.second)
+
+        self.assertEqual([], self.sut.get_rejected("stop"))
+        self.assertEqual([self.go], self.sut.get_alternatives("abandon"))
+
+    def test_remove_is_by_identity(self):
+        other = Word(name="leave", status=WordStatus.REJECTED, alternatives=[self.go, self.go])
+        self.sut.add(other)
+
+        self.sut.remove(other)
+
+        self.assertIs(self.third, self.sut.get_rejected("go")[-1])
+
+    def test_remove_duplicated_object_at_position(self):
+        words = [self.first, self.third, self.first]
+        sut = VocabAlternativeIndex(words)
+        del words[0]
+
+        sut.remove(self.first, words, 0)
+
+        self.assertEqual([self.third, self.first], sut.get_rejected("go"))
+        self.assertEqual([self.go], sut.get_alternatives("abandon"))
+
+    def test_insert_keeps_order(self):
+        word = Word(name="abandon", status=WordStatus.REJECTED, alternatives=[self.stop])
+        words = [word, self.first, self.approved, self.second, self.third]
+
+        self.sut.insert(word, words)
+
+        self.assertEqual([self.stop, self.go], self.sut.get_alternatives("abandon"))
+        self.assertEqual([word, self.second], self.sut.get_rejected("stop"))
+        self.assertEqual([self.first, self.second, self.third], self.sut.get_rejected("go"))
+
+    def test_clear(self):
+        self.sut.clear()
+
+        self.assertEqual(0, len(self.sut))
+        self.assertEqual([], self.sut.get_rejected("go"))
+
+
+class TestVocabAlternatives(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+
+    def test_alternatives_and_rejected_for(self):
+        for value in ("abandon", "ABAFT", "go", "stop", "Abandon", "unknown"):
+            with self.subTest(value=value):
+                self.assertEqual(_alternatives(self.sut, value), self.sut.alternatives(value))
+                self.assertEqual(_rejected_for(self.sut, value), self.sut.rejected_for(value))
+
+    def test_alternatives_are_approved(self):
+        result = self.sut.alternatives("abandon")
+
+        self.assertEqual(["GO", "STOP"], [word.name for word in result])
+        self.assertTrue(all(word.status == WordStatus.APPROVED for word in result))
+
+    def test_alternatives_after_mutations(self):
+        sut = Vocab(use_ste100=True)
+        sut.alternatives("abandon")
+        word = Word(name="abandon", status=WordStatus.REJECTED, alternatives=[Word(name="LEAVE")])
+        rejected = sut.find("abandon")[0]
+        mutations = [
+            lambda: sut.append(word),
+            lambda: sut.replace(rejected, Word(name="abandon", status=WordStatus.REJECTED)),
+            lambda: sut.remove(word),
+            lambda: sut.pop(0),
+            lambda: sut.extend([word, word]),
+            lambda: sut.__delitem__(slice(0, 10)),
+            lambda: sut.sort(reverse=True),
+            lambda: sut.pop(),
+        ]
+
+        for idx, mutate in enumerate(mutations):
+            with self.subTest(idx=idx):
+                mutate()
+
+                for value in ("abandon", "go", "leave", "stop"):
+                    self.assertEqual(_alternatives(sut, value), sut.alternatives(value))
+                    self.assertEqual(_rejected_for(sut, value), sut.rejected_for(value))
+
+        sut.clear()
+        self.assertEqual([], sut.alternatives("abandon"))
+
+    def test_alternatives_with_duplicated_objects_after_mutations(self):
+        rnd = random.Random(42)
+        go = Word(name="GO", status=WordStatus.APPROVED)
+        words = [
+            Word(name=name, status=WordStatus.REJECTED, alternatives=[go]) for name in ("abandon", "leave", "quit")
+        ]
+        words.append(Word(name="go", status=WordStatus.APPROVED))
+        sut = Vocab(use_ste100=False)
+        sut.extend(words)
+        sut.rejected_for("go")
+
+        for _ in range(500):
+            operation = rnd.randrange(5)
+            if operation == 0 or len(sut) < 3:
+                sut.append(rnd.choice(words))
+            elif operation == 1:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 2:
+                sut.replace(sut[rnd.randrange(len(sut))], rnd.choice(words))
+            elif operation == 3:
+                sut.remove(sut[rnd.randrange(len(sut))])
+            else:
+                start = rnd.randrange(len(sut))
+                del sut[start : start + 2]
+
+            expected = VocabAlternativeIndex(list(sut))
+            self.assertEqual(
+                [id(word) for word in expected.get_rejected("go")], [id(word) for word in sut.rejected_for("go")]
+            )
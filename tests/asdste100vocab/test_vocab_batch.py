@@ -0,0 +1,123 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import io
+import re
+import unittest
+
+from src.biz.dfch.asdste100vocab.commands.batch import get_phrases
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+
+
+class TestVocabBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+        cls.values = ["close", "CLOSE", "clse", "valv", "xyzzy", "close", "", "abort", "valve"]
+
+    def test_find_many_is_find(self):
+        result = self.sut.find_many(self.values)
+
+        self.assertEqual([self.sut.find(value) for value in self.values], result)
+
+    def test_match_many_is_match(self):
+        patterns = [re.escape(value) for value in self.values] + ["^ab", "e$"]
+
+        result = self.sut.match_many(patterns)
+
+        self.assertEqual([self.sut.match(pattern) for pattern in patterns], result)
+
+    def test_similar_many_is_similar(self):
+        for n, cutoff in ((5, 0.6), (1, 0.6), (3, 0.8)):
+            with self.subTest(n=n, cutoff=cutoff):
+                result = self.sut.similar_many(self.values, n=n, cutoff=cutoff)
+
+                expected = [self.sut.similar(value, n=n, cutoff=cutoff) for value in self.values]
+                self.assertEqual(expected, result)
+
+    def test_similar_many_with_index_is_similar(self):
+        result = self.sut.similar_many(self.values, use_index=True)
+
+        expected = [self.sut.similar(value, use_index=True) for value in self.values]
+        self.assertEqual(expected, result)
+
+    def test_similar_many_counts_each_item_of_a_name(self):
+        # "case" is the name of two items; as with `difflib.get_close_matches`
+        # over all items, it takes two of the `n` places.
+        result = self.sut.similar_many(["clse"], n=2)
+
+        self.assertEqual(self.sut.similar("clse", n=2), result[0])
+
+    def test_examine_many_is_examine(self):
+        values = [value for value in self.values if value]
+
+        result = self.sut.examine_many(values, phonetic=True)
+
+        self.assertEqual([self.sut.examine(value, phonetic=True) for value in values], result)
+
+    def test_results_of_duplicate_values_are_not_shared(self):
+        result = self.sut.find_many(["close", "close"])
+
+        result[0].clear()
+
+        self.assertNotEqual([], result[1])
+
+    def test_many_with_empty_values_returns_empty_list(self):
+        for method in (self.sut.find_many, self.sut.match_many, self.sut.similar_many, self.sut.examine_many):
+            with self.subTest(method=method.__name__):
+                self.assertEqual([], method([]))
+
+    def test_many_accepts_iterator(self):
+        result = self.sut.find_many(iter(["close"]))
+
+        self.assertEqual([self.sut.find("close")], result)
+
+    def test_many_after_append(self):
+        sut = Vocab(use_ste100=True)
+        sut.find_many(["close"])
+        word = sut.find("close")[0]
+
+        sut.append(word)
+
+        self.assertEqual(sut.find("close"), sut.find_many(["close"])[0])
+        self.assertEqual(sut.match("^close$"), sut.match_many(["^close$"])[0])
+
+
+class TestGetPhrases(unittest.TestCase):
+    def test_phrase(self):
+        result = get_phrases("close", False)
+
+        self.assertEqual(["close"], result)
+
+    def test_batch_reads_lines_and_skips_empty_lines(self):
+        stream = io.StringIO("close\n\n  valve  \nclose\n")
+
+        result = get_phrases(None, True, stream)
+
+        self.assertEqual(["close", "valve", "close"], result)
+
+    def test_batch_with_phrase_throws(self):
+        with self.assertRaises(AssertionError):
+            get_phrases("close", True, io.StringIO())
+
+    def test_without_phrase_throws(self):
+        with self.assertRaises(AssertionError):
+            get_phrases(None, False)
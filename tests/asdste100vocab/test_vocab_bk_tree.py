@@ -0,0 +1,157 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.edit_distance import EditDistance
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_bk_tree import VocabBkTree
+from src.biz.dfch.asdste100vocab.word import Word
+
+
+def _within_distance(vocab: Vocab, value: str, k: int, metric: EditDistance) -> list[tuple[Word, int]]:
+    """Reference implementation of `Vocab.within_distance`."""
+
+    distance = metric.get_matcher(value.lower())
+    result = [(word, distance(word.name.lower())) for word in vocab]
+    result = [item for item in result if item[1] <= k]
+    return sorted(result, key=lambda item: (item[1], item[0].name.lower()))
+
+
+class TestVocabBkTree(unittest.TestCase):
+    def test_within_distance(self):
+        sut = VocabBkTree([Word(name=name) for name in ("install", "instal", "Installs", "remove", "in")])
+
+        result = sut.within_distance("INSTALL", 1)
+
+        self.assertEqual([("install", 0), ("instal", 1), ("Installs", 1)], [(w.name, d) for w, d in result])
+        self.assertEqual(5, len(sut))
+
+    def test_within_distance_with_damerau(self):
+        sut = VocabBkTree([Word(name=name) for name in ("install", "isntall", "remove")])
+
+        levenshtein = sut.within_distance("install", 1)
+        damerau = sut.within_distance("install", 1, EditDistance.DAMERAU)
+
+        self.assertEqual(["install"], [w.name for w, _ in levenshtein])
+        self.assertEqual([("install", 0), ("isntall", 1)], [(w.name, d) for w, d in damerau])
+
+    def test_nearest(self):
+        sut = VocabBkTree([Word(name=name) for name in ("abc", "abd", "xyz", "abcd", "b")])
+
+        result = sut.nearest("abc", 3)
+
+        self.assertEqual([("abc", 0), ("abcd", 1), ("abd", 1)], [(w.name, d) for w, d in result])
+        self.assertEqual(["abc"], [w.name for w, _ in sut.nearest("abc", 3, max_distance=0)])
+
+    def test_same_names_are_together(self):
+        first = Word(name="test")
+        second = Word(name="Test")
+        sut = VocabBkTree([first, Word(name="tent"), second])
+
+        result = sut.nearest("test", 1)
+
+        self.assertEqual([(first, 0), (second, 0)], result)
+
+    def test_insert_keeps_vocabulary_order(self):
+        first = Word(name="test")
+        second = Word(name="test")
+        third = Word(name="test")
+        sut = VocabBkTree([first, third])
+
+        sut.insert(second, [first, second, third])
+
+        self.assertEqual([first, second, third], [w for w, _ in sut.within_distance("test", 0)])
+
+    def test_remove(self):
+        word = Word(name="test")
+        sut = VocabBkTree([word, Word(name="tent")])
+
+        sut.remove(word)
+
+        self.assertEqual(["tent"], [w.name for w, _ in sut.within_distance("test", 1)])
+        with self.assertRaises(ValueError):
+            sut.remove(word)
+
+        sut.add(word)
+        self.assertEqual(["test", "tent"], [w.name for w, _ in sut.within_distance("test", 1)])
+
+    def test_empty(self):
+        sut = VocabBkTree()
+
+        self.assertEqual([], sut.within_distance("test", 1))
+        self.assertEqual([], sut.nearest("test", 1))
+
+
+class TestVocabWithinDistance(unittest.TestCase):
+    def test_within_distance_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+        rnd = random.Random(42)
+        words = list(sut)
+
+        for _ in range(20):
+            name = rnd.choice(words).name
+            idx = rnd.randrange(len(name))
+            value = name[:idx] + "x" + name[idx + 1 :]
+            for metric in EditDistance:
+                with self.subTest(value=value, metric=metric):
+                    expected = _within_distance(sut, value, 2, metric)
+
+                    result = sut.within_distance(value, 2, metric=metric)
+
+                    self.assertEqual(len(expected), len(result))
+                    self.assertTrue(all(a[0] is b[0] and a[1] == b[1] for a, b in zip(expected, result)))
+
+    def test_nearest_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+
+        result = sut.nearest("instalation", 1)
+
+        self.assertEqual(["installation"], list(dict.fromkeys(w.name.lower() for w, _ in result)))
+        self.assertEqual(1, result[0][1])
+
+    def test_within_distance_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["test", "Test", "tests", "tent", "text", "rest"]
+        sut = Vocab(use_ste100=False)
+        sut.within_distance("test", 1)
+
+        for _ in range(1000):
+            operation = rnd.randrange(6)
+            if operation == 0 or len(sut) == 0:
+                sut.append(Word(name=rnd.choice(names)))
+            elif operation == 1:
+                sut.remove(Word(name=sut[rnd.randrange(len(sut))].name))
+            elif operation == 2:
+                sut.replace(sut[rnd.randrange(len(sut))], Word(name=rnd.choice(names)))
+            elif operation == 3:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 4:
+                sut.sort()
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names)
+            expected = _within_distance(sut, value, 1, EditDistance.LEVENSHTEIN)
+            result = sut.within_distance(value, 1)
+            self.assertEqual(len(expected), len(result))
+            self.assertTrue(all(a[0] is b[0] and a[1] == b[1] for a, b in zip(expected, result)))
@@ -0,0 +1,141 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+from .vocab_file import VocabFile
+
+
+def _is_approved(word) -> bool:
+    return word.status == WordStatus.APPROVED
+
+
+def _has_first_meaning_with_example(word) -> bool:
+    # Raises an `IndexError` for words without meanings.
+    return bool(word.meanings[0].ste_example)
+
+
+class TestVocabCache(unittest.TestCase):
+    def setUp(self):
+        Vocab.clear_cache()
+
+    def tearDown(self):
+        Vocab.clear_cache()
+
+    def test_second_instance_shares_words(self):
+        first = Vocab()
+
+        sut = Vocab()
+
+        self.assertEqual(len(first), len(sut))
+        self.assertTrue(all(a is b for a, b in zip(first, sut)))
+
+    def test_instances_have_own_item_list(self):
+        first = Vocab()
+        count = len(first)
+
+        sut = Vocab()
+        sut.pop(0)
+
+        self.assertEqual(count, len(first))
+        self.assertEqual(count - 1, len(sut))
+
+    def test_with_and_without_cache_is_equal(self):
+        expected = Vocab(use_ste100_technical_word=True, use_cache=False)
+
+        Vocab(use_ste100_technical_word=True)
+        sut = Vocab(use_ste100_technical_word=True)
+
+        self.assertEqual(list(expected), list(sut))
+
+    def test_predicate_with_cache(self):
+        expected = Vocab(predicate=_is_approved, use_cache=False)
+
+        Vocab(predicate=_is_approved)
+        sut = Vocab(predicate=_is_approved)
+
+        self.assertGreater(len(sut), 0)
+        self.assertEqual(list(expected), list(sut))
+
+    def test_cached_words_are_skipped_when_predicate_raises(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            expected = Vocab(predicate=_has_first_meaning_with_example, use_cache=False)
+            Vocab()
+            sut = Vocab(predicate=_has_first_meaning_with_example)
+
+        self.assertGreater(len(sut), 0)
+        self.assertEqual(list(expected), list(sut))
+        self.assertIn("list index out of range", output.getvalue())
+
+    def test_cache_with_other_files(self):
+        fullname = Path(__file__).parent / VocabFile.TWO_ITEMS
+        expected = Vocab(files=[fullname], use_cache=False)
+
+        Vocab()
+        sut = Vocab(files=[fullname])
+
+        self.assertEqual(list(expected), list(sut))
+
+    def test_without_cache_does_not_share_words(self):
+        first = Vocab()
+
+        sut = Vocab(use_cache=False)
+
+        self.assertIsNot(first[0], sut[0])
+        self.assertEqual(first[0], sut[0])
+
+    def test_lazy_and_eager_are_cached_separately(self):
+        Vocab()
+
+        sut = Vocab(lazy=True)
+
+        self.assertIsNot(Vocab()[0], sut[0])
+        self.assertIs(Vocab(lazy=True)[0], sut[0])
+
+    def test_with_and_without_snapshot_are_cached_separately(self):
+        Vocab()
+
+        sut = Vocab(use_snapshot=False)
+
+        self.assertIsNot(Vocab()[0], sut[0])
+        self.assertIs(Vocab(use_snapshot=False)[0], sut[0])
+
+    def test_cache_size_is_bounded(self):
+        for _ in range(Vocab.CACHE_SIZE + 5):
+            Vocab(predicate=lambda word: word.name.startswith("a"))
+
+        # pylint: disable=W0212
+        self.assertLessEqual(len(Vocab._cache), Vocab.CACHE_SIZE)
+
+    def test_clear_cache(self):
+        first = Vocab()
+
+        Vocab.clear_cache()
+        sut = Vocab()
+
+        self.assertIsNot(first[0], sut[0])
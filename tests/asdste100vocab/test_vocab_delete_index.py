@@ -0,0 +1,194 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from pathlib import Path
+import pickle
+import random
+import shutil
+import tempfile
+import unittest
+
+from src.biz.dfch.asdste100vocab.edit_distance import EditDistance
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_delete_index import VocabDeleteIndex
+from src.biz.dfch.asdste100vocab.word import Word
+
+
+def _lookup(names: list[str], value: str, k: int, metric: EditDistance) -> list[tuple[str, int]]:
+    """Reference implementation of `VocabDeleteIndex.lookup`."""
+
+    distance = metric.get_matcher(value.lower())
+    result = {(distance(name.lower()), name.lower()) for name in names}
+    return [(name, found) for found, name in sorted(result) if found <= k]
+
+
+class TestVocabDeleteIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_path = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_lookup(self):
+        sut = VocabDeleteIndex([Word(name=name) for name in ("install", "Install", "instal", "isntall", "remove")])
+
+        result = sut.lookup("INSTALL", 1)
+
+        self.assertEqual([("install", 0), ("instal", 1), ("isntall", 1)], result)
+        self.assertEqual([("install", 0), ("instal", 1)], sut.lookup("install", 1, EditDistance.LEVENSHTEIN))
+        self.assertEqual(4, len(sut))
+
+    def test_lookup_equals_scan(self):
+        rnd = random.Random(42)
+        names = ["".join(rnd.choice("abcd") for _ in range(rnd.randrange(1, 12))) for _ in range(300)]
+
+        for prefix_length in (3, 7, 20):
+            sut = VocabDeleteIndex([Word(name=name) for name in names], prefix_length=prefix_length)
+            for _ in range(50):
+                value = "".join(rnd.choice("abcd") for _ in range(rnd.randrange(0, 12)))
+                for k in (0, 1, 2):
+                    for metric in EditDistance:
+                        with self.subTest(prefix_length=prefix_length, value=value, k=k, metric=metric):
+                            self.assertEqual(_lookup(names, value, k, metric), sut.lookup(value, k, metric))
+
+    def test_lookup_above_max_distance_throws(self):
+        sut = VocabDeleteIndex(max_distance=1)
+
+        with self.assertRaises(AssertionError):
+            sut.lookup("test", 2)
+
+    def test_prefix_length_must_exceed_max_distance(self):
+        with self.assertRaises(AssertionError):
+            VocabDeleteIndex(max_distance=2, prefix_length=2)
+
+    def test_remove_and_add(self):
+        first = Word(name="test")
+        second = Word(name="TEST")
+        sut = VocabDeleteIndex([first, second])
+
+        sut.remove(first)
+        self.assertEqual([("test", 0)], sut.lookup("test"))
+
+        sut.remove(second)
+        self.assertEqual([], sut.lookup("test"))
+        with self.assertRaises(ValueError):
+            sut.remove(second)
+
+        count = sut.delete_count
+        sut.add(first)
+        self.assertEqual([("test", 0)], sut.lookup("test"))
+        self.assertEqual(count, sut.delete_count)
+
+    def test_get_memory_size(self):
+        empty = VocabDeleteIndex()
+        sut = VocabDeleteIndex([Word(name="abcdefg")])
+
+        self.assertGreater(sut.get_memory_size(), empty.get_memory_size())
+        self.assertEqual(1 + 7 + 21, sut.delete_count)
+
+    def test_save_and_load(self):
+        words = [Word(name=name) for name in ("install", "remove")]
+        index = VocabDeleteIndex(words).save_index(self.tmp_path / "vocab.index")
+
+        sut = VocabDeleteIndex(words, index=index)
+
+        self.assertEqual([("install", 1)], sut.lookup("instal"))
+        self.assertTrue(sut._load_index(index))  # pylint: disable=W0212
+
+    def test_load_stale_index_builds_index(self):
+        index = VocabDeleteIndex([Word(name="install")]).save_index(self.tmp_path / "vocab.index")
+
+        sut = VocabDeleteIndex([Word(name="remove")], index=index)
+
+        self.assertEqual([], sut.lookup("instal"))
+        self.assertEqual([("remove", 1)], sut.lookup("remov"))
+        self.assertFalse(sut._load_index(index))  # pylint: disable=W0212
+        other = VocabDeleteIndex([Word(name="install")], max_distance=1)
+        self.assertFalse(other._load_index(index))  # pylint: disable=W0212
+
+    def test_load_foreign_class_builds_index(self):
+        words = [Word(name="install")]
+        header = VocabDeleteIndex(words)._get_header()  # pylint: disable=W0212
+        index = self.tmp_path / "vocab.index"
+        with open(index, "wb") as f:
+            pickle.dump(header, f)
+            pickle.dump({"install": [Path("foreign")]}, f)
+
+        sut = VocabDeleteIndex(words, index=index)
+
+        self.assertEqual([("install", 0)], sut.lookup("install"))
+
+
+class TestVocabSuggest(unittest.TestCase):
+    def test_suggest_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+        rnd = random.Random(42)
+        names = [item.name for item in sut]
+
+        for _ in range(20):
+            name = rnd.choice(names)
+            idx = rnd.randrange(len(name))
+            value = name[:idx] + name[idx + 1 :]
+            with self.subTest(value=value):
+                expected = sut.within_distance(value, 2, metric=EditDistance.DAMERAU)
+
+                result = sut.suggest(value)
+
+                self.assertEqual(len(expected), len(result))
+                self.assertTrue(all(a[0] is b[0] and a[1] == b[1] for a, b in zip(expected, result)))
+
+    def test_build_delete_index(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name="install"), Word(name="remove")])
+
+        index = sut.build_delete_index(max_distance=1)
+
+        self.assertEqual(1, index.max_distance)
+        self.assertEqual(["install"], [word.name for word, _ in sut.suggest("isntall")])
+        with self.assertRaises(AssertionError):
+            sut.suggest("isntall", 2)
+
+    def test_suggest_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["test", "Test", "tests", "tent", "text", "rest"]
+        sut = Vocab(use_ste100=False)
+        sut.suggest("test")
+
+        for _ in range(1000):
+            operation = rnd.randrange(6)
+            if operation == 0 or len(sut) == 0:
+                sut.append(Word(name=rnd.choice(names)))
+            elif operation == 1:
+                sut.remove(Word(name=sut[rnd.randrange(len(sut))].name))
+            elif operation == 2:
+                sut.replace(sut[rnd.randrange(len(sut))], Word(name=rnd.choice(names)))
+            elif operation == 3:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 4:
+                sut.sort()
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names)
+            expected = sut.within_distance(value, 1, metric=EditDistance.DAMERAU)
+            result = sut.suggest(value, 1)
+            self.assertEqual(len(expected), len(result))
+            self.assertTrue(all(a[0] is b[0] and a[1] == b[1] for a, b in zip(expected, result)))
@@ -211,3 +211,57 @@ class TestVocabExamine(unittest.TestCase):
 
         with self.assertRaises(AssertionError):
             sut.examine("abaft", cutoff=1.1)
+
+
+def _examine(vocab: Vocab, value: str, cutoff: float, phonetic: bool) -> list[Word]:
+    """Reference implementation of `Vocab.examine` (separate searches, merged and sorted)."""
+
+    fuzzy = vocab.similar(value, cutoff=cutoff)
+    partial = vocab.match(value)
+    sounds = vocab.sounds_like(value) if phonetic else []
+
+    seen: set[int] = set()
+    merged: list[Word] = []
+    for word in fuzzy + partial + sounds:
+        if id(word) not in seen:
+            seen.add(id(word))
+            merged.append(word)
+
+    merged.sort(key=lambda word: word.name.lower())
+    return merged
+
+
+class TestVocabExamineFused(unittest.TestCase):
+    def _assert_same(self, expected: list[Word], result: list[Word]) -> None:
+        self.assertEqual(len(expected), len(result))
+        self.assertTrue(all(a is b for a, b in zip(expected, result)))
+
+    def test_examine_equals_reference(self):
+        sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+
+        for value in ("install", "test", "Abort", "fone", "cauk", "remov", "a", "zzz", "air"):
+            for cutoff in (0.0, 0.6, 0.9):
+                for phonetic in (False, True):
+                    with self.subTest(value=value, cutoff=cutoff, phonetic=phonetic):
+                        expected = _examine(sut, value, cutoff, phonetic)
+
+                        result = sut.examine(value, cutoff=cutoff, phonetic=phonetic)
+
+                        self._assert_same(expected, result)
+
+    def test_examine_with_same_names_equals_reference(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name=name) for name in ("Test", "test", "tests", "TEST", "tset", "test", "retest")])
+        sut.append(Word(name="Test"))
+
+        for value in ("test", "Test", "tes", "est"):
+            with self.subTest(value=value):
+                self._assert_same(_examine(sut, value, 0.6, True), sut.examine(value, phonetic=True))
+
+    def test_examine_large_vocabulary_equals_reference(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name=f"word{idx}") for idx in range(10_000)])
+
+        for value in ("word42", "word4", "wrd1234"):
+            with self.subTest(value=value):
+                self._assert_same(_examine(sut, value, 0.6, False), sut.examine(value))
@@ -0,0 +1,214 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import itertools
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_field_index import VocabFieldIndex
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+
+class _RecordingList(list):
+    def __init__(self, items):
+        super().__init__(items)
+        self.read = set()
+
+    def __getitem__(self, index):
+        self.read.add(index)
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        raise AssertionError("The items must not be scanned.")
+
+
+class TestVocabFieldIndex(unittest.TestCase):
+    def setUp(self):
+        self.first = Word(name="a", status=WordStatus.APPROVED, type_=WordType.VERB)
+        self.second = Word(name="b", status=WordStatus.REJECTED, type_=WordType.VERB)
+        self.third = Word(name="c", status=WordStatus.APPROVED, type_=WordType.NOUN, category=WordCategory.COLORS)
+        self.sut = VocabFieldIndex([self.first, self.second, self.third])
+
+    def test_get_and_count(self):
+        self.assertEqual([self.first, self.third], self.sut.get("status", WordStatus.APPROVED))
+        self.assertEqual([self.third], self.sut.get("category", WordCategory.COLORS))
+        self.assertEqual([], self.sut.get("category", WordCategory.ICT_TERMS))
+        self.assertEqual(2, self.sut.count("type_", WordType.VERB))
+        self.assertEqual(0, self.sut.count("type_", WordType.ADVERB))
+
+    def test_where(self):
+        result = self.sut.where({"status": WordStatus.APPROVED, "type_": WordType.VERB})
+
+        self.assertEqual([self.first], result)
+
+    def test_remove(self):
+        self.sut.remove(self.third)
+
+        self.assertEqual([self.first], self.sut.get("status", WordStatus.APPROVED))
+        self.assertEqual(0, self.sut.count("category", WordCategory.COLORS))
+        with self.assertRaises(ValueError):
+            self.sut.remove(self.third)
+
+    def test_remove_is_by_identity(self):
+        other = Word(name="a", status=WordStatus.APPROVED, type_=WordType.VERB)
+        self.sut.add(other)
+
+        self.sut.remove(other)
+
+        self.assertIs(self.first, self.sut.get("status", WordStatus.APPROVED)[0])
+        self.assertEqual(2, self.sut.count("status", WordStatus.APPROVED))
+
+    def test_remove_duplicated_object_at_position(self):
+        words = [self.first, self.second, self.first, self.third]
+        sut = VocabFieldIndex(words)
+        del words[0]
+
+        sut.remove(self.first, words, 0)
+
+        self.assertEqual([self.first, self.third], sut.get("status", WordStatus.APPROVED))
+        self.assertEqual([self.second, self.first], sut.get("type_", WordType.VERB))
+
+    def test_insert_keeps_order(self):
+        word = Word(name="b2", status=WordStatus.APPROVED, type_=WordType.ADVERB)
+        words = [self.first, self.second, word, self.third]
+
+        self.sut.insert(word, words)
+
+        self.assertEqual([self.first, word, self.third], self.sut.get("status", WordStatus.APPROVED))
+        self.assertEqual([word], self.sut.get("type_", WordType.ADVERB))
+
+    def test_insert_at_position_reads_only_neighbours(self):
+        word = Word(name="b2", status=WordStatus.APPROVED, type_=WordType.ADVERB)
+        words = _RecordingList([self.first, self.second, word, self.third])
+
+        self.sut.insert(word, words, 2)
+
+        self.assertEqual({1, 3}, words.read)
+        self.assertEqual([self.first, word, self.third], self.sut.get("status", WordStatus.APPROVED))
+
+    def test_insert_many_times_at_same_position_keeps_order(self):
+        words = [self.first, self.second, self.third]
+        for idx in range(200):
+            word = Word(name=f"b{idx}", status=WordStatus.APPROVED)
+            words.insert(1, word)
+            self.sut.insert(word, words, 1)
+
+        self.assertEqual(
+            [word for word in words if word.status == WordStatus.APPROVED], self.sut.get("status", WordStatus.APPROVED)
+        )
+
+
+class TestVocabWhere(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+
+    def _filter(self, vocab: Vocab, **conditions) -> list[Word]:
+        return vocab.filter(lambda word: all(getattr(word, key) == value for key, value in conditions.items()))
+
+    def test_where_is_filter(self):
+        cases = [
+            {"category": WordCategory.ICT_TERMS},
+            {"status": WordStatus.APPROVED},
+            {"status": WordStatus.APPROVED, "type_": WordType.VERB},
+            {"status": WordStatus.REJECTED, "category": WordCategory.DEFAULT, "source": "STE100:9"},
+            {"category": WordCategory.COLORS, "type_": WordType.VERB},
+            {"source": "other"},
+        ]
+
+        for conditions in cases:
+            with self.subTest(conditions=conditions):
+                result = self.sut.where(**conditions)
+
+                self.assertEqual(self._filter(self.sut, **conditions), result)
+
+    def test_where_without_conditions_returns_all(self):
+        result = self.sut.where()
+
+        self.assertEqual(list(self.sut), result)
+
+    def test_where_with_invalid_value_throws(self):
+        with self.assertRaises(AssertionError):
+            self.sut.where(status="approved")  # type: ignore
+
+    def test_where_after_mutations(self):
+        sut = Vocab(use_ste100=True)
+        sut.where(status=WordStatus.APPROVED)
+        approved = sut.where(status=WordStatus.APPROVED)[0]
+        word = Word(name="abc", status=WordStatus.APPROVED, category=WordCategory.COLORS)
+        mutations = [
+            lambda: sut.append(word),
+            lambda: sut.replace(approved, Word(name=approved.name, status=WordStatus.REJECTED)),
+            lambda: sut.remove(word),
+            lambda: sut.pop(0),
+            lambda: sut.extend([word, word]),
+            lambda: sut.__delitem__(slice(0, 10)),
+            lambda: sut.sort(reverse=True),
+            lambda: sut.pop(),
+        ]
+
+        for idx, mutate in enumerate(mutations):
+            with self.subTest(idx=idx):
+                mutate()
+
+                for status, category in itertools.product(WordStatus, (None, WordCategory.COLORS)):
+                    expected = self._filter(sut, status=status, **({"category": category} if category else {}))
+                    self.assertEqual(expected, sut.where(status=status, category=category))
+
+        sut.clear()
+        self.assertEqual([], sut.where(status=WordStatus.APPROVED))
+
+    def test_where_with_duplicated_objects_after_mutations(self):
+        rnd = random.Random(42)
+        sut = Vocab(use_ste100=False)
+        words = [
+            Word(name=name, status=status) for name in "abc" for status in (WordStatus.APPROVED, WordStatus.REJECTED)
+        ]
+        sut.extend(words)
+        sut.where(status=WordStatus.APPROVED)
+        sut.find("a")
+
+        for _ in range(500):
+            operation = rnd.randrange(5)
+            if operation == 0 or len(sut) < 3:
+                sut.append(rnd.choice(words))
+            elif operation == 1:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 2:
+                sut.replace(sut[rnd.randrange(len(sut))], rnd.choice(words))
+            elif operation == 3:
+                sut.remove(sut[rnd.randrange(len(sut))])
+            else:
+                start = rnd.randrange(len(sut))
+                del sut[start : start + 2]
+
+            expected = VocabFieldIndex(list(sut))
+            for status in (WordStatus.APPROVED, WordStatus.REJECTED):
+                self.assertEqual(
+                    [id(word) for word in expected.get("status", status)],
+                    [id(word) for word in sut.where(status=status)],
+                )
+            for name in "abc":
+                self.assertEqual([id(word) for word in sut if word.name == name], [id(word) for word in sut.find(name)])
@@ -0,0 +1,210 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import json
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_filter import VocabFilter
+from src.biz.dfch.asdste100vocab.vocab_line_error import VocabLineError
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+from src.biz.dfch.asdste100vocab.word_source import WordSource
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+
+class TestVocabFilter(unittest.TestCase):
+    def test_empty_filter_matches_all(self):
+        sut = VocabFilter()
+
+        self.assertTrue(sut.matches(Word(name="test")))
+        self.assertTrue(sut.matches_data({"name": "test"}))
+        self.assertTrue(sut.matches_line('{"name": "test"}'))
+
+    def test_matches(self):
+        word = Word(
+            name="Abandon",
+            status=WordStatus.REJECTED,
+            type_=WordType.VERB,
+            source=WordSource.STE100_9,
+            category=WordCategory.DEFAULT,
+        )
+        line = json.dumps({"name": word.name, "status": "rejected", "type_": "v", "source": "STE100:9"})
+        filters = [
+            (VocabFilter(status=WordStatus.REJECTED), True),
+            (VocabFilter(status=WordStatus.APPROVED), False),
+            (VocabFilter(type_=WordType.VERB), True),
+            (VocabFilter(type_=WordType.NOUN), False),
+            (VocabFilter(category=WordCategory.DEFAULT), True),
+            (VocabFilter(category=WordCategory.ICT_TERMS), False),
+            (VocabFilter(source=WordSource.STE100_9), True),
+            (VocabFilter(source=WordSource.UNKNOWN), False),
+            (VocabFilter(name_prefix="aBa"), True),
+            (VocabFilter(name_prefix="abb"), False),
+            (VocabFilter(status=WordStatus.REJECTED, name_prefix="ab"), True),
+            (VocabFilter(status=WordStatus.APPROVED, name_prefix="ab"), False),
+        ]
+
+        for sut, expected in filters:
+            with self.subTest(sut=sut):
+                self.assertEqual(expected, sut.matches(word))
+                self.assertEqual(expected, sut.matches_data(json.loads(line)))
+                if expected:
+                    self.assertTrue(sut.matches_line(line))
+
+    def test_matches_data_uses_defaults(self):
+        data = {"name": "test"}
+
+        self.assertTrue(VocabFilter(status=WordStatus.UNKNOWN).matches_data(data))
+        self.assertTrue(VocabFilter(category=WordCategory.DEFAULT).matches_data(data))
+        self.assertTrue(VocabFilter(source=WordSource.UNKNOWN).matches_data(data))
+        self.assertTrue(VocabFilter(status=WordStatus.UNKNOWN).matches_line(json.dumps(data)))
+
+    def test_matches_line_rejects_empty_line(self):
+        sut = VocabFilter()
+
+        self.assertFalse(sut.matches_line("  \n"))
+
+    def test_matches_line_with_escaped_value(self):
+        line = '{"name": "\\u0061bandon", "status": "rejected"}'
+        sut = VocabFilter(name_prefix="aba")
+
+        self.assertTrue(sut.matches_line(line))
+        self.assertTrue(sut.matches_data(json.loads(line)))
+
+    def test_matches_line_with_nested_value_is_checked_on_data(self):
+        line = json.dumps(
+            {"name": "abaft", "status": "rejected", "alternatives": [{"name": "aft", "status": "approved"}]}
+        )
+        sut = VocabFilter(status=WordStatus.APPROVED)
+
+        self.assertTrue(sut.matches_line(line))
+        self.assertFalse(sut.matches_data(json.loads(line)))
+
+    def test_is_hashable(self):
+        self.assertEqual(hash(VocabFilter(status=WordStatus.APPROVED)), hash(VocabFilter(status=WordStatus.APPROVED)))
+
+
+class TestVocabLoadFilter(unittest.TestCase):
+    def setUp(self):
+        Vocab.clear_cache()
+        self.tmp_path = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        Vocab.clear_cache()
+        shutil.rmtree(self.tmp_path)
+
+    def test_read_jsonl_file_with_load_filter_equals_predicate(self):
+        fullname = BuiltInVocab.STE100_TECHNICAL_WORDS.value
+        filters = [
+            VocabFilter(category=WordCategory.ICT_TERMS),
+            VocabFilter(status=WordStatus.APPROVED, type_=WordType.TECHNICAL_VERB),
+            VocabFilter(name_prefix="air"),
+        ]
+
+        for sut in filters:
+            with self.subTest(sut=sut):
+                expected = Vocab.read_jsonl_file(fullname, sut.matches)
+
+                result = Vocab.read_jsonl_file(fullname, load_filter=sut)
+
+                self.assertGreater(len(result), 0)
+                self.assertEqual(expected, result)
+
+    def test_read_jsonl_file_with_load_filter_and_lazy(self):
+        fullname = BuiltInVocab.STE100_TECHNICAL_WORDS.value
+        sut = VocabFilter(category=WordCategory.ICT_TERMS)
+        expected = Vocab.read_jsonl_file(fullname, sut.matches)
+
+        result = Vocab.read_jsonl_file(fullname, load_filter=sut, lazy=True)
+
+        self.assertEqual(expected, result)
+
+    def test_iter_jsonl_file_skips_invalid_lines_that_do_not_match(self):
+        fullname = self.tmp_path / "vocab.jsonl"
+        fullname.write_text(
+            '{"name": "abaft", "status": "rejected"}\n'
+            '{"name": "abandon", "status": "invalid"}\n'
+            '{"name": "able", "status": "approved", "invalid": 1}\n',
+            encoding="utf-8",
+        )
+
+        result = list(Vocab.iter_jsonl_file(fullname, errors=True, load_filter=VocabFilter(status=WordStatus.APPROVED)))
+
+        self.assertEqual(1, len(result))
+        self.assertIsInstance(result[0], VocabLineError)
+        self.assertEqual(3, result[0].line)
+
+    def test_vocab_with_load_filter(self):
+        sut = VocabFilter(status=WordStatus.APPROVED)
+        expected = Vocab(use_ste100_technical_word=True, predicate=sut.matches, use_cache=False)
+
+        for kwargs in (
+            {"use_cache": False},
+            {"use_cache": False, "use_snapshot": False},
+            {"use_cache": True},
+            {"use_cache": True, "use_snapshot": False},
+        ):
+            with self.subTest(kwargs=kwargs):
+                Vocab.clear_cache()
+
+                result = Vocab(use_ste100_technical_word=True, load_filter=sut, **kwargs)
+
+                self.assertEqual(list(expected), list(result))
+
+    def test_vocab_with_load_filter_from_cached_words(self):
+        sut = VocabFilter(name_prefix="ab")
+        expected = Vocab(predicate=sut.matches, use_cache=False)
+
+        Vocab()
+        result = Vocab(load_filter=sut)
+
+        self.assertEqual(list(expected), list(result))
+
+    def test_vocab_with_load_filter_and_predicate(self):
+        sut = VocabFilter(status=WordStatus.APPROVED)
+
+        result = Vocab(load_filter=sut, predicate=lambda word: word.name.lower().startswith("a"), use_snapshot=False)
+
+        self.assertGreater(len(result), 0)
+        self.assertTrue(
+            all(word.status == WordStatus.APPROVED and word.name.lower().startswith("a") for word in result)
+        )
+
+    def test_vocab_parallel_with_load_filter(self):
+        sut = VocabFilter(category=WordCategory.ICT_TERMS)
+        expected = Vocab(use_ste100=False, use_ste100_technical_word=True, predicate=sut.matches, use_cache=False)
+
+        result = Vocab(
+            use_ste100=False,
+            use_ste100_technical_word=True,
+            load_filter=sut,
+            use_cache=False,
+            use_snapshot=False,
+            workers=2,
+        )
+
+        self.assertEqual(list(expected), list(result))
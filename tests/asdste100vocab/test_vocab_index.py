@@ -0,0 +1,142 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_index import VocabIndex
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+
+def _find(vocab: Vocab, value: str) -> list[Word]:
+    """Reference implementation of `Vocab.find`."""
+
+    return [item for item in vocab if item.name.lower() == value.lower()]
+
+
+class TestVocabIndex(unittest.TestCase):
+    def test_get(self):
+        first = Word(name="Test")
+        second = Word(name="test", status=WordStatus.APPROVED)
+        sut = VocabIndex([first, Word(name="other"), second])
+
+        result = sut.get("TEST")
+
+        self.assertEqual(2, len(sut))
+        self.assertEqual([first, second], result)
+        self.assertIn("tEsT", sut)
+        self.assertNotIn("missing", sut)
+        self.assertEqual([], sut.get("missing"))
+
+    def test_get_returns_copy(self):
+        sut = VocabIndex([Word(name="test")])
+
+        sut.get("test").clear()
+
+        self.assertEqual(1, len(sut.get("test")))
+
+    def test_remove_by_identity(self):
+        first = Word(name="test")
+        second = Word(name="test")
+        sut = VocabIndex([first, second])
+
+        sut.remove(second)
+
+        self.assertIs(first, sut.get("test")[0])
+        self.assertEqual(1, len(sut.get("test")))
+
+    def test_remove_last_removes_key(self):
+        word = Word(name="test")
+        sut = VocabIndex([word])
+
+        sut.remove(word)
+
+        self.assertEqual(0, len(sut))
+
+    def test_remove_missing_throws(self):
+        sut = VocabIndex([Word(name="test")])
+
+        with self.assertRaises(ValueError):
+            sut.remove(Word(name="test"))
+
+    def test_insert_keeps_item_order(self):
+        first = Word(name="test")
+        second = Word(name="TEST")
+        third = Word(name="Test")
+        words = [first, Word(name="other"), second, third]
+        sut = VocabIndex([first, third])
+
+        sut.insert(second, words)
+
+        self.assertEqual([first, second, third], sut.get("test"))
+        self.assertIs(second, sut.get("test")[1])
+
+
+class TestVocabFind(unittest.TestCase):
+    def test_find_equals_scan_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["a", "A", "b", "B", "c", "abc", "ABC"]
+        sut = Vocab(use_ste100=False)
+        sut.find("a")
+
+        for _ in range(2000):
+            operation = rnd.randrange(8)
+            if operation == 0 or len(sut) == 0:
+                sut.append(Word(name=rnd.choice(names)))
+            elif operation == 1:
+                sut.extend([Word(name=rnd.choice(names)) for _ in range(rnd.randrange(3))])
+            elif operation == 2:
+                sut.remove(Word(name=sut[rnd.randrange(len(sut))].name))
+            elif operation == 3:
+                sut.replace(sut[rnd.randrange(len(sut))], Word(name=rnd.choice(names)))
+            elif operation == 4:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 5:
+                del sut[rnd.randrange(len(sut))]
+            elif operation == 6:
+                sut.sort(reverse=rnd.random() < 0.5)
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names)
+            result = sut.find(value)
+            expected = _find(sut, value)
+            self.assertEqual(len(expected), len(result))
+            self.assertTrue(all(a is b for a, b in zip(expected, result)))
+
+    def test_find_after_delitem_with_slice(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name="a"), Word(name="b"), Word(name="a")])
+        sut.find("a")
+
+        del sut[0:2]
+
+        self.assertEqual(1, len(sut.find("a")))
+        self.assertEqual([], sut.find("b"))
+
+    def test_find_builtin_equals_scan(self):
+        sut = Vocab(use_ste100_technical_word=True)
+
+        for word in list(sut)[::50]:
+            with self.subTest(name=word.name):
+                self.assertEqual(_find(sut, word.name), sut.find(word.name.upper()))
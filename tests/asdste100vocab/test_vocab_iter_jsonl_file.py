@@ -0,0 +1,109 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import shutil
+import tempfile
+import types
+import unittest
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_line_error import VocabLineError
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+from .vocab_file import VocabFile
+
+
+class TestVocabIterJsonlFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_path = Path(tempfile.mkdtemp())
+        self.fullname = self.tmp_path / "errors.jsonl"
+        lines = (Path(__file__).parent / VocabFile.THREE_ITEMS).read_text(encoding="utf-8").splitlines()
+        self.fullname.write_text("\n".join([lines[0], "{", lines[1], lines[2]]) + "\n", encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_returns_generator(self):
+        result = Vocab.iter_jsonl_file(BuiltInVocab.STE100_BASE.value)
+
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertIsInstance(next(result), Word)
+
+    def test_yields_same_words_as_read_jsonl_file(self):
+        fullname = BuiltInVocab.STE100_BASE.value
+        expected = Vocab.read_jsonl_file(fullname, lambda _: True)
+
+        result = list(Vocab.iter_jsonl_file(fullname))
+
+        self.assertEqual(expected, result)
+
+    def test_read_jsonl_file_without_predicate_returns_all_words(self):
+        result = Vocab.read_jsonl_file(BuiltInVocab.STE100_TECHNICAL_WORDS.value)
+
+        self.assertEqual(779, len(result))
+
+    def test_predicate(self):
+        result = list(
+            Vocab.iter_jsonl_file(
+                BuiltInVocab.STE100_BASE.value,
+                predicate=lambda word: word.status == WordStatus.REJECTED,
+            )
+        )
+
+        self.assertGreater(len(result), 0)
+        self.assertTrue(all(word.status == WordStatus.REJECTED for word in result))
+
+    def test_errors_are_yielded(self):
+        result = list(Vocab.iter_jsonl_file(self.fullname, errors=True))
+
+        self.assertEqual(4, len(result))
+        error = result[1]
+        assert isinstance(error, VocabLineError), type(error)
+        self.assertEqual(self.fullname, error.fullname)
+        self.assertEqual(2, error.line)
+        self.assertIsInstance(error.error, ValueError)
+        self.assertTrue(all(isinstance(item, Word) for idx, item in enumerate(result) if idx != 1))
+
+    def test_errors_are_printed(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = list(Vocab.iter_jsonl_file(self.fullname))
+
+        self.assertEqual(3, len(result))
+        self.assertTrue(output.getvalue().startswith(f"[ERROR] {self.fullname}[#2]: "))
+
+    def test_predicate_error_is_reported(self):
+        def predicate(_: Word) -> bool:
+            raise KeyError("predicate")
+
+        result = list(Vocab.iter_jsonl_file(Path(__file__).parent / VocabFile.ONE_ITEM, predicate, errors=True))
+
+        self.assertEqual(1, len(result))
+        self.assertIsInstance(result[0], VocabLineError)
+
+
+if __name__ == "__main__":
+    unittest.main()
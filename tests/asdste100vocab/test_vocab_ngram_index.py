@@ -0,0 +1,153 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import difflib
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_ngram_index import VocabNgramIndex
+from src.biz.dfch.asdste100vocab.word import Word
+
+
+def _make_typo(value: str, rnd: random.Random) -> str:
+    idx = rnd.randrange(len(value))
+    return value[:idx] + rnd.choice("abcdefghijklmnopqrstuvwxyz") + value[idx + 1 :]
+
+
+class TestVocabNgramIndex(unittest.TestCase):
+    def test_get_ngrams(self):
+        result = VocabNgramIndex.get_ngrams("Ab")
+
+        self.assertEqual({"  a", " ab", "ab "}, result)
+
+    def test_similar(self):
+        sut = VocabNgramIndex([Word(name=name) for name in ("install", "installation", "remove")])
+
+        result = sut.similar("instal", 3, 0.6)
+
+        self.assertEqual(["install", "installation"], result)
+        self.assertEqual(3, len(sut))
+
+    def test_get_candidates_repeats_names(self):
+        sut = VocabNgramIndex([Word(name="test"), Word(name="test"), Word(name="tent")])
+
+        result = sut.get_candidates("test", 0.6)
+
+        self.assertEqual(["test", "test"], sorted(result)[1:])
+        self.assertEqual(2, len(sut))
+
+    def test_get_candidates_with_limit_keeps_best(self):
+        sut = VocabNgramIndex([Word(name=name) for name in ("abcdefgh", "abcdxxxx", "abcdefgx")])
+
+        result = sut.get_candidates("abcdefgh", 0.5, limit=2)
+
+        self.assertEqual({"abcdefgh", "abcdefgx"}, set(result))
+
+    def test_remove(self):
+        word = Word(name="test")
+        sut = VocabNgramIndex([word])
+
+        sut.remove(word)
+
+        self.assertEqual([], sut.similar("test", 3, 0.6))
+        self.assertEqual(0, len(sut))
+        with self.assertRaises(ValueError):
+            sut.remove(word)
+
+        sut.add(word)
+        self.assertEqual(["test"], sut.similar("test", 3, 0.6))
+
+
+class TestVocabSimilarWithIndex(unittest.TestCase):
+    def test_similar_with_index_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+        rnd = random.Random(42)
+        names = [item.name for item in sut]
+
+        for _ in range(100):
+            value = _make_typo(rnd.choice(names), rnd)
+            with self.subTest(value=value):
+                expected = difflib.get_close_matches(value, names, n=3, cutoff=0.8)
+
+                result = sut.similar(value, n=3, cutoff=0.8, use_index=True)
+
+                self.assertEqual(set(expected), {item.name for item in result})
+
+    def test_similar_with_index_returns_all_items_of_a_name(self):
+        first = Word(name="test")
+        second = Word(name="test", source="other")
+        sut = Vocab(use_ste100=False)
+        sut.extend([first, Word(name="Test"), second])
+
+        result = sut.similar("tesst", cutoff=0.8, use_index=True)
+
+        self.assertEqual(2, len(result))
+        self.assertIs(first, result[0])
+        self.assertIs(second, result[1])
+
+    def test_similar_with_index_is_in_vocabulary_order(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name=name) for name in ("tests", "text", "test", "tent")])
+
+        expected = sut.similar("test", cutoff=0.7, use_index=False)
+        result = sut.similar("test", cutoff=0.7, use_index=True)
+
+        self.assertEqual(["tests", "text", "test", "tent"], [item.name for item in result])
+        self.assertEqual(expected, result)
+
+    def test_similar_does_not_use_index_by_default(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name=f"word{idx}") for idx in range(10_000)])
+
+        result = sut.similar("word42", n=1)
+        examined = sut.examine("word42")
+        sut.query("similar:word42")
+
+        self.assertEqual(["word42"], [item.name for item in result])
+        self.assertIn("word42", [item.name for item in examined])
+        self.assertIsNone(sut._ngram_index)  # pylint: disable=W0212
+
+    def test_similar_with_index_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["test", "tests", "tent", "text", "rest", "best"]
+        sut = Vocab(use_ste100=False)
+        sut.similar("test", use_index=True)
+
+        for _ in range(1000):
+            operation = rnd.randrange(6)
+            if operation == 0 or len(sut) == 0:
+                sut.append(Word(name=rnd.choice(names)))
+            elif operation == 1:
+                sut.remove(Word(name=sut[rnd.randrange(len(sut))].name))
+            elif operation == 2:
+                sut.replace(sut[rnd.randrange(len(sut))], Word(name=rnd.choice(names)))
+            elif operation == 3:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 4:
+                sut.sort()
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names)
+            expected = sut.similar(value, cutoff=0.8, use_index=False)
+            result = sut.similar(value, cutoff=0.8, use_index=True)
+            self.assertEqual(sorted(id(item) for item in expected), sorted(id(item) for item in result))
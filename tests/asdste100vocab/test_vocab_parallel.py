@@ -0,0 +1,112 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.biz.dfch.asdste100vocab.lazy_word import LazyWord
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+from .vocab_file import VocabFile
+
+
+class TestVocabParallel(unittest.TestCase):
+    def setUp(self):
+        self.tmp_path = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_parallel_equals_sequential(self):
+        expected = Vocab(use_ste100=True, use_ste100_technical_word=True, use_snapshot=False)
+
+        with mock.patch.object(Vocab, "PARALLEL_CHUNK_SIZE", 64 * 1024):
+            sut = Vocab(use_ste100=True, use_ste100_technical_word=True, use_snapshot=False, workers=2)
+
+        self.assertEqual(list(expected), list(sut))
+
+    def test_parallel_with_snapshot_and_files(self):
+        files = [Path(__file__).parent / VocabFile.ONE_ITEM, Path(__file__).parent / VocabFile.TWO_ITEMS]
+        expected = Vocab(files=files, use_ste100=True)
+
+        sut = Vocab(files=files, use_ste100=True, workers=2)
+
+        self.assertEqual(list(expected), list(sut))
+
+    def test_parallel_applies_predicate(self):
+        sut = Vocab(
+            use_ste100=True,
+            use_ste100_technical_word=True,
+            use_snapshot=False,
+            predicate=lambda word: word.type_ == WordType.TECHNICAL_NOUN,
+            workers=2,
+        )
+
+        self.assertEqual(616, len(sut))
+
+    def test_parallel_lazy(self):
+        sut = Vocab(use_ste100=True, lazy=True, workers=2)
+
+        self.assertEqual(2200, len(sut))
+        self.assertTrue(all(isinstance(word, LazyWord) for word in sut))
+        self.assertEqual(2, len(sut.find("except")[0].ste_example))
+
+    def test_parallel_reports_line_numbers(self):
+        fullname = self.tmp_path / "errors.jsonl"
+        lines = (Path(__file__).parent / VocabFile.THREE_ITEMS).read_text(encoding="utf-8").splitlines()
+        fullname.write_text("\n".join([lines[0], "{", lines[1], "[]", lines[2]]) + "\n", encoding="utf-8")
+
+        output = io.StringIO()
+        with mock.patch.object(Vocab, "PARALLEL_CHUNK_SIZE", 1), redirect_stdout(output):
+            sut = Vocab(files=[fullname], use_ste100=False, workers=2)
+
+        self.assertEqual(3, len(sut))
+        messages = output.getvalue().splitlines()
+        self.assertEqual(2, len(messages))
+        self.assertIn("[#2]", messages[0])
+        self.assertIn("[#4]", messages[1])
+
+    def test_get_chunks_end_at_line_ends(self):
+        fullname = Path(__file__).parent / VocabFile.THREE_ITEMS
+        data = fullname.read_bytes()
+
+        # pylint: disable=W0212
+        result = Vocab._get_chunks(fullname, 10)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual(0, result[0][0])
+        self.assertEqual(len(data), result[-1][1])
+        for _, end in result[:-1]:
+            self.assertEqual(ord("\n"), data[end - 1])
+
+    def test_invalid_workers_throws(self):
+        with self.assertRaises(AssertionError):
+            Vocab(workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.metaphone import Metaphone
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_phonetic_index import VocabPhoneticIndex
+from src.biz.dfch.asdste100vocab.word import Word
+
+
+class TestVocabPhoneticIndex(unittest.TestCase):
+    def test_get(self):
+        sut = VocabPhoneticIndex([Word(name=name) for name in ("caulk", "Caulk", "cock", "phone", "12")])
+
+        self.assertEqual(["caulk", "cock"], sut.get("cauk"))
+        self.assertEqual(["phone"], sut.get("FONE"))
+        self.assertEqual([], sut.get("12"))
+        self.assertEqual(2, len(sut))
+
+    def test_remove(self):
+        first = Word(name="caulk")
+        second = Word(name="Caulk")
+        sut = VocabPhoneticIndex([first, second])
+
+        sut.remove(first)
+        self.assertEqual(["caulk"], sut.get("cauk"))
+
+        sut.remove(second)
+        self.assertEqual([], sut.get("cauk"))
+        self.assertEqual(0, len(sut))
+        with self.assertRaises(ValueError):
+            sut.remove(second)
+
+    def test_remove_name_without_key(self):
+        word = Word(name="123")
+        sut = VocabPhoneticIndex([word, Word(name="phone")])
+
+        sut.remove(word)
+
+        self.assertEqual(["phone"], sut.get("fone"))
+        self.assertEqual(1, len(sut))
+
+
+class TestVocabSoundsLike(unittest.TestCase):
+    def test_sounds_like(self):
+        first = Word(name="caulk")
+        second = Word(name="Caulk", source="other")
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name="seal"), second, Word(name="cock"), first])
+
+        result = sut.sounds_like("cauk")
+
+        self.assertEqual(3, len(result))
+        self.assertIs(second, result[0])
+        self.assertIs(first, result[1])
+        self.assertEqual("cock", result[2].name)
+
+    def test_sounds_like_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+
+        result = sut.sounds_like("fone")
+
+        self.assertIn("phone", [word.name.lower() for word in result])
+        key = Metaphone.encode("fone")
+        self.assertTrue(all(Metaphone.encode(word.name) == key for word in result))
+
+    def test_sounds_like_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["caulk", "Caulk", "cock", "phone", "fine", "fun"]
+        sut = Vocab(use_ste100=False)
+        sut.sounds_like("cauk")
+
+        for _ in range(500):
+            operation = rnd.randrange(5)
+            if operation == 0 or len(sut) == 0:
+                sut.append(Word(name=rnd.choice(names)))
+            elif operation == 1:
+                sut.remove(Word(name=sut[rnd.randrange(len(sut))].name))
+            elif operation == 2:
+                sut.replace(sut[rnd.randrange(len(sut))], Word(name=rnd.choice(names)))
+            elif operation == 3:
+                sut.pop(rnd.randrange(len(sut)))
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names)
+            key = Metaphone.encode(value)
+            expected = sorted(
+                (item for item in sut if Metaphone.encode(item.name) == key), key=lambda w: w.name.lower()
+            )
+            result = sut.sounds_like(value)
+            self.assertEqual(len(expected), len(result))
+            self.assertTrue(all(a is b for a, b in zip(expected, result)))
+
+    def test_remove_name_without_key_after_sounds_like(self):
+        word = Word(name="123")
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name="phone"), word, Word(name="92")])
+        sut.sounds_like("fone")
+
+        sut.remove(word)
+        sut.pop()
+
+        self.assertEqual(["phone"], [item.name for item in sut])
+        self.assertEqual([], sut.find("123"))
+        self.assertEqual("phone", sut.sounds_like("fone")[0].name)
+
+    def test_examine_with_phonetic(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name="caulk"), Word(name="seal")])
+
+        self.assertEqual([], sut.examine("kawk"))
+        self.assertEqual(["caulk"], [word.name for word in sut.examine("kawk", phonetic=True)])
@@ -0,0 +1,136 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_prefix_index import VocabPrefixIndex
+from src.biz.dfch.asdste100vocab.word import Word
+
+
+def _prefix(vocab: Vocab, value: str) -> list[Word]:
+    """Reference implementation of `Vocab.prefix`."""
+
+    result = [item for item in vocab if item.name.lower().startswith(value.lower())]
+    return sorted(result, key=lambda item: item.name.lower())
+
+
+class TestVocabPrefixIndex(unittest.TestCase):
+    def test_prefix(self):
+        words = [Word(name=name) for name in ("abort", "Abandon", "about", "b", "ab", "a")]
+        sut = VocabPrefixIndex(words)
+
+        result = sut.prefix("AB")
+
+        self.assertEqual(["ab", "Abandon", "abort", "about"], [item.name for item in result])
+        self.assertEqual(4, sut.count("ab"))
+        self.assertEqual(6, len(sut))
+
+    def test_prefix_with_limit(self):
+        sut = VocabPrefixIndex([Word(name=name) for name in ("abc", "abd", "abe")])
+
+        self.assertEqual(["abc", "abd"], [item.name for item in sut.prefix("ab", limit=2)])
+        self.assertEqual([], sut.prefix("ab", limit=0))
+
+    def test_prefix_empty_returns_all_sorted(self):
+        sut = VocabPrefixIndex([Word(name=name) for name in ("c", "B", "a")])
+
+        self.assertEqual(["a", "B", "c"], [item.name for item in sut.prefix("")])
+
+    def test_prefix_without_match(self):
+        sut = VocabPrefixIndex([Word(name=name) for name in ("abc", "b")])
+
+        self.assertEqual([], sut.prefix("ac"))
+        self.assertEqual([], sut.prefix("z"))
+
+    def test_prefix_with_max_code_point(self):
+        sut = VocabPrefixIndex([Word(name=name) for name in ("a\U0010ffff", "a\U0010ffffb", "b")])
+
+        self.assertEqual(2, len(sut.prefix("a\U0010ffff")))
+
+    def test_add_keeps_order_of_same_names(self):
+        first = Word(name="test")
+        second = Word(name="TEST")
+        sut = VocabPrefixIndex([first])
+
+        sut.add(second)
+        sut.add(Word(name="tesa"))
+
+        result = sut.prefix("test")
+        self.assertIs(first, result[0])
+        self.assertIs(second, result[1])
+
+    def test_remove_by_identity(self):
+        first = Word(name="test")
+        second = Word(name="test")
+        sut = VocabPrefixIndex([first, second])
+
+        sut.remove(second)
+
+        self.assertEqual([first], sut.prefix("test"))
+        with self.assertRaises(ValueError):
+            sut.remove(second)
+
+
+class TestVocabPrefix(unittest.TestCase):
+    def test_prefix_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+
+        for value in ("", "a", "AB", "abort", "air", "zz", "x-"):
+            with self.subTest(value=value):
+                expected = _prefix(sut, value)
+
+                result = sut.prefix(value)
+
+                self.assertEqual(expected, result)
+                self.assertEqual(expected[:3], sut.prefix(value, limit=3))
+
+    def test_prefix_equals_scan_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["a", "A", "ab", "AB", "abc", "b", "ba", "bab"]
+        sut = Vocab(use_ste100=False)
+        sut.prefix("a")
+
+        for _ in range(2000):
+            operation = rnd.randrange(8)
+            if operation == 0 or len(sut) == 0:
+                sut.append(Word(name=rnd.choice(names)))
+            elif operation == 1:
+                sut.extend([Word(name=rnd.choice(names)) for _ in range(rnd.randrange(3))])
+            elif operation == 2:
+                sut.remove(Word(name=sut[rnd.randrange(len(sut))].name))
+            elif operation == 3:
+                sut.replace(sut[rnd.randrange(len(sut))], Word(name=rnd.choice(names)))
+            elif operation == 4:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 5:
+                del sut[rnd.randrange(len(sut))]
+            elif operation == 6:
+                sut.sort(reverse=rnd.random() < 0.5)
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names + [""])
+            result = sut.prefix(value)
+            expected = _prefix(sut, value)
+            self.assertEqual(len(expected), len(result))
+            self.assertTrue(all(a is b for a, b in zip(expected, result)))
@@ -0,0 +1,227 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import difflib
+import random
+import re
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_query import VocabQuery
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+
+def _query(vocab: Vocab, query: VocabQuery) -> list[Word]:
+    """Return the result of `Vocab.query` from a scan."""
+
+    def _matches(word: Word) -> bool:
+        name = word.name.lower()
+        return (
+            (not query.names or name in {value.lower() for value in query.names})
+            and (not query.prefixes or any(name.startswith(value.lower()) for value in query.prefixes))
+            and (query.pattern is None or re.search(query.pattern, word.name, re.IGNORECASE) is not None)
+            and (
+                query.similar is None or difflib.SequenceMatcher(None, word.name, query.similar).ratio() >= query.cutoff
+            )
+            and (not query.statuses or word.status in query.statuses)
+            and (not query.types or word.type_ in query.types)
+            and (not query.categories or word.category in query.categories)
+            and (not query.sources or word.source in query.sources)
+        )
+
+    return sorted(vocab.filter(_matches), key=lambda word: word.name.lower())
+
+
+class TestVocabQuery(unittest.TestCase):
+    def test_parse(self):
+        result = VocabQuery.parse(
+            'status:approved type:tn category:TN3,systems_components match:^hyd name:"abort button"'
+        )
+
+        expected = VocabQuery(
+            names=("abort button",),
+            pattern="^hyd",
+            statuses=(WordStatus.APPROVED,),
+            types=(WordType.TECHNICAL_NOUN,),
+            categories=(WordCategory.TOOLS_EQUIPMENT, WordCategory.SYSTEMS_COMPONENTS),
+        )
+        self.assertEqual(expected, result)
+
+    def test_parse_keeps_backslashes_and_commas_of_pattern(self):
+        result = VocabQuery.parse(r"match:^\w{2,3}$")
+
+        self.assertEqual(r"^\w{2,3}$", result.pattern)
+
+    def test_parse_similar_and_cutoff(self):
+        result = VocabQuery.parse("similar:valv cutoff:0.8")
+
+        self.assertEqual(VocabQuery(similar="valv", cutoff=0.8), result)
+
+    def test_parse_empty(self):
+        result = VocabQuery.parse("  ")
+
+        self.assertTrue(result.is_empty())
+
+    def test_parse_invalid_throws(self):
+        for text in (
+            "approved",
+            "colour:red",
+            "status:approved status:rejected",
+            "status:",
+            "status:maybe",
+            "match:(",
+            "cutoff:2",
+            "cutoff:x",
+        ):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    VocabQuery.parse(text)
+
+    def test_str_can_be_parsed(self):
+        queries = [
+            VocabQuery(),
+            VocabQuery(names=("abort button", "it's"), sources=("STE100:9",)),
+            VocabQuery(prefixes=("ab", "cl"), pattern=r"^ab\w", similar="abt", cutoff=0.7),
+            VocabQuery(statuses=(WordStatus.REJECTED,), categories=(WordCategory.COLORS,)),
+        ]
+
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(query, VocabQuery.parse(str(query)))
+
+    def test_get_pattern_prefix(self):
+        cases = {
+            "^hyd": "hyd",
+            "^Abort Button": "abort button",
+            "^hyd?": "hy",
+            "^h*": None,
+            "^hyd|^x": None,
+            r"^\w": None,
+            "hyd": None,
+            "^(hyd)": None,
+        }
+
+        for pattern, expected in cases.items():
+            with self.subTest(pattern=pattern):
+                self.assertEqual(expected, VocabQuery(pattern=pattern).get_pattern_prefix())
+
+
+class TestVocabQueryPlan(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+
+    def test_explain_uses_smallest_access_path(self):
+        cases = {
+            "status:approved category:ICT_TERMS": "category postings (TN19)",
+            "status:approved match:^hyd": "prefix index (hyd) of match",
+            "name:close status:approved": "name index (close)",
+            "prefix:ab,abo type:v": "prefix index (ab)",
+            "similar:valve": "scan",
+            "match:ulic": "scan",
+        }
+
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                result = self.sut.explain(text)
+
+                self.assertEqual(expected, result.access)
+                self.assertEqual(min(estimate for _, estimate in result.alternatives), result.estimate)
+
+    def test_explain_lists_filters_not_covered_by_access_path(self):
+        result = self.sut.explain("status:approved category:ICT_TERMS match:^hyd")
+
+        self.assertEqual("prefix index (hyd) of match", result.access)
+        self.assertEqual(("status in (approved)", "category in (TN19)", "name matches ^hyd"), result.filters)
+        self.assertIn("Access: prefix index (hyd) of match (2 items)", str(result))
+
+    def test_query_equals_scan(self):
+        texts = [
+            "",
+            "status:approved type:TN category:TN3,TN6 match:^hyd",
+            "status:approved type:TN category:TN3,TN6",
+            "category:ICT_TERMS",
+            "match:^hyd",
+            "match:^a status:rejected",
+            "name:close,CLOSE,xyzzy",
+            "name:close type:v",
+            "prefix:ab,abo,cl status:rejected",
+            "prefix:x,xy,z",
+            "similar:valv",
+            "similar:clse cutoff:0.7 status:approved",
+            "status:approved,approved",
+            "source:STE100:9 type:adj,adv prefix:c",
+        ]
+
+        for text in texts:
+            with self.subTest(text=text):
+                result = self.sut.query(text)
+
+                self.assertEqual(_query(self.sut, VocabQuery.parse(text)), result)
+
+    def test_random_queries_equal_scan(self):
+        rnd = random.Random(42)
+        words = list(self.sut)
+
+        for _ in range(50):
+            word = rnd.choice(words)
+            query = VocabQuery(
+                prefixes=(word.name[:2],) if rnd.random() < 0.5 else (),
+                statuses=(word.status,) if rnd.random() < 0.5 else (),
+                types=(word.type_, rnd.choice(list(WordType))) if rnd.random() < 0.5 else (),
+                categories=(word.category,) if rnd.random() < 0.5 else (),
+                similar=word.name[:-1] if rnd.random() < 0.3 else None,
+            )
+            with self.subTest(query=str(query)):
+                self.assertEqual(_query(self.sut, query), self.sut.query(query))
+
+    def test_query_same_name_in_vocabulary_order(self):
+        sut = Vocab(use_ste100=False)
+        first = Word(name="b", status=WordStatus.APPROVED)
+        second = Word(name="B", status=WordStatus.REJECTED)
+        sut.extend([Word(name="a"), first, second])
+
+        result = sut.query("status:rejected,approved")
+
+        self.assertEqual([first, second], result)
+
+    def test_query_with_similar_scans(self):
+        sut = Vocab(use_ste100=False)
+        sut.extend([Word(name=f"word{idx}") for idx in range(10_000)])
+
+        plan = sut.explain("similar:word42")
+        result = sut.query("similar:word42 cutoff:0.9")
+
+        self.assertEqual("scan", plan.access)
+        self.assertEqual(_query(sut, VocabQuery(similar="word42", cutoff=0.9)), result)
+
+    def test_query_after_mutation(self):
+        sut = Vocab(use_ste100=True, query_cache_size=4)
+        sut.query("category:ICT_TERMS")
+        word = Word(name="zzz", category=WordCategory.ICT_TERMS)
+
+        sut.append(word)
+        result = sut.query("category:ICT_TERMS")
+
+        self.assertEqual([word], result)
@@ -0,0 +1,159 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_query_cache import VocabQueryCache
+from src.biz.dfch.asdste100vocab.vocab_query_cache_info import VocabQueryCacheInfo
+
+
+class TestVocabQueryCache(unittest.TestCase):
+    def test_get_missing_returns_none(self):
+        sut = VocabQueryCache(2)
+
+        result = sut.get(("find", "close"), 0)
+
+        self.assertIsNone(result)
+        self.assertEqual(VocabQueryCacheInfo(0, 1, 2, 0), sut.info())
+
+    def test_put_and_get(self):
+        sut = VocabQueryCache(2)
+
+        sut.put(("find", "close"), 0, ())
+        result = sut.get(("find", "close"), 0)
+
+        self.assertEqual((), result)
+        self.assertEqual(VocabQueryCacheInfo(1, 0, 2, 1), sut.info())
+
+    def test_put_drops_least_recently_used(self):
+        sut = VocabQueryCache(2)
+        sut.put(("a",), 0, ())
+        sut.put(("b",), 0, ())
+        sut.get(("a",), 0)
+
+        sut.put(("c",), 0, ())
+
+        self.assertIsNotNone(sut.get(("a",), 0))
+        self.assertIsNone(sut.get(("b",), 0))
+        self.assertIsNotNone(sut.get(("c",), 0))
+        self.assertEqual(2, len(sut))
+
+    def test_other_generation_drops_entries(self):
+        sut = VocabQueryCache(2)
+        sut.put(("a",), 0, ())
+
+        result = sut.get(("a",), 1)
+
+        self.assertIsNone(result)
+        self.assertEqual(0, len(sut))
+
+    def test_clear_resets_statistics(self):
+        sut = VocabQueryCache(2)
+        sut.put(("a",), 0, ())
+        sut.get(("a",), 0)
+
+        sut.clear()
+
+        self.assertEqual(VocabQueryCacheInfo(0, 0, 2, 0), sut.info())
+
+
+class TestVocabWithQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.sut = Vocab(use_ste100=True, query_cache_size=16)
+
+    def test_without_query_cache_info_is_none(self):
+        sut = Vocab(use_ste100=True)
+
+        self.assertIsNone(sut.query_cache_info())
+
+    def test_cached_results_are_equal(self):
+        expected = Vocab(use_ste100=True)
+        queries = [
+            (Vocab.find, ("close",), {}),
+            (Vocab.match, ("^clo",), {}),
+            (Vocab.similar, ("clse",), {"n": 3}),
+            (Vocab.similar, ("clse",), {"cutoff": 0.8}),
+            (Vocab.examine, ("valv",), {"phonetic": True}),
+        ]
+
+        for method, args, kwargs in queries:
+            with self.subTest(method=method.__name__, args=args, kwargs=kwargs):
+                first = method(self.sut, *args, **kwargs)
+                second = method(self.sut, *args, **kwargs)
+
+                self.assertEqual(method(expected, *args, **kwargs), first)
+                self.assertEqual(first, second)
+
+        info = self.sut.query_cache_info()
+        assert info is not None
+        self.assertEqual(len(queries), info.hits)
+        self.assertEqual(len(queries), info.misses)
+        self.assertEqual(len(queries), info.currsize)
+
+    def test_arguments_are_part_of_the_key(self):
+        self.sut.similar("clse", n=1)
+
+        result = self.sut.similar("clse", n=3)
+
+        self.assertGreater(len(result), 1)
+        self.assertEqual(0, self.sut.query_cache_info().hits)  # type: ignore
+
+    def test_result_is_a_copy(self):
+        self.sut.find("close").clear()
+
+        result = self.sut.find("close")
+
+        self.assertNotEqual([], result)
+
+    def test_mutators_change_generation_and_drop_results(self):
+        word = self.sut.find("close")[0]
+        mutators = [
+            ("append", lambda sut: sut.append(word)),
+            ("extend", lambda sut: sut.extend([word])),
+            ("remove", lambda sut: sut.remove(word)),
+            ("replace", lambda sut: sut.replace(sut.find("close")[0], word)),
+            ("pop", lambda sut: sut.pop()),
+            ("delitem", lambda sut: sut.__delitem__(0)),
+            ("sort", lambda sut: sut.sort(reverse=True)),
+            ("clear", lambda sut: sut.clear()),
+        ]
+
+        for name, mutate in mutators:
+            with self.subTest(name=name):
+                sut = Vocab(use_ste100=True, query_cache_size=16)
+                sut.match("^clos")
+                generation = sut.generation
+
+                mutate(sut)
+                result = sut.match("^clos")
+
+                self.assertNotEqual(generation, sut.generation)
+                self.assertEqual(Vocab._match(sut, "^clos"), result)  # pylint: disable=W0212
+                self.assertEqual(0, sut.query_cache_info().hits)  # type: ignore
+
+    def test_clear_query_cache(self):
+        self.sut.find("close")
+        self.sut.find("close")
+
+        self.sut.clear_query_cache()
+
+        self.assertEqual(VocabQueryCacheInfo(0, 0, 16, 0), self.sut.query_cache_info())
@@ -19,6 +19,7 @@
 # pylint: disable=C0115
 # pylint: disable=C0116
 
+import difflib
 from pathlib import Path
 import unittest
 
@@ -202,3 +203,63 @@ class TestVocabSimilar(unittest.TestCase):
 
         with self.assertRaises(AssertionError):
             sut.similar("abaft", cutoff=1.1)
+
+    # ------------------------------------------------------------------
+    # Scored results
+    # ------------------------------------------------------------------
+
+    def test_similar_scored_is_ranked(self):
+        sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+
+        result = sut.similar_scored("instal", n=5, cutoff=0.5)
+
+        scores = [score for _, score in result]
+        self.assertGreater(len(result), 1)
+        self.assertEqual(sorted(scores, reverse=True), scores)
+        self.assertTrue(all(isinstance(word, Word) for word, _ in result))
+
+    def test_similar_scored_equals_get_close_matches(self):
+        sut = Vocab(use_ste100=True, use_ste100_technical_word=True)
+        names = list(dict.fromkeys(item.name for item in sut))
+
+        for value in ("instal", "reinstalation", "abort", "zzzz", "removel"):
+            with self.subTest(value=value):
+                expected = difflib.get_close_matches(value, names, n=5, cutoff=0.6)
+
+                result = sut.similar_scored(value, n=5, cutoff=0.6)
+
+                # Names with the same score can be in a different order than in difflib.
+                self.assertEqual(
+                    [difflib.SequenceMatcher(None, name, value).ratio() for name in expected],
+                    [score for _, score in dict.fromkeys((word.name, score) for word, score in result)],
+                )
+                for word, score in result:
+                    self.assertAlmostEqual(difflib.SequenceMatcher(None, word.name, value).ratio(), score)
+
+    def test_similar_scored_keeps_same_names_together(self):
+        first = Word(name="test")
+        second = Word(name="test", source="other")
+        sut = Vocab(use_ste100=False)
+        sut.extend([first, Word(name="tests"), second])
+
+        for use_index in (False, True):
+            with self.subTest(use_index=use_index):
+                result = sut.similar_scored("test", n=1, use_index=use_index)
+
+                self.assertEqual(2, len(result))
+                self.assertIs(first, result[0][0])
+                self.assertIs(second, result[1][0])
+                self.assertEqual(1.0, result[0][1])
+
+    def test_similar_scored_no_match_returns_empty_list(self):
+        sut = self._make_sut(VocabFile.TWO_ITEMS)
+
+        result = sut.similar_scored("zzzzzzzzz")
+
+        self.assertEqual([], result)
+
+    def test_similar_scored_invalid_n_throws(self):
+        sut = self._make_sut(VocabFile.TWO_ITEMS)
+
+        with self.assertRaises(AssertionError):
+            sut.similar_scored("abaft", n=0)
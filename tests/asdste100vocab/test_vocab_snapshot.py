@@ -0,0 +1,157 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+"""
+Snapshots of the built-in vocabularies.
+
+This test module serves a dual purpose:
+  1. Unit tests that verify reading and writing snapshots, and that the
+     shipped snapshots match their JSONL files.
+  2. An executable script that, when run directly, regenerates the
+     snapshots of the built-in vocabularies.
+
+Usage as a script:
+    python -m tests.asdste100vocab.test_vocab_snapshot
+"""
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_snapshot import VocabSnapshot
+from src.biz.dfch.asdste100vocab.word import Word
+
+from .vocab_file import VocabFile
+
+
+def _read_all(fullname: Path) -> list[Word]:
+    return Vocab.read_jsonl_file(fullname, predicate=lambda _: True)
+
+
+def _has_first_meaning_with_example(word: Word) -> bool:
+    # Raises an `IndexError` for words without meanings.
+    return bool(word.meanings[0].ste_example)
+
+
+class TestVocabSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp_path = Path(tempfile.mkdtemp())
+        self.fullname = self.tmp_path / VocabFile.THREE_ITEMS
+        shutil.copyfile(Path(__file__).parent / VocabFile.THREE_ITEMS, self.fullname)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_builtin_snapshots_are_current(self):
+        for builtin in (BuiltInVocab.STE100_BASE, BuiltInVocab.STE100_TECHNICAL_WORDS):
+            fullname = builtin.value
+
+            result = VocabSnapshot.read(fullname)
+
+            self.assertIsNotNone(result, f"Stale snapshot for '{fullname.name}'. Run this module to regenerate it.")
+            self.assertEqual(_read_all(fullname), result)
+
+    def test_vocab_with_and_without_snapshot_is_equal(self):
+        expected = Vocab(use_ste100=True, use_ste100_technical_word=True, use_snapshot=False, use_cache=False)
+
+        sut = Vocab(use_ste100=True, use_ste100_technical_word=True, use_snapshot=True, use_cache=False)
+
+        self.assertEqual(list(expected), list(sut))
+
+    def test_vocab_with_snapshot_applies_predicate(self):
+        sut = Vocab(use_ste100=True, predicate=lambda word: word.name.lower().startswith("ab"))
+
+        self.assertGreater(len(sut), 0)
+        self.assertTrue(all(word.name.lower().startswith("ab") for word in sut))
+
+    def test_vocab_with_snapshot_skips_words_when_predicate_raises(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            expected = Vocab(predicate=_has_first_meaning_with_example, use_snapshot=False, use_cache=False)
+            sut = Vocab(predicate=_has_first_meaning_with_example, use_snapshot=True, use_cache=False)
+
+        self.assertGreater(len(sut), 0)
+        self.assertEqual(list(expected), list(sut))
+        self.assertIn("[ERROR]", output.getvalue())
+        self.assertIn("list index out of range", output.getvalue())
+
+    def test_write_and_read(self):
+        expected = _read_all(self.fullname)
+
+        snapshot = VocabSnapshot.write(self.fullname, expected)
+        result = VocabSnapshot.read(self.fullname)
+
+        self.assertEqual(VocabSnapshot.get_path(self.fullname), snapshot)
+        self.assertTrue(snapshot.exists())
+        self.assertEqual(expected, result)
+
+    def test_read_missing_returns_none(self):
+        result = VocabSnapshot.read(self.fullname)
+
+        self.assertIsNone(result)
+
+    def test_read_stale_returns_none(self):
+        VocabSnapshot.write(self.fullname, _read_all(self.fullname))
+        with open(self.fullname, "a", encoding="utf-8") as f:
+            f.write("\n")
+
+        result = VocabSnapshot.read(self.fullname)
+
+        self.assertIsNone(result)
+
+    def test_vocab_with_stale_snapshot_reads_jsonl(self):
+        VocabSnapshot.write(self.fullname, [])
+        with open(self.fullname, "a", encoding="utf-8") as f:
+            f.write("\n")
+
+        sut = Vocab(files=[self.fullname], use_ste100=False)
+
+        self.assertEqual(3, len(sut))
+
+    def test_read_foreign_class_returns_none(self):
+        header = {
+            "format": VocabSnapshot.FORMAT_VERSION,
+            "schema": VocabSnapshot.get_schema(),
+            "sha256": VocabSnapshot.get_digest(self.fullname),
+        }
+        snapshot = VocabSnapshot.get_path(self.fullname)
+        with open(snapshot, "wb") as f:
+            pickle.dump(header, f)
+            pickle.dump([Path("foreign")], f)
+
+        result = VocabSnapshot.read(self.fullname)
+
+        self.assertIsNone(result)
+
+
+# ---------------------------------------------------------------------------
+# Script entry-point: regenerate the snapshots of the built-in vocabularies
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    for path in VocabSnapshot.build(_read_all):
+        print(f"Done. {path}")
@@ -0,0 +1,196 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from pathlib import Path
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_text_index import VocabTextIndex
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_meaning import WordMeaning
+from src.biz.dfch.asdste100vocab.word_note import WordNote
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+
+def _ranked(ranking: list[tuple[Word, float]]) -> list[tuple[float, str]]:
+    return sorted((round(score, 9), word.name) for word, score in ranking)
+
+
+class TestVocabTextIndex(unittest.TestCase):
+    def setUp(self):
+        self.first = Word(
+            name="close",
+            status=WordStatus.APPROVED,
+            meanings=[WordMeaning(value="To move into a position that stops access", ste_example=["Close the door."])],
+        )
+        self.second = Word(
+            name="shut",
+            status=WordStatus.REJECTED,
+            meanings=[WordMeaning(value="close")],
+            note=WordNote(value="Use CLOSE for a door or a valve."),
+        )
+        self.third = Word(name="valve", status=WordStatus.APPROVED, ste_example=["Open the valve."])
+        self.sut = VocabTextIndex([self.first, self.second, self.third])
+
+        self.tmp_path = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_path)
+
+    def test_tokenize(self):
+        result = VocabTextIndex.tokenize("Close the DOOR (fully), then re-check 2 valves.")
+
+        self.assertEqual(["close", "the", "door", "fully", "then", "re", "check", "2", "valves"], result)
+
+    def test_get_texts(self):
+        result = VocabTextIndex.get_texts(self.second)
+
+        self.assertEqual(["close", "Use CLOSE for a door or a valve."], result)
+
+    def test_len_and_term_count(self):
+        self.assertEqual(3, len(self.sut))
+        self.assertEqual(len(set(VocabTextIndex.tokenize(" ".join(self._all_texts())))), self.sut.term_count)
+
+    def _all_texts(self) -> list[str]:
+        return [text for word in (self.first, self.second, self.third) for text in VocabTextIndex.get_texts(word)]
+
+    def test_search_ranks_by_score(self):
+        result = self.sut.search("door valve")
+
+        self.assertEqual([self.second, self.third, self.first], [word for word, _ in result])
+        scores = [score for _, score in result]
+        self.assertEqual(sorted(scores, reverse=True), scores)
+        self.assertTrue(all(score > 0 for score in scores))
+
+    def test_search_with_limit_and_accept(self):
+        result = self.sut.search("door valve", 1, lambda word: word.status == WordStatus.APPROVED)
+
+        self.assertEqual([self.third], [word for word, _ in result])
+
+    def test_search_without_match_returns_empty(self):
+        self.assertEqual([], self.sut.search("unknown"))
+        self.assertEqual([], self.sut.search(""))
+        self.assertEqual([], self.sut.search("door", 0))
+
+    def test_remove_and_add_equals_new_index(self):
+        other = Word(name="door", meanings=[WordMeaning(value="A panel that closes an opening")])
+        self.sut.remove(self.second)
+        self.sut.add(other)
+
+        expected = VocabTextIndex([self.first, self.third, other])
+
+        self.assertEqual(expected.term_count, self.sut.term_count)
+        for value in ("door", "close valve", "panel opening", "use"):
+            with self.subTest(value=value):
+                self.assertEqual(_ranked(expected.search(value)), _ranked(self.sut.search(value)))
+
+    def test_remove_is_by_identity(self):
+        other = Word(name="valve", status=WordStatus.APPROVED, ste_example=["Open the valve."])
+        self.sut.add(other)
+
+        self.sut.remove(other)
+
+        self.assertEqual([self.third], [word for word, _ in self.sut.search("open")])
+        with self.assertRaises(ValueError):
+            self.sut.remove(other)
+
+    def test_save_and_load_index(self):
+        words = [self.first, self.second, self.third]
+        index = self.sut.save_index(self.tmp_path / "text.index")
+
+        result = VocabTextIndex(words, index=index)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual(self.sut.term_count, result.term_count)
+        self.assertEqual(self.sut.search("door valve"), result.search("door valve"))
+
+    def test_load_stale_index_builds_index(self):
+        index = self.sut.save_index(self.tmp_path / "text.index")
+        words = [self.first, self.third]
+
+        result = VocabTextIndex(words, index=index)
+
+        self.assertEqual(2, len(result))
+        self.assertEqual([], result.search("use"))
+
+    def test_load_foreign_class_builds_index(self):
+        index = self.tmp_path / "text.index"
+        words = [self.first, self.second, self.third]
+        with open(index, "wb") as f:
+            pickle.dump(VocabTextIndex._get_header(words), f)  # pylint: disable=W0212
+            pickle.dump(Path("foreign"), f)
+
+        result = VocabTextIndex(words, index=index)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual(self.sut.search("door"), result.search("door"))
+
+
+class TestVocabSearchText(unittest.TestCase):
+    def test_search_text(self):
+        sut = Vocab(use_ste100=True)
+
+        result = sut.search_text("to make something tight", 3, status=WordStatus.APPROVED)
+
+        self.assertEqual("TIGHTEN", result[0][0].name)
+        self.assertTrue(all(word.status == WordStatus.APPROVED for word, _ in result))
+        self.assertEqual(3, len(result))
+
+    def test_search_text_with_persisted_index(self):
+        tmp_path = Path(tempfile.mkdtemp())
+        try:
+            sut = Vocab(use_ste100=True)
+            index = sut.build_text_index().save_index(tmp_path / "text.index")
+            other = Vocab(use_ste100=True)
+
+            other.build_text_index(index=index)
+
+            self.assertEqual(sut.search_text("close the valve"), other.search_text("close the valve"))
+        finally:
+            shutil.rmtree(tmp_path)
+
+    def test_search_text_after_mutations(self):
+        sut = Vocab(use_ste100=True)
+        sut.search_text("door")
+        word = Word(name="abc", meanings=[WordMeaning(value="A door that you can close")])
+        mutations = [
+            lambda: sut.append(word),
+            lambda: sut.remove(word),
+            lambda: sut.pop(0),
+            lambda: sut.extend([word, word]),
+            lambda: sut.__delitem__(slice(0, 10)),
+            lambda: sut.sort(reverse=True),
+            lambda: sut.replace(word, Word(name="abd", meanings=[WordMeaning(value="Close")])),
+            lambda: sut.pop(),
+        ]
+
+        for idx, mutate in enumerate(mutations):
+            with self.subTest(idx=idx):
+                mutate()
+
+                expected = VocabTextIndex(list(sut)).search("door close", len(sut))
+                self.assertEqual(_ranked(expected), _ranked(sut.search_text("door close", len(sut))))
+
+        sut.clear()
+        self.assertEqual([], sut.search_text("door"))
@@ -0,0 +1,158 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+import random
+import unittest
+
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.vocab_trie import VocabTrie
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+
+
+def _ranks(words: list[Word]) -> list[object]:
+    return [VocabTrie.default_rank(word) for word in words]
+
+
+def _complete(vocab: Vocab, value: str, limit: int) -> list[object]:
+    """Reference implementation of `Vocab.complete` (ranks only)."""
+
+    result = [item for item in vocab if item.name.lower().startswith(value.lower())]
+    return sorted(_ranks(result))[:limit]
+
+
+class TestVocabTrie(unittest.TestCase):
+    def test_complete_ranks_approved_first(self):
+        words = [
+            Word(name="abaft", status=WordStatus.REJECTED),
+            Word(name="abort", status=WordStatus.APPROVED),
+            Word(name="abandon", status=WordStatus.REJECTED),
+            Word(name="abc"),
+            Word(name="about", status=WordStatus.APPROVED),
+        ]
+        sut = VocabTrie(words)
+
+        result = sut.complete("AB")
+
+        self.assertEqual(["abort", "about", "abc", "abaft", "abandon"], [item.name for item in result])
+        self.assertEqual(5, len(sut))
+
+    def test_complete_with_limit(self):
+        sut = VocabTrie([Word(name=name) for name in ("abc", "abd", "abe", "b")])
+
+        self.assertEqual(["abc", "abd"], [item.name for item in sut.complete("ab", 2)])
+        self.assertEqual([], sut.complete("ab", 0))
+        self.assertEqual([], sut.complete("x"))
+
+    def test_complete_multi_word_names(self):
+        sut = VocabTrie([Word(name="abort"), Word(name="abort button"), Word(name="about")])
+
+        self.assertEqual(["abort", "abort button"], [item.name for item in sut.complete("abort")])
+        self.assertEqual(["abort button"], [item.name for item in sut.complete("abort b")])
+
+    def test_complete_with_rank(self):
+        sut = VocabTrie([Word(name=name) for name in ("ab", "abcd", "abc")], rank=lambda word: -len(word.name))
+
+        self.assertEqual(["abcd", "abc", "ab"], [item.name for item in sut.complete("a")])
+
+    def test_complete_more_than_size(self):
+        words = [Word(name=f"a{idx:03}") for idx in range(30)]
+        sut = VocabTrie(reversed(words), size=5)
+
+        self.assertEqual(words[:5], sut.complete("a", 5))
+        self.assertEqual(words[:20], sut.complete("a", 20))
+
+    def test_remove_by_identity(self):
+        first = Word(name="test")
+        second = Word(name="test")
+        sut = VocabTrie([first, second, Word(name="tesa")], size=2)
+
+        sut.remove(first)
+
+        result = sut.complete("tes")
+        self.assertIs(second, result[1])
+        self.assertEqual(2, len(result))
+        with self.assertRaises(ValueError):
+            sut.remove(first)
+        with self.assertRaises(ValueError):
+            sut.remove(Word(name="missing"))
+
+    def test_remove_refills_best_entries(self):
+        words = [Word(name=f"a{idx}") for idx in range(6)]
+        sut = VocabTrie(words, size=2)
+
+        sut.remove(words[0])
+        sut.remove(words[1])
+
+        self.assertEqual(words[2:4], sut.complete("a", 2))
+        self.assertEqual(4, len(sut))
+
+
+class TestVocabComplete(unittest.TestCase):
+    def test_complete_builtin(self):
+        sut = Vocab(use_ste100_technical_word=True)
+
+        for value in ("a", "AB", "abort", "air", "zz", "x-"):
+            with self.subTest(value=value):
+                result = sut.complete(value, 7)
+
+                self.assertEqual(_complete(sut, value, 7), _ranks(result))
+
+    def test_complete_with_rank(self):
+        sut = Vocab()
+
+        result = sut.complete("ab", 3, rank=lambda word: word.name.lower())
+
+        self.assertEqual(sorted(word.name.lower() for word in result), [word.name.lower() for word in result])
+        self.assertEqual(_complete(sut, "ab", 3), _ranks(sut.complete("ab", 3)))
+
+    def test_complete_equals_scan_after_mutations(self):
+        rnd = random.Random(42)
+        names = ["a", "ab", "AB", "abc", "abc d", "b", "ba"]
+        statuses = list(WordStatus)
+        sut = Vocab(use_ste100=False)
+        sut.complete("a")
+
+        def make() -> Word:
+            return Word(name=rnd.choice(names), status=rnd.choice(statuses))
+
+        for _ in range(2000):
+            operation = rnd.randrange(8)
+            if operation == 0 or len(sut) == 0:
+                sut.append(make())
+            elif operation == 1:
+                sut.extend([make() for _ in range(rnd.randrange(3))])
+            elif operation == 2:
+                sut.remove(sut[rnd.randrange(len(sut))])
+            elif operation == 3:
+                sut.replace(sut[rnd.randrange(len(sut))], make())
+            elif operation == 4:
+                sut.pop(rnd.randrange(len(sut)))
+            elif operation == 5:
+                del sut[rnd.randrange(len(sut))]
+            elif operation == 6:
+                sut.sort(reverse=rnd.random() < 0.5)
+            elif rnd.random() < 0.05:
+                sut.clear()
+
+            value = rnd.choice(names + [""])
+            limit = rnd.randrange(1, 15)
+            self.assertEqual(_complete(sut, value, limit), _ranks(sut.complete(value, limit)))
@@ -0,0 +1,166 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+
+from pathlib import Path
+import unittest
+
+from src.biz.dfch.asdste100vocab.builtin_vocab import BuiltInVocab
+from src.biz.dfch.asdste100vocab.decoder_engine import DecoderEngine
+from src.biz.dfch.asdste100vocab.vocab import Vocab
+from src.biz.dfch.asdste100vocab.word import Word
+from src.biz.dfch.asdste100vocab.word_category import WordCategory
+from src.biz.dfch.asdste100vocab.word_decoder import WordDecoder
+from src.biz.dfch.asdste100vocab.word_meaning import WordMeaning
+from src.biz.dfch.asdste100vocab.word_note import WordNote
+from src.biz.dfch.asdste100vocab.word_source import WordSource
+from src.biz.dfch.asdste100vocab.word_status import WordStatus
+from src.biz.dfch.asdste100vocab.word_type import WordType
+
+from .vocab_file import VocabFile
+
+
+class TestWordDecoder(unittest.TestCase):
+    INVALID = [
+        {"name": "x", "foo": 1},
+        {"status": "approved"},
+        {"name": 1},
+        {"name": "x", "status": "bogus"},
+        {"name": "x", "status": None},
+        {"name": "x", "type_": ["n"]},
+        {"name": "x", "category": "TN99"},
+        {"name": "x", "source": None},
+        {"name": "x", "spellings": [1]},
+        {"name": "x", "spellings": None},
+        {"name": "x", "meanings": [{"value": 1}]},
+        {"name": "x", "meanings": [{"ste_example": []}]},
+        {"name": "x", "meanings": ["a"]},
+        {"name": "x", "alternatives": [{"name": "y", "bar": 2}]},
+        {"name": "x", "note": 5},
+        {"name": "x", "note": {"value": 5}},
+        {"name": "x", "note": {"words": [{"name": 2}]}},
+        {"name": "x", "meanings": [{"value": "v", "note": {"ste_example": []}}]},
+    ]
+
+    def test_decode_all_builtin_words_equals_dacite(self):
+        for builtin in (BuiltInVocab.STE100_BASE, BuiltInVocab.STE100_TECHNICAL_WORDS):
+            expected = Vocab.read_jsonl_file(builtin.value, lambda _: True, engine=DecoderEngine.DACITE)
+
+            result = Vocab.read_jsonl_file(builtin.value, lambda _: True, engine=DecoderEngine.FAST)
+
+            self.assertEqual(len(expected), len(result))
+            self.assertEqual(expected, result)
+
+    def test_decode_complete_word(self):
+        fullname = Path(__file__).parent / VocabFile.COMPLETE
+        line = fullname.read_text(encoding="utf-8").splitlines()[0]
+
+        expected = Vocab.read_jsonl_text(line, engine=DecoderEngine.DACITE)
+
+        result = Vocab.read_jsonl_text(line)
+
+        self.assertEqual(Word, type(result))
+        self.assertEqual(expected, result)
+
+    def test_decode_defaults(self):
+        result = WordDecoder.decode({"name": "x"})
+
+        self.assertEqual(Word(name="x"), result)
+        self.assertIs(WordStatus.UNKNOWN, result.status)
+        self.assertIs(WordType.UNKNOWN, result.type_)
+        self.assertIs(WordCategory.DEFAULT, result.category)
+        self.assertIs(WordSource.UNKNOWN, result.source)
+        self.assertIsNone(result.note)
+
+    def test_decode_nested_types(self):
+        data = {
+            "name": "x",
+            "meanings": [{"value": "v", "note": {"value": None, "words": [{"name": "y"}]}}],
+            "alternatives": [{"name": "z", "status": "approved"}],
+            "note": {"value": "n"},
+        }
+
+        result = WordDecoder.decode(data)
+
+        self.assertEqual(WordMeaning, type(result.meanings[0]))
+        self.assertEqual(WordNote, type(result.meanings[0].note))
+        self.assertEqual(Word, type(result.meanings[0].note.words[0]))
+        self.assertIs(WordStatus.APPROVED, result.alternatives[0].status)
+        self.assertEqual("n", result.note.value)
+
+    def test_decode_result_is_frozen(self):
+        result = WordDecoder.decode({"name": "x"})
+
+        with self.assertRaises(AttributeError):
+            result.name = "y"  # type: ignore
+
+    def test_decode_invalid_raises_same_error_as_dacite(self):
+        for data in self.INVALID:
+            with self.subTest(data=data):
+                with self.assertRaises(Exception) as expected:
+                    WordDecoder.decode(data, DecoderEngine.DACITE)
+
+                with self.assertRaises(Exception) as result:
+                    WordDecoder.decode(data, DecoderEngine.FAST)
+
+                self.assertEqual(type(expected.exception), type(result.exception))
+                self.assertEqual(str(expected.exception), str(result.exception))
+
+    def _make_data(self) -> dict:
+        # Build the strings at runtime, so that they are not constants of this module.
+        return {
+            "name": "".join(["ab", "aft"]),
+            "source": "".join(["STE100", ":9"]),
+            "spellings": ["".join(["ab", "aft"])],
+            "meanings": [{"value": "".join(["to the ", "rear"])}],
+            "note": {"value": "".join(["See ", "AFT"])},
+        }
+
+    def test_decode_interns_repeated_strings(self):
+        first = WordDecoder.decode(self._make_data())
+
+        result = WordDecoder.decode(self._make_data())
+
+        self.assertIs(first.name, result.name)
+        self.assertIs(first.source, result.source)
+        self.assertIs(first.spellings[0], result.spellings[0])
+        self.assertIs(first.meanings[0].value, result.meanings[0].value)
+        self.assertIs(first.note.value, result.note.value)  # type: ignore
+
+    def test_decode_without_intern(self):
+        first = WordDecoder.decode(self._make_data(), intern=False)
+
+        result = WordDecoder.decode(self._make_data(), intern=False)
+
+        self.assertEqual(first, result)
+        self.assertIsNot(first.name, result.name)
+        self.assertIsNot(first.source, result.source)
+
+    def test_decode_summary_interns_name_and_source(self):
+        first = WordDecoder.decode_summary(self._make_data())
+
+        result = WordDecoder.decode_summary(self._make_data())
+
+        self.assertIs(first["name"], result["name"])
+        self.assertIs(first["source"], result["source"])
+
+
+if __name__ == "__main__":
+    unittest.main()